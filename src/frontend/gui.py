@@ -23,6 +23,9 @@ def launch_gui():
             paging_algorithm=config.get("paging_algorithm", "FIFO"),
             tlb_enabled=config.get("tlb_enabled", True),
             page_table_type=config.get("page_table_type", "SingleLevel"),
+            page_size_mb=config.get("page_size_mb", 4),
+            huge_page_mb=config.get("huge_page_mb", 64),
+            huge_page_policy=config.get("huge_page_policy", "none"),
             storage_type=config.get("storage_type", "HDD"),
         )
         w = MainWindow(engine)
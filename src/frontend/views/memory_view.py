@@ -168,7 +168,7 @@ class MemoryView(QWidget):
             
             label = self.unit_labels.get(i)
             if label:
-                used = sum(b.size for b in unit.manager.blocks if not b.free)
+                used = unit.manager.used_mb()
                 pm = unit.paged_manager
                 label.setText(
                     f"Usado: {used}MB | Frag: {unit.manager.fragmentation_ratio()*100:.1f}% | "
@@ -222,7 +222,7 @@ class ProcessesView(QWidget):
         self.process_queue_list.clear()
         scheduler = self.engine.schedulers[0]  # Asumimos CPU 0 para la cola principal
 
-        new_processes = [p for p in self.engine.processes.values() if p.state == "NEW"]
+        new_processes = self.engine.processes.in_state("NEW")
         self.process_queue_list.addItem("=== NUEVO (NEW) ===")
         if new_processes:
             for p in new_processes:
@@ -270,7 +270,7 @@ class ProcessesView(QWidget):
         # Waiting
         self.process_queue_list.addItem("")
         self.process_queue_list.addItem("=== WAITING QUEUE ===")
-        waiting_processes = [p for p in self.engine.active_processes() if p.state == "WAITING"]
+        waiting_processes = self.engine.processes.in_state("WAITING", ordered=True)
         if waiting_processes:
             for p in waiting_processes:
                 self.process_queue_list.addItem(f"  {p.name} (PID {p.pid}) - Restante: {p.remaining_ticks}")
@@ -280,7 +280,7 @@ class ProcessesView(QWidget):
         # Terminated
         self.process_queue_list.addItem("")
         self.process_queue_list.addItem("=== TERMINADO (TERMINATED) ===")
-        terminated_processes = [p for p in self.engine.processes.values() if p.state == "TERMINATED"]
+        terminated_processes = self.engine.processes.in_state("TERMINATED", ordered=True)
         if terminated_processes:
             for p in terminated_processes:
                 finish_info = f" - Finalizado en tick {p.finish_tick}" if p.finish_tick else ""
@@ -289,9 +289,8 @@ class ProcessesView(QWidget):
             self.process_queue_list.addItem("  (vacía)")
 
     def _refresh_process_table(self):
-        # Explicitly filter active processes again to be sure
-        processes = [p for p in self.engine.processes.values() if p.state != "TERMINATED"]
-        processes.sort(key=lambda p: p.pid)
+        # Activos (no terminados), ya en orden de pid
+        processes = self.engine.active_processes()
         self.process_table.setRowCount(len(processes))
         for r, p in enumerate(processes):
             cpu_str = str(p.cpu_id) if p.cpu_id is not None else "-"
@@ -56,20 +56,36 @@ class ConfigDialog(QDialog):
 
         # Gestión de Memoria
         self.alloc_alg_combo = QComboBox()
-        self.alloc_alg_combo.addItems(["first", "best", "worst"])
+        self.alloc_alg_combo.addItems(["first", "best", "worst", "buddy", "slab"])
         self.alloc_alg_combo.setCurrentText("first")
         sw_layout.addRow("Algoritmo de Asignación:", self.alloc_alg_combo)
 
         self.page_alg_combo = QComboBox()
-        self.page_alg_combo.addItems(["FIFO", "LRU", "Optimal"])
+        self.page_alg_combo.addItems(["FIFO", "LRU", "Optimal", "Clock", "SecondChance", "NRU", "LFU", "ARC", "WSClock"])
         self.page_alg_combo.setCurrentText("FIFO")
         sw_layout.addRow("Algoritmo de Paginación:", self.page_alg_combo)
         
         self.pt_type_combo = QComboBox()
-        self.pt_type_combo.addItems(["SingleLevel", "TwoLevel", "Hashed", "Inverted"])
+        self.pt_type_combo.addItems(["SingleLevel", "TwoLevel", "ThreeLevel", "FourLevel", "Hashed", "Inverted"])
         self.pt_type_combo.setCurrentText("SingleLevel")
         sw_layout.addRow("Tipo Tabla de Páginas:", self.pt_type_combo)
 
+        # Tamaño de página base y páginas grandes para procesos grandes
+        self.page_size_combo = QComboBox()
+        self.page_size_combo.addItems(["1", "2", "4", "8"])
+        self.page_size_combo.setCurrentText("4")
+        sw_layout.addRow("Tamaño de Página (MB):", self.page_size_combo)
+
+        self.huge_policy_combo = QComboBox()
+        self.huge_policy_combo.addItems(["none", "large"])
+        self.huge_policy_combo.setCurrentText("none")
+        sw_layout.addRow("Páginas Grandes:", self.huge_policy_combo)
+
+        self.huge_size_combo = QComboBox()
+        self.huge_size_combo.addItems(["16", "32", "64", "128"])
+        self.huge_size_combo.setCurrentText("64")
+        sw_layout.addRow("Tamaño Página Grande (MB):", self.huge_size_combo)
+
         main_layout.addWidget(sw_group)
         
         btn_box = QHBoxLayout()
@@ -94,5 +110,8 @@ class ConfigDialog(QDialog):
             "paging_algorithm": self.page_alg_combo.currentText(),
             "tlb_enabled": self.tlb_check.isChecked(),
             "page_table_type": self.pt_type_combo.currentText(),
+            "page_size_mb": int(self.page_size_combo.currentText()),
+            "huge_page_policy": self.huge_policy_combo.currentText(),
+            "huge_page_mb": int(self.huge_size_combo.currentText()),
             "storage_type": self.storage_type_combo.currentText(),
         }
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from .models import add_slots
+
 if TYPE_CHECKING:  # pragma: no cover - referenced for type checking only
     from ..simulation.engine import SimulationEngine
     from .models import Process
@@ -22,6 +24,7 @@ class InterruptType(str, Enum):
     PAGE_FAULT = "PAGE_FAULT"
 
 
+@add_slots
 @dataclass
 class Interrupt:
     """Representa una interrupción generada durante la simulación."""
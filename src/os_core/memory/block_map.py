@@ -0,0 +1,217 @@
+"""
+Mapa de bloques de memoria contigua ordenado por dirección.
+
+Reemplaza la lista `MemoryManager.blocks` como estructura de trabajo. Cada
+bloque se indexa por su dirección de inicio y se enlaza con sus vecinos
+(anterior / siguiente) mediante diccionarios, más un índice pid -> bloques:
+
+- dividir un hueco al asignar, liberar un bloque fusionándolo con sus vecinos
+  libres y encontrar los bloques de un pid cuestan O(1), sin `list.insert` ni
+  reconstruir la lista en cada liberación;
+- el recorrido en orden de dirección (`iter`, `snapshot`) sigue disponible
+  para la GUI (`MemoryBar`) y las métricas.
+
+Los bloques libres de tamaño cero no se guardan: no cambian ninguna métrica y
+compartirían la dirección de inicio con su vecino.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ..models import MemoryBlock
+
+
+class BlockMap:
+    """Bloques contiguos enlazados en orden de dirección, indexados por inicio y por pid."""
+
+    def __init__(self, blocks: Iterable[MemoryBlock] = ()) -> None:
+        self._blocks: Dict[int, MemoryBlock] = {}
+        self._next: Dict[int, Optional[int]] = {}
+        self._prev: Dict[int, Optional[int]] = {}
+        self._by_pid: Dict[int, Dict[int, MemoryBlock]] = {}
+        self._first: Optional[int] = None
+        self.rebuild(blocks)
+
+    def rebuild(self, blocks: Iterable[MemoryBlock]) -> None:
+        """Reemplaza el contenido por `blocks` (ordenados por dirección y contiguos)."""
+        self._blocks.clear()
+        self._next.clear()
+        self._prev.clear()
+        self._by_pid.clear()
+        self._first = None
+        previous: Optional[int] = None
+        for block in blocks:
+            if block.free and block.size == 0:
+                continue
+            start = block.start
+            self._blocks[start] = block
+            self._prev[start] = previous
+            self._next[start] = None
+            if previous is None:
+                self._first = start
+            else:
+                self._next[previous] = start
+            previous = start
+            if not block.free:
+                self._by_pid.setdefault(block.process_pid, {})[start] = block
+
+    # --- Consultas -------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._blocks)
+
+    def __iter__(self) -> Iterator[MemoryBlock]:
+        blocks, links = self._blocks, self._next
+        start = self._first
+        while start is not None:
+            yield blocks[start]
+            start = links[start]
+
+    def snapshot(self) -> List[MemoryBlock]:
+        """Bloques en orden de dirección."""
+        return list(self)
+
+    def first(self) -> Optional[MemoryBlock]:
+        return None if self._first is None else self._blocks[self._first]
+
+    def at(self, start: int) -> MemoryBlock:
+        return self._blocks[start]
+
+    def next_of(self, block: MemoryBlock) -> Optional[MemoryBlock]:
+        start = self._next[block.start]
+        return None if start is None else self._blocks[start]
+
+    def prev_of(self, block: MemoryBlock) -> Optional[MemoryBlock]:
+        start = self._prev[block.start]
+        return None if start is None else self._blocks[start]
+
+    def owned_by(self, pid: int) -> List[MemoryBlock]:
+        """Bloques asignados a `pid`, en orden de dirección."""
+        owned = self._by_pid.get(pid)
+        if not owned:
+            return []
+        return [owned[start] for start in sorted(owned)]
+
+    # --- Modificación ----------------------------------------------------
+    def _replace(self, old: MemoryBlock, new: MemoryBlock) -> None:
+        # Mismo inicio, distinto fin o dueño: los enlaces no cambian
+        self._unown(old)
+        self._blocks[new.start] = new
+        self._own(new)
+
+    def _own(self, block: MemoryBlock) -> None:
+        if not block.free:
+            self._by_pid.setdefault(block.process_pid, {})[block.start] = block
+
+    def _unown(self, block: MemoryBlock) -> None:
+        if block.free:
+            return
+        owned = self._by_pid.get(block.process_pid)
+        if owned is not None:
+            owned.pop(block.start, None)
+            if not owned:
+                del self._by_pid[block.process_pid]
+
+    def _insert_after(self, left: MemoryBlock, block: MemoryBlock) -> None:
+        start, after = block.start, self._next[left.start]
+        self._blocks[start] = block
+        self._prev[start] = left.start
+        self._next[start] = after
+        self._next[left.start] = start
+        if after is not None:
+            self._prev[after] = start
+        self._own(block)
+
+    def _unlink(self, block: MemoryBlock) -> None:
+        start = block.start
+        before, after = self._prev.pop(start), self._next.pop(start)
+        del self._blocks[start]
+        if before is None:
+            self._first = after
+        else:
+            self._next[before] = after
+        if after is not None:
+            self._prev[after] = before
+        self._unown(block)
+
+    def reassign(self, block: MemoryBlock, pid: Optional[int]) -> None:
+        """Cambia el dueño de un bloque asignado, sin dividirlo ni fusionarlo."""
+        self._unown(block)
+        block.process_pid = pid
+        self._own(block)
+
+    def split(self, block: MemoryBlock, size: int, pid: int) -> Tuple[MemoryBlock, Optional[MemoryBlock]]:
+        """Asigna los primeros `size` MB del bloque libre a `pid`.
+
+        Retorna (bloque asignado, resto libre o None si el ajuste es exacto).
+        """
+        if size >= block.size:
+            block.process_pid = pid
+            self._own(block)
+            return block, None
+        allocated = MemoryBlock(block.start, block.start + size, pid)
+        remainder = MemoryBlock(block.start + size, block.end, None)
+        self._replace(block, allocated)
+        self._insert_after(allocated, remainder)
+        return allocated, remainder
+
+    def free(self, block: MemoryBlock) -> Tuple[MemoryBlock, List[MemoryBlock]]:
+        """Libera el bloque y lo fusiona con sus vecinos libres.
+
+        Retorna (bloque libre resultante, vecinos libres absorbidos).
+        """
+        self._unown(block)
+        block.process_pid = None
+        absorbed: List[MemoryBlock] = []
+        merged = block
+        before = self.prev_of(block)
+        if before is not None and before.free:
+            absorbed.append(before)
+            merged = before
+        after = self.next_of(block)
+        if after is not None and after.free:
+            absorbed.append(after)
+        if not absorbed:
+            return block, absorbed
+        end = after.end if after is not None and after.free else block.end
+        if merged is not block:
+            self._unlink(block)
+        if after is not None and after.free:
+            self._unlink(after)
+        result = MemoryBlock(merged.start, end, None)
+        self._replace(merged, result)
+        return result, absorbed
+
+    def slide_down(self, block: MemoryBlock) -> Tuple[MemoryBlock, MemoryBlock]:
+        """Mueve el bloque al inicio del hueco libre que lo precede.
+
+        Retorna (bloque movido, hueco que queda detrás, ya fusionado con el
+        siguiente bloque libre si lo había).
+        """
+        hole = self.prev_of(block)
+        after = self.next_of(block)
+        end = after.end if after is not None and after.free else block.end
+        moved = MemoryBlock(hole.start, hole.start + block.size, block.process_pid)
+        self._unlink(block)
+        if after is not None and after.free:
+            self._unlink(after)
+        self._replace(hole, moved)
+        freed = MemoryBlock(moved.end, end, None)
+        self._insert_after(moved, freed)
+        return moved, freed
+
+    def move_boundary(self, left: MemoryBlock, boundary: int) -> Tuple[MemoryBlock, Optional[MemoryBlock]]:
+        """Mueve el límite entre `left` y su bloque siguiente a `boundary`.
+
+        Retorna los bloques nuevos (el derecho es None si queda vacío y libre).
+        """
+        right = self.next_of(left)
+        new_left = MemoryBlock(left.start, boundary, left.process_pid)
+        self._replace(left, new_left)
+        if right is None:
+            return new_left, None
+        self._unlink(right)
+        if right.free and right.end <= boundary:
+            return new_left, None
+        new_right = MemoryBlock(boundary, right.end, right.process_pid)
+        self._insert_after(new_left, new_right)
+        return new_left, new_right
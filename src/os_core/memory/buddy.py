@@ -0,0 +1,265 @@
+"""
+Asignador buddy binario para la memoria contigua.
+
+La memoria se divide en bloques de 2^k MB alineados a su tamaño. Una solicitud
+de `size` MB recibe un bloque de orden k = ceil(log2(size)): se toma el bloque
+libre más chico que alcance (el de menor dirección) y se parte por la mitad
+hasta llegar a k. Al liberar, el bloque se fusiona con su "buddy"
+(`dirección ^ 2^k`) mientras este esté libre y tenga el mismo orden. Partir y
+fusionar cuestan O(log N) y la memoria nunca se compacta.
+
+Si la capacidad no es potencia de dos, se cubre con bloques raíz de tamaños
+decrecientes (la descomposición binaria de la capacidad), que no se fusionan
+entre sí. La reserva del sistema (PID 0) ocupa exactamente [0, reservada) con
+bloques alineados; al crecer toma el rango siguiente solo si está libre.
+
+Fragmentación:
+- interna: MB asignados de más por redondear cada proceso a potencia de dos;
+- externa: memoria libre fuera de los bloques libres del mayor orden (todos
+  los empatados, igual que en `MemoryManager.fragmented_free_space`).
+`fragmentation_ratio()` suma ambas sobre la capacidad total.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from ..models import MemoryBlock, Process
+from .manager import AllocationResult
+
+SYSTEM_PID = 0
+
+
+def order_for(size: int) -> int:
+    """Menor k con 2^k >= size (mínimo 1 MB, orden 0)."""
+    return max(0, int(size) - 1).bit_length()
+
+
+def aligned_pieces(start: int, end: int) -> List[Tuple[int, int]]:
+    """Descompone [start, end) en bloques (dirección, orden) alineados a su tamaño."""
+    pieces: List[Tuple[int, int]] = []
+    while start < end:
+        order = (end - start).bit_length() - 1
+        if start:
+            # Alineación: el tamaño no puede superar la mayor potencia de dos que divide a start
+            order = min(order, (start & -start).bit_length() - 1)
+        pieces.append((start, order))
+        start += 1 << order
+    return pieces
+
+
+class BuddyMemoryManager:
+    """Gestor de memoria contigua con el sistema buddy (misma interfaz que MemoryManager)."""
+
+    def __init__(self, total_mb: int, algorithm_name: str = "buddy", system_reserved_mb: int = 0):
+        self.total_mb = total_mb
+        self.algorithm = algorithm_name
+        self.strategy = None
+        # Sin compactación: los buddies se fusionan al liberar
+        self.auto_compact = False
+        self.compact_threshold = 1.0
+        self.ticks_since_compact = 0
+        self.compact_interval = 50
+        self.allocated_processes: Dict[int, int] = {}  # pid -> size
+        self.compactions = 0
+        self.compacted_mb = 0
+        self.compaction_ticks = 0
+        self.splits = 0
+        self.merges = 0
+
+        self._roots: Dict[int, int] = dict(aligned_pieces(0, total_mb))  # dirección -> orden
+        self._max_order = max(self._roots.values(), default=0)
+        self._free: Dict[int, List[int]] = {}  # orden -> direcciones libres ordenadas
+        self._free_order: Dict[int, int] = {}  # dirección libre -> orden
+        # dirección asignada -> (orden, pid, MB solicitados)
+        self._allocated: Dict[int, Tuple[int, int, int]] = {}
+        self._by_pid: Dict[int, List[int]] = {}
+        self._free_mb = 0
+        self._requested_mb = 0
+        self._internal_mb = 0
+        for address, order in self._roots.items():
+            self._push_free(address, order)
+
+        self.system_reserved_mb = 0
+        reserved = max(0, min(system_reserved_mb, total_mb))
+        if reserved > 0:
+            self._claim_range(0, reserved)
+            self.system_reserved_mb = reserved
+
+    # --- Listas libres -----------------------------------------------------
+    def _push_free(self, address: int, order: int) -> None:
+        insort(self._free.setdefault(order, []), address)
+        self._free_order[address] = order
+        self._free_mb += 1 << order
+
+    def _pop_free(self, address: int) -> int:
+        order = self._free_order.pop(address)
+        addresses = self._free[order]
+        del addresses[bisect_left(addresses, address)]
+        if not addresses:
+            del self._free[order]
+        self._free_mb -= 1 << order
+        return order
+
+    def _mark_allocated(self, address: int, order: int, pid: int, requested: int) -> None:
+        self._allocated[address] = (order, pid, requested)
+        self._by_pid.setdefault(pid, []).append(address)
+        self._requested_mb += requested
+        self._internal_mb += (1 << order) - requested
+
+    # --- Partir y fusionar ---------------------------------------------------
+    def _split_down(self, address: int, order: int, target: int) -> None:
+        # Parte el bloque libre (ya retirado de las listas) hasta el orden `target`
+        while order > target:
+            order -= 1
+            self._push_free(address + (1 << order), order)
+            self.splits += 1
+
+    def _coalesce(self, address: int, order: int) -> None:
+        while self._roots.get(address) != order:
+            buddy = address ^ (1 << order)
+            if self._free_order.get(buddy) != order:
+                break
+            self._pop_free(buddy)
+            address = min(address, buddy)
+            order += 1
+            self.merges += 1
+        self._push_free(address, order)
+
+    def _containing_free(self, address: int, order: int) -> Optional[Tuple[int, int]]:
+        # Bloque libre (dirección, orden >= order) que contiene a `address`
+        for k in range(order, self._max_order + 1):
+            base = address & ~((1 << k) - 1)
+            if self._free_order.get(base) == k:
+                return base, k
+        return None
+
+    def _claim_range(self, start: int, end: int) -> bool:
+        """Asigna exactamente [start, end) al sistema si todo el rango está libre."""
+        pieces = aligned_pieces(start, end)
+        if any(self._containing_free(a, k) is None for a, k in pieces):
+            return False
+        for address, order in pieces:
+            base, k = self._containing_free(address, order)
+            self._pop_free(base)
+            while k > order:
+                k -= 1
+                half = 1 << k
+                # Conservar la mitad que contiene `address` y liberar la otra
+                if address >= base + half:
+                    self._push_free(base, k)
+                    base += half
+                else:
+                    self._push_free(base + half, k)
+                self.splits += 1
+            self._mark_allocated(address, order, SYSTEM_PID, 1 << order)
+        return True
+
+    # --- Interfaz de MemoryManager ------------------------------------------
+    def allocate(self, process: Process) -> AllocationResult:
+        size = process.size_mb
+        target = order_for(size)
+        orders = [k for k in self._free if k >= target]
+        if size > self.total_mb or not orders:
+            return self._result(False)
+        order = min(orders)
+        address = self._free[order][0]
+        self._pop_free(address)
+        self._split_down(address, order, target)
+        self._mark_allocated(address, target, process.pid, size)
+        self.allocated_processes[process.pid] = size
+        process.memory_usage_mb = size
+        return self._result(True)
+
+    def _result(self, success: bool) -> AllocationResult:
+        return AllocationResult(
+            success, self.fragmentation_ratio(), self.efficiency(), self.algorithm,
+            internal_fragmentation=self.internal_fragmentation_ratio(),
+        )
+
+    def release(self, process: Process):
+        for address in self._by_pid.pop(process.pid, []):
+            order, _, requested = self._allocated.pop(address)
+            self._requested_mb -= requested
+            self._internal_mb -= (1 << order) - requested
+            self._coalesce(address, order)
+        self.allocated_processes.pop(process.pid, None)
+        process.memory_usage_mb = 0
+
+    def merge_free(self):
+        """Sin efecto: los buddies se fusionan al liberar."""
+
+    def compact(self):
+        """Sin efecto: el sistema buddy no reubica procesos."""
+        self.ticks_since_compact = 0
+
+    def compaction_pressure(self) -> float:
+        return 0.0
+
+    def compaction_in_progress(self) -> bool:
+        return False
+
+    def take_relocations(self) -> List[Tuple[int, int]]:
+        return []
+
+    def check_and_compact(self):
+        return False
+
+    def tick(self):
+        pass
+
+    def expand_system_reserved(self, required_mb: int):
+        # Expansión monótona; solo si el rango siguiente a la reserva está libre
+        required_mb = max(0, min(required_mb, self.total_mb))
+        if required_mb <= self.system_reserved_mb:
+            return False
+        if not self._claim_range(self.system_reserved_mb, required_mb):
+            return False
+        self.system_reserved_mb = required_mb
+        return True
+
+    # --- Fragmentación y eficiencia ------------------------------------------
+    def used_mb(self) -> int:
+        return self.total_mb - self._free_mb
+
+    def largest_free_mb(self) -> int:
+        return 1 << max(self._free) if self._free else 0
+
+    def can_fit(self, size: int) -> bool:
+        return size <= self.total_mb and self.largest_free_mb() >= 1 << order_for(size)
+
+    def fragmented_free_space(self) -> int:
+        """Fragmentación externa: memoria libre fuera de los bloques libres del mayor orden."""
+        if not self._free:
+            return 0
+        order = max(self._free)
+        return self._free_mb - (1 << order) * len(self._free[order])
+
+    def internal_fragmentation(self) -> int:
+        """MB asignados por encima de lo solicitado (redondeo a potencia de dos)."""
+        return self._internal_mb
+
+    def external_fragmentation_ratio(self) -> float:
+        return self.fragmented_free_space() / self.total_mb
+
+    def internal_fragmentation_ratio(self) -> float:
+        return self._internal_mb / self.total_mb
+
+    def fragmentation_ratio(self) -> float:
+        return (self._internal_mb + self.fragmented_free_space()) / self.total_mb
+
+    def efficiency(self) -> float:
+        # Solo cuenta lo solicitado: el redondeo interno no es memoria útil
+        return (self._requested_mb / self.total_mb) * (1 - self.fragmentation_ratio())
+
+    # --- Vistas --------------------------------------------------------------
+    @property
+    def blocks(self) -> List[MemoryBlock]:
+        """Bloques buddy (asignados y libres) en orden de dirección."""
+        out = [MemoryBlock(a, a + (1 << k), pid) for a, (k, pid, _) in self._allocated.items()]
+        out.extend(MemoryBlock(a, a + (1 << k), None) for a, k in self._free_order.items())
+        out.sort(key=lambda b: b.start)
+        return out
+
+    def snapshot_blocks(self) -> List[MemoryBlock]:
+        return self.blocks
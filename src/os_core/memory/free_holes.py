@@ -0,0 +1,141 @@
+"""
+Índice de huecos libres para la asignación contigua.
+
+`MemoryManager` registra aquí cada hueco libre (inicio, tamaño) para que las
+estrategias no recorran toda la lista de bloques en cada asignación:
+
+- Best / Worst fit: lista ordenada de `(tamaño, inicio)` (bisect). El menor
+  hueco suficiente y el mayor hueco se encuentran en O(log n); ante empates
+  gana el de menor dirección, igual que `min`/`max` sobre la lista de bloques.
+- First fit: clases de tamaño (potencias de dos), cada una con los inicios de
+  sus huecos en orden de dirección. Cualquier hueco de una clase superior a la
+  del pedido alcanza, así que basta su primer inicio; solo la clase del pedido
+  se recorre, en orden de dirección, hasta el primer hueco suficiente.
+
+Además lleva el total de MB libres: memoria libre, mayor hueco y
+fragmentación externa se consultan sin recorrer los bloques.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ..models import MemoryBlock
+
+
+def size_class(size: int) -> int:
+    """Clase del tamaño: los huecos de la clase k miden entre 2^(k-1) y 2^k - 1."""
+    return size.bit_length()
+
+
+class FreeHoleIndex:
+    """Huecos libres indexados por tamaño y por clase de tamaño."""
+
+    def __init__(self, holes: Iterable[Tuple[int, int]] = ()) -> None:
+        self._by_size: List[Tuple[int, int]] = []  # (tamaño, inicio) ordenado
+        self._classes: Dict[int, List[int]] = {}  # clase -> inicios ordenados
+        self._sizes: Dict[int, int] = {}  # inicio -> tamaño
+        self._free_mb = 0
+        for start, size in holes:
+            self.add(start, size)
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def __contains__(self, start: int) -> bool:
+        return start in self._sizes
+
+    def size_of(self, start: int) -> Optional[int]:
+        return self._sizes.get(start)
+
+    # --- Mantenimiento ---------------------------------------------------
+    def add(self, start: int, size: int) -> None:
+        if start in self._sizes:
+            self.remove(start)
+        self._sizes[start] = size
+        self._free_mb += size
+        insort(self._by_size, (size, start))
+        insort(self._classes.setdefault(size_class(size), []), start)
+
+    def remove(self, start: int) -> None:
+        size = self._sizes.pop(start)
+        self._free_mb -= size
+        entries = self._by_size
+        del entries[bisect_left(entries, (size, start))]
+        cls = size_class(size)
+        starts = self._classes[cls]
+        del starts[bisect_left(starts, start)]
+        if not starts:
+            del self._classes[cls]
+
+    def clear(self) -> None:
+        self._by_size.clear()
+        self._classes.clear()
+        self._sizes.clear()
+        self._free_mb = 0
+
+    def rebuild(self, blocks: Iterable[MemoryBlock]) -> None:
+        """Reconstruye el índice a partir de una lista de bloques."""
+        self.clear()
+        for block in blocks:
+            if block.free:
+                self.add(block.start, block.size)
+
+    # --- Consultas -------------------------------------------------------
+    def free_mb(self) -> int:
+        """MB libres en total."""
+        return self._free_mb
+
+    def largest(self) -> int:
+        """Tamaño del mayor hueco (0 si no hay)."""
+        entries = self._by_size
+        return entries[-1][0] if entries else 0
+
+    def fragmented_mb(self) -> int:
+        """MB libres fuera de los huecos del mayor tamaño."""
+        entries = self._by_size
+        if not entries:
+            return 0
+        largest = entries[-1][0]
+        ties = len(entries) - bisect_left(entries, (largest, -1))
+        return self._free_mb - largest * ties
+
+    def best_fit(self, size: int) -> Optional[int]:
+        """Inicio del menor hueco con tamaño >= size (el de menor dirección ante empates)."""
+        entries = self._by_size
+        i = bisect_left(entries, (size, -1))
+        return entries[i][1] if i < len(entries) else None
+
+    def worst_fit(self, size: int) -> Optional[int]:
+        """Inicio del mayor hueco si alcanza (el de menor dirección ante empates)."""
+        entries = self._by_size
+        if not entries or entries[-1][0] < size:
+            return None
+        return entries[bisect_left(entries, (entries[-1][0], -1))][1]
+
+    def first_fit(self, size: int) -> Optional[int]:
+        """Inicio del hueco de menor dirección con tamaño >= size."""
+        wanted = size_class(max(0, size))
+        best: Optional[int] = None
+        for cls, starts in self._classes.items():
+            if cls > wanted and (best is None or starts[0] < best):
+                best = starts[0]
+        starts = self._classes.get(wanted)
+        if starts:
+            sizes = self._sizes
+            for start in starts:
+                if best is not None and start >= best:
+                    break
+                if sizes[start] >= size:
+                    best = start
+                    break
+        return best
+
+    def lowest(self) -> Optional[int]:
+        """Inicio del hueco de menor dirección."""
+        heads = [starts[0] for starts in self._classes.values()]
+        return min(heads) if heads else None
+
+    def holes(self) -> List[MemoryBlock]:
+        """Huecos como bloques libres, en orden de dirección."""
+        return [MemoryBlock(start, start + self._sizes[start], None) for start in sorted(self._sizes)]
@@ -1,71 +1,114 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Deque, Union
-from collections import deque
+from typing import List, Optional, Dict, Set, Tuple, Union
+import heapq
+import math
 from ..models import MemoryBlock, Process, Page, PageTableEntry
+from .block_map import BlockMap
+from .free_holes import FreeHoleIndex
 from .strategies import AllocationStrategy
 
 class AllocationResult:
-    def __init__(self, success: bool, fragmentation: float, efficiency: float, algorithm: str):
+    def __init__(self, success: bool, fragmentation: float, efficiency: float, algorithm: str, internal_fragmentation: float = 0.0, cache_hit: Optional[bool] = None):
         self.success = success
         self.fragmentation = fragmentation
         self.efficiency = efficiency
         self.algorithm = algorithm
+        # Fracción de memoria perdida dentro de bloques asignados (buddy, slab)
+        self.internal_fragmentation = internal_fragmentation
+        # Slab: True si se reutilizó un bloque de la caché de su clase (None = sin caché)
+        self.cache_hit = cache_hit
+
+# "full": compact() reubica todo de una vez; "incremental": una pasada de
+# compactación mueve a lo sumo `compact_step_mb` MB / `compact_step_blocks`
+# bloques por tick hacia el inicio de la memoria
+COMPACTION_MODES = ("full", "incremental")
+
 
 class MemoryManager:
-    def __init__(self, total_mb: int, algorithm_name: str, strategy: AllocationStrategy, auto_compact: bool = True, compact_threshold: float = 0.3, system_reserved_mb: int = 0):
+    def __init__(self, total_mb: int, algorithm_name: str, strategy: AllocationStrategy, auto_compact: bool = True, compact_threshold: float = 0.3, system_reserved_mb: int = 0, compaction_mode: str = "incremental"):
+        if compaction_mode not in COMPACTION_MODES:
+            raise ValueError(f"Modo de compactación desconocido: {compaction_mode!r} (use {', '.join(COMPACTION_MODES)})")
         self.total_mb = total_mb
         self.algorithm = algorithm_name
         self.strategy = strategy
         self.system_reserved_mb = max(0, min(system_reserved_mb, total_mb))
+        # Bloques en orden de dirección (ver block_map.py) y huecos libres por
+        # tamaño: las estrategias eligen sin recorrer los bloques
+        self.block_map = BlockMap()
+        self.free_holes = FreeHoleIndex()
         # Crear bloque reservado del sistema si aplica
         if self.system_reserved_mb > 0:
             sys_block = MemoryBlock(0, self.system_reserved_mb, 0)  # PID 0 = SO
             remainder = MemoryBlock(self.system_reserved_mb, total_mb, None)
-            self.blocks: List[MemoryBlock] = [sys_block, remainder]
+            self.blocks = [sys_block, remainder]
         else:
-            self.blocks: List[MemoryBlock] = [MemoryBlock(0, total_mb, None)]
+            self.blocks = [MemoryBlock(0, total_mb, None)]
         self.allocated_processes: Dict[int, int] = {}  # pid -> size
         self.auto_compact = auto_compact
         self.compact_threshold = compact_threshold
         self.ticks_since_compact = 0
         self.compact_interval = 50
+        # Costo acumulado de compactar: veces (solo las que movieron algún bloque)
+        # y MB de procesos reubicados
+        self.compactions = 0
+        self.compacted_mb = 0
+        self.compaction_mode = compaction_mode
+        self.compact_step_mb = 64
+        self.compact_step_blocks = 4
+        self.copy_mb_per_tick = 32
+        self._compacting = False
+        self._pass_counted = False  # la pasada incremental en curso ya movió un bloque
+        # Costo simulado de copiar bloques (ticks) y reubicaciones pendientes de
+        # cobrar a sus procesos: (pid, ticks); el motor las retira con take_relocations()
+        self.compaction_ticks = 0
+        self.relocations: List[Tuple[int, int]] = []
+
+    @property
+    def blocks(self) -> List[MemoryBlock]:
+        """Bloques en orden de dirección (copia)."""
+        return self.block_map.snapshot()
+
+    @blocks.setter
+    def blocks(self, blocks: List[MemoryBlock]) -> None:
+        self.block_map.rebuild(blocks)
+        self.free_holes.rebuild(self.block_map)
 
     def allocate(self, process: Process) -> AllocationResult:
         size = process.size_mb
-        candidate_index = self.strategy.find_block(self.blocks, size)
-        if candidate_index is None:
+        start = self.strategy.find_hole(self.free_holes, size)
+        if start is None:
             return AllocationResult(False, self.fragmentation_ratio(), self.efficiency(), self.algorithm)
-        block = self.blocks[candidate_index]
-        if block.size == size:
-            block.process_pid = process.pid
-        else:
-            new_block = MemoryBlock(block.start, block.start + size, process.pid)
-            remainder = MemoryBlock(block.start + size, block.end, None)
-            self.blocks[candidate_index] = new_block
-            self.blocks.insert(candidate_index + 1, remainder)
+        self.free_holes.remove(start)
+        _, remainder = self.block_map.split(self.block_map.at(start), size, process.pid)
+        if remainder is not None:
+            self.free_holes.add(remainder.start, remainder.size)
         self.allocated_processes[process.pid] = size
         process.memory_usage_mb = size
         return AllocationResult(True, self.fragmentation_ratio(), self.efficiency(), self.algorithm)
 
     def release(self, process: Process):
         # Allow release even if not in allocated_processes map (safety sweep)
-        blocks_cleared = 0
-        for b in self.blocks:
-            if b.process_pid == process.pid:
-                b.process_pid = None
-                blocks_cleared += 1
+        for block in self.block_map.owned_by(process.pid):
+            self._free_block(block)
         
         if process.pid in self.allocated_processes:
             del self.allocated_processes[process.pid]
             
         process.memory_usage_mb = 0
-        self.merge_free()
         if self.auto_compact:
             self.check_and_compact()
 
+    def _free_block(self, block: MemoryBlock) -> None:
+        # Cada bloque se fusiona al liberarse con sus vecinos libres
+        merged, absorbed = self.block_map.free(block)
+        for neighbour in absorbed:
+            self.free_holes.remove(neighbour.start)
+        self.free_holes.add(merged.start, merged.size)
+
     def merge_free(self):
+        # `release` ya fusiona los vecinos libres; esto normaliza el mapa completo
         merged: List[MemoryBlock] = []
-        for block in self.blocks:
+        for block in self.block_map:
             if not merged:
                 merged.append(block)
                 continue
@@ -76,27 +119,51 @@ class MemoryManager:
                 merged.append(block)
         self.blocks = merged
 
+    # Totales del índice de huecos: sin recorrer los bloques
+    def used_mb(self) -> int:
+        return self.total_mb - self.free_holes.free_mb()
+
+    def largest_free_mb(self) -> int:
+        return self.free_holes.largest()
+
+    def can_fit(self, size: int) -> bool:
+        """True si allocate() encontraría hueco para `size` MB."""
+        return self.free_holes.largest() >= size
+
     def fragmented_free_space(self) -> int:
-        free_blocks = [b.size for b in self.blocks if b.free]
-        if not free_blocks:
-            return 0
-        largest = max(free_blocks)
-        return sum(s for s in free_blocks if s != largest)
+        """Memoria libre fuera de los huecos de mayor tamaño."""
+        return self.free_holes.fragmented_mb()
 
     def fragmentation_ratio(self) -> float:
         frag = self.fragmented_free_space()
         return frag / self.total_mb
 
     def efficiency(self) -> float:
-        used = sum(b.size for b in self.blocks if not b.free)
+        used = self.used_mb()
         fragmentation_penalty = self.fragmentation_ratio()
         return (used / self.total_mb) * (1 - fragmentation_penalty)
 
     def snapshot_blocks(self) -> List[MemoryBlock]:
-        return list(self.blocks)
+        return self.block_map.snapshot()
+
+    def _begin_compaction(self) -> None:
+        """Se llama antes de compactar (slab vacía aquí sus cachés)."""
+
+    def _record_relocation(self, pid: int, size: int) -> None:
+        ticks = math.ceil(size / self.copy_mb_per_tick)
+        self.compacted_mb += size
+        self.compaction_ticks += ticks
+        self.relocations.append((pid, ticks))
+
+    def take_relocations(self) -> List[Tuple[int, int]]:
+        """Retira las reubicaciones (pid, ticks de copia) aún no cobradas."""
+        moved, self.relocations = self.relocations, []
+        return moved
 
     def compact(self):
-        allocated_blocks = [b for b in self.blocks if not b.free]
+        self._begin_compaction()
+        self._compacting = False
+        allocated_blocks = [b for b in self.block_map if not b.free]
         if not allocated_blocks:
             # Preservar bloque del sistema si existe
             if self.system_reserved_mb > 0:
@@ -108,6 +175,7 @@ class MemoryManager:
             return
         new_blocks = []
         current_pos = 0
+        moved = False
         # Conservar bloque del sistema al inicio
         if self.system_reserved_mb > 0:
             new_blocks.append(MemoryBlock(0, self.system_reserved_mb, 0))
@@ -116,6 +184,9 @@ class MemoryManager:
             if block.process_pid == 0:  # Saltar bloque sistema ya añadido
                 continue
             size = block.size
+            if block.start != current_pos:
+                self._record_relocation(block.process_pid, size)
+                moved = True
             new_b = MemoryBlock(current_pos, current_pos + size, block.process_pid)
             new_blocks.append(new_b)
             current_pos += size
@@ -123,9 +194,68 @@ class MemoryManager:
             new_blocks.append(MemoryBlock(current_pos, self.total_mb, None))
         self.blocks = new_blocks
         self.ticks_since_compact = 0
+        if moved:
+            self.compactions += 1
+
+    # --- Compactación incremental ------------------------------------------
+    def compaction_in_progress(self) -> bool:
+        return self._compacting
+
+    def start_compaction(self) -> None:
+        """Inicia una pasada incremental; el trabajo se hace en compact_step()."""
+        if self._compacting:
+            return
+        self._begin_compaction()
+        self._compacting = True
+        self._pass_counted = False
+        self.ticks_since_compact = 0
+
+    def compact_step(self) -> int:
+        """Avanza la pasada: desliza bloques asignados sobre el hueco más bajo.
+
+        Mueve bloques hasta agotar el presupuesto del tick (siempre al menos
+        uno). La pasada termina cuando queda un solo hueco libre o ningún hueco
+        va seguido de un bloque asignado. Retorna los MB movidos.
+        """
+        if not self._compacting:
+            return 0
+        moved_mb = moved_blocks = 0
+        done = len(self.free_holes) <= 1
+        while not done and moved_blocks < self.compact_step_blocks:
+            start = self.free_holes.lowest()
+            hole = self.block_map.at(start) if start is not None else None
+            block = self.block_map.next_of(hole) if hole is not None else None
+            if block is None:
+                done = True
+                break
+            if moved_blocks and moved_mb + block.size > self.compact_step_mb:
+                break
+            after = self.block_map.next_of(block)
+            self.free_holes.remove(start)
+            if after is not None and after.free:
+                self.free_holes.remove(after.start)
+            _, freed = self.block_map.slide_down(block)
+            self.free_holes.add(freed.start, freed.size)
+            self._record_relocation(block.process_pid, block.size)
+            moved_mb += block.size
+            moved_blocks += 1
+        if moved_blocks and not self._pass_counted:
+            # La pasada cuenta como compactación recién cuando mueve su primer bloque
+            self.compactions += 1
+            self._pass_counted = True
+        if done:
+            self._compacting = False
+            self.ticks_since_compact = 0
+        return moved_mb
+
+    def compaction_pressure(self) -> float:
+        """Fragmentación que decide la compactación automática (la externa)."""
+        return self.fragmentation_ratio()
 
     def check_and_compact(self):
-        frag_ratio = self.fragmentation_ratio()
+        if self._compacting:
+            return False
+        frag_ratio = self.compaction_pressure()
         self.ticks_since_compact += 1
         should_compact = False
         if frag_ratio >= self.compact_threshold:
@@ -133,13 +263,31 @@ class MemoryManager:
         elif self.ticks_since_compact >= self.compact_interval and frag_ratio > 0.1:
             should_compact = True
         if should_compact:
-            self.compact()
+            if self.compaction_mode == "incremental":
+                # Fuera de la ruta de asignación/liberación: solo se inicia la pasada
+                self.start_compaction()
+            else:
+                self.compact()
             return True
         return False
 
     def tick(self):
         if self.auto_compact:
             self.check_and_compact()
+        if self._compacting:
+            self.compact_step()
+
+    def _grow_system_block(self, growth: int) -> bool:
+        # Extiende el bloque del sistema sobre el hueco libre que lo sigue
+        sys_block = self.block_map.first()
+        following = self.block_map.next_of(sys_block) if sys_block is not None else None
+        if following is None or not following.free or sys_block.end + growth > following.end:
+            return False
+        self.free_holes.remove(following.start)
+        _, remainder = self.block_map.move_boundary(sys_block, sys_block.end + growth)
+        if remainder is not None:
+            self.free_holes.add(remainder.start, remainder.size)
+        return True
 
     # Expansión monótona del bloque reservado del sistema (nunca reduce)
     def expand_system_reserved(self, required_mb: int):
@@ -147,28 +295,25 @@ class MemoryManager:
         if required_mb <= self.system_reserved_mb:
             return False
         # Buscar bloque sistema al inicio
-        if not self.blocks or self.blocks[0].process_pid != 0:
+        first = self.block_map.first()
+        if first is None or first.process_pid != 0:
             return False
-        sys_block = self.blocks[0]
         growth = required_mb - self.system_reserved_mb
         # Verificar espacio libre inmediato
-        if len(self.blocks) > 1 and self.blocks[1].free and (sys_block.end + growth) <= self.blocks[1].end:
-            # Ajustar sistema y bloque libre restante
-            new_sys_end = sys_block.end + growth
-            remainder_end = self.blocks[1].end
-            self.blocks[0] = MemoryBlock(0, new_sys_end, 0)
-            self.blocks[1] = MemoryBlock(new_sys_end, remainder_end, None)
+        if self._grow_system_block(growth):
             self.system_reserved_mb = required_mb
             return True
         # Si no hay espacio contiguo suficiente intentar compactar y reintentar
+        if self.compaction_mode == "incremental":
+            # La pasada avanza en los próximos ticks; se reintenta en el siguiente
+            if self.compaction_pressure() > 0:
+                self.start_compaction()
+            return False
         self.compact()
-        if self.blocks and self.blocks[0].process_pid == 0 and self.blocks[0].end == self.system_reserved_mb:
+        first = self.block_map.first()
+        if first is not None and first.process_pid == 0 and first.end == self.system_reserved_mb:
             # Después de compactar, intentar de nuevo
-            if len(self.blocks) > 1 and self.blocks[1].free and (self.blocks[0].end + growth) <= self.blocks[1].end:
-                new_sys_end = self.blocks[0].end + growth
-                remainder_end = self.blocks[1].end
-                self.blocks[0] = MemoryBlock(0, new_sys_end, 0)
-                self.blocks[1] = MemoryBlock(new_sys_end, remainder_end, None)
+            if self._grow_system_block(growth):
                 self.system_reserved_mb = required_mb
                 return True
         return False
@@ -180,54 +325,134 @@ class PagedAllocationResult:
         self.algorithm = algorithm
         self.pages_allocated = pages_allocated
 
+# Algoritmos de asignación contigua (nombres de SimulationEngine / ConfigDialog)
+ALLOCATION_ALGORITHMS = ("first", "best", "worst", "buddy", "slab")
+
+
+def create_memory_manager(algorithm: str, total_mb: int, system_reserved_mb: int = 0, size_classes: Optional[List[int]] = None, compaction_mode: str = "incremental"):
+    """Crea el gestor de memoria contigua para `algorithm` (desconocido = first).
+
+    `size_classes` solo aplica a "slab" (None = clases por defecto);
+    `compaction_mode` no aplica a "buddy", que no compacta.
+    """
+    # Importaciones diferidas: buddy y slab importan este módulo
+    if algorithm == "buddy":
+        from .buddy import BuddyMemoryManager
+        return BuddyMemoryManager(total_mb, algorithm, system_reserved_mb=system_reserved_mb)
+    if algorithm == "slab":
+        from .slab import SlabMemoryManager
+        return SlabMemoryManager(total_mb, algorithm, system_reserved_mb=system_reserved_mb, size_classes=size_classes, compaction_mode=compaction_mode)
+    from .strategies import BestFitStrategy, FirstFitStrategy, WorstFitStrategy
+    if algorithm == "best":
+        strategy: AllocationStrategy = BestFitStrategy()
+    elif algorithm == "worst":
+        strategy = WorstFitStrategy()
+    else:
+        strategy = FirstFitStrategy()
+    return MemoryManager(total_mb, algorithm, strategy, system_reserved_mb=system_reserved_mb, compaction_mode=compaction_mode)
+
 from .mmu import MMU, PageTable
+from .reference_trace import NextUseOracle, ReferenceTrace
+from .replacement import REPLACEMENT_POLICIES, ReplacementPolicy, create_replacement_policy
+
+# Políticas de páginas grandes: "none" (solo páginas base) o "large" (los
+# procesos de al menos una página grande mapean su parte alineada con ellas)
+HUGE_PAGE_POLICIES = ("none", "large")
+
 
 class PagedMemoryManager:
     def __init__(self, total_mb: int, page_size_mb: int = 4, replacement_alg: str = "FIFO", 
-                 tlb_enabled: bool = True, page_table_type: str = "SingleLevel"):
+                 tlb_enabled: bool = True, page_table_type: str = "SingleLevel", tlb_size: int = 16, tlb_ways: int = 0,
+                 num_cpus: int = 1, huge_page_mb: int = 0, huge_page_policy: str = "none",
+                 huge_pool_mb: Optional[int] = None):
+        if page_size_mb <= 0:
+            raise ValueError(f"Tamaño de página inválido: {page_size_mb!r}")
+        if huge_page_policy not in HUGE_PAGE_POLICIES:
+            raise ValueError(f"Política de páginas grandes desconocida: {huge_page_policy!r} (use {', '.join(HUGE_PAGE_POLICIES)})")
+        if huge_page_policy != "none" and (huge_page_mb <= page_size_mb or huge_page_mb % page_size_mb):
+            raise ValueError(f"La página grande ({huge_page_mb} MB) debe ser múltiplo mayor de la página base ({page_size_mb} MB)")
         self.total_mb = total_mb
         self.page_size_mb = page_size_mb
-        self.replacement_alg = replacement_alg
-        self.num_frames = total_mb // page_size_mb
+        # Un nombre desconocido (config vieja o con errores) usa FIFO, como el valor por defecto
+        self.replacement_alg = replacement_alg if replacement_alg in REPLACEMENT_POLICIES else "FIFO"
+        self.huge_page_policy = huge_page_policy
+        self.huge_page_mb = huge_page_mb if huge_page_policy != "none" else 0
+
+        # Páginas grandes (como hugetlbfs): un pool reservado de frames de
+        # `huge_page_mb` con su propia tabla y su propio TLB por CPU. Por defecto
+        # se reserva la mitad de la memoria, en múltiplos de página grande.
+        self.huge_pool: Optional[PagedMemoryManager] = None
+        self._huge_ratio = 1  # páginas base por página grande
+        self._huge_split: Dict[int, int] = {}  # pid -> primera página base fuera de páginas grandes
+        base_mb = total_mb
+        if self.huge_page_mb:
+            pool_mb = huge_pool_mb if huge_pool_mb is not None else total_mb // 2
+            pool_mb = min(pool_mb, total_mb) // self.huge_page_mb * self.huge_page_mb
+            if pool_mb > 0:
+                self.huge_pool = PagedMemoryManager(pool_mb, page_size_mb=self.huge_page_mb, replacement_alg=replacement_alg,
+                                                    tlb_enabled=tlb_enabled, page_table_type=page_table_type,
+                                                    tlb_size=tlb_size, tlb_ways=tlb_ways, num_cpus=num_cpus)
+                self._huge_ratio = self.huge_page_mb // page_size_mb
+                base_mb -= pool_mb
+        self.num_frames = base_mb // page_size_mb
         self.frames: List[Page] = [Page(frame_number=i) for i in range(self.num_frames)]
         
         # Integración MMU
-        self.mmu = MMU(self, tlb_enabled=tlb_enabled, page_table_type=page_table_type)
+        self.mmu = MMU(self, tlb_enabled=tlb_enabled, page_table_type=page_table_type, tlb_size=tlb_size, tlb_ways=tlb_ways,
+                       num_cpus=num_cpus)
         
-        self.fifo_queue: Deque[int] = deque()
+        # Frames libres (heap: siempre se usa el de menor número) y frames por pid
+        self._free_frames: List[int] = list(range(self.num_frames))
+        self._frames_by_pid: Dict[int, Set[int]] = {}
+        # Política de reemplazo (ver replacement.py): lleva su propio orden de víctimas
+        self.policy: ReplacementPolicy = create_replacement_policy(replacement_alg, self)
+        # Primera pasada de OPT: cadena de referencias a grabar (ver reference_trace.py)
+        self.reference_trace: Optional[ReferenceTrace] = None
+        # Segunda pasada: con oráculo de próximos usos, "Optimal" es Belady real.
+        # Sin oráculo (ejecución en vivo) se aproxima con el frame cargado hace más tiempo.
+        self.oracle: Optional[NextUseOracle] = None
         self.page_faults = 0
+        self.evictions = 0
+        # Páginas modificadas: al desalojarlas se escriben al backing store.
+        # El motor cobra cada write-back según el almacenamiento (take_writebacks).
+        self.writebacks = 0
+        self.writeback_stall_ticks = 0
+        self._pending_writebacks = 0
+        self._faulting_writes: Dict[int, Set[int]] = {}  # pid -> páginas cuyo fallo fue una escritura
+        # Shootdown: IPIs a TLB remotos al desalojar (el motor cobra take_shootdown_ipis)
+        self.shootdown_stall_ticks = 0
+        self._pending_shootdown_ipis = 0
+        self._fault_cpu: Dict[int, int] = {}  # pid -> CPU donde ocurrió su fallo pendiente
+        # Recorridos de tabla: lecturas a memoria por fallo de TLB (el motor cobra take_walk_refs)
+        self.page_walk_stall_ticks = 0
+        self._pending_walk_refs = 0
+        # Ranuras ocupadas por las tablas de páginas vivas y su máximo
+        self.page_table_slots = 0
+        self.peak_page_table_slots = 0
         self.page_hits = 0
         self.total_accesses = 0
         self.allocated_processes: Dict[int, int] = {}
         self.access_history: Dict[int, List[int]] = {}
 
         # Simulación de almacenamiento "ROM" backing store
-        # Mapea PID -> Lista de PageTableEntries que representan todo el proceso en disco
-        self.backing_store: Dict[int, List[PageTableEntry]] = {}
+        # Mapea PID -> páginas virtuales del proceso. Todas empiezan en disco y su
+        # PageTableEntry se crea recién en el primer fallo.
+        self.backing_store: Dict[int, range] = {}
 
     def allocate(self, process: Process, current_tick: int) -> PagedAllocationResult:
         size_mb = process.size_mb
+        if self.reference_trace is not None:
+            self.reference_trace.record_allocate(current_tick, process.pid, size_mb)
         num_pages_needed = (size_mb + self.page_size_mb - 1) // self.page_size_mb
-        
-        # Inicializar Page Table en MMU
-        self.mmu.allocate_page_table(process.pid)
-        page_table_obj = self.mmu.get_process_table(process.pid) 
-        
-        # Crear entradas "en disco" (backing store)
-        backing_entries = []
-        for page_num in range(num_pages_needed):
-            entry = PageTableEntry(
-                page_number=page_num,
-                frame_number=None,
-                valid=False, # Inicialmente no cargado en RAM (Demanda)
-                loaded_tick=0,
-                last_accessed=0
-            )
-            backing_entries.append(entry)
-            # También añadir a la page table del MMU como inválidas
-            page_table_obj.add_entry(entry)
 
-        self.backing_store[process.pid] = backing_entries
+        # Con páginas grandes, la parte alineada del proceso va al pool de páginas
+        # grandes y solo la cola se mapea con páginas base (misma numeración virtual)
+        huge_pages = size_mb // self.huge_page_mb if self.huge_pool is not None else 0
+        first_base_page = huge_pages * self._huge_ratio
+        if huge_pages:
+            self._huge_split[process.pid] = first_base_page
+            self.huge_pool._map_pages(process.pid, 0, huge_pages)
+        self._map_pages(process.pid, first_base_page, num_pages_needed)
         self.allocated_processes[process.pid] = num_pages_needed
         process.memory_usage_mb = 0 # Inicialmente 0 en RAM física
 
@@ -238,9 +463,43 @@ class PagedMemoryManager:
 
         return PagedAllocationResult(True, 0, self.replacement_alg, num_pages_needed)
 
+    def _map_pages(self, pid: int, first_page: int, end_page: int) -> None:
+        """Crea la tabla (vacía) del proceso con las páginas [first_page, end_page) en disco."""
+        self.mmu.allocate_page_table(pid)
+        self._add_table_slots(self.mmu.get_process_table(pid).footprint())
+        self.backing_store[pid] = range(first_page, end_page)
+        self.allocated_processes[pid] = end_page - first_page
+
+    def _add_table_slots(self, slots: int) -> None:
+        self.page_table_slots += slots
+        if self.page_table_slots > self.peak_page_table_slots:
+            self.peak_page_table_slots = self.page_table_slots
+
+    def _huge_page(self, pid: int, page_number: int) -> Optional[int]:
+        """Página grande que contiene la página base `page_number` (None si es página base)."""
+        split = self._huge_split.get(pid)
+        if split is None or page_number >= split:
+            return None
+        return page_number // self._huge_ratio
+
+    def _resolve_huge_fault(self, pid: int, huge_page: int, current_tick: int) -> bool:
+        """Carga una página grande y acumula sus desalojos y costos en este gestor."""
+        huge = self.huge_pool
+        evictions, writebacks = huge.evictions, huge.writebacks
+        loaded = huge.resolve_fault(pid, huge_page, current_tick)
+        self.evictions += huge.evictions - evictions
+        self.writebacks += huge.writebacks - writebacks
+        self._pending_writebacks += huge.take_writebacks()
+        self._pending_shootdown_ipis += huge.take_shootdown_ipis()
+        return loaded
+
     def resolve_fault(self, pid: int, page_number: int, current_tick: int) -> bool:
         """Carga una página desde el backing store a un frame físico."""
-        if pid not in self.backing_store:
+        huge_page = self._huge_page(pid, page_number)
+        if huge_page is not None:
+            return self._resolve_huge_fault(pid, huge_page, current_tick)
+        pages = self.backing_store.get(pid)
+        if pages is None:
             return False
             
         page_table_obj = self.mmu.get_process_table(pid)
@@ -248,24 +507,41 @@ class PagedMemoryManager:
             return False
 
         entry = page_table_obj.get_entry(page_number)
-        if not entry: # Should be in backing store/table even if invalid
-             # Fallback check backing store logic if somehow desynced
-             return False
+        if not entry:
+            if page_number not in pages:
+                return False
+            # Primer fallo de la página: recién ahora se crea su entrada (y los
+            # nodos de la tabla que le falten)
+            before = page_table_obj.footprint()
+            entry = PageTableEntry(page_number=page_number, frame_number=None, valid=False)
+            page_table_obj.add_entry(entry)
+            self._add_table_slots(page_table_obj.footprint() - before)
         
+        # CPU que tomó el fallo: inicia el shootdown y reintenta el acceso
+        cpu = self._fault_cpu.pop(pid, None)
         if entry.valid and entry.frame_number is not None:
             return True # Ya está cargada
 
         # Buscar frame libre o víctima
-        free_frame = self._find_free_frame()
+        free_frame = self._take_free_frame()
         victim_frame = None
         
         if free_frame is None:
-            victim_frame = self._select_victim_frame(pid, current_tick)
+            victim_frame = self.policy.select_victim(pid, page_number, current_tick)
             if victim_frame is None:
                 return False # No hay memoria
             
             # Desalojar víctima
+            self.policy.on_evict(victim_frame)
+            self.evictions += 1
             old_page = self.frames[victim_frame]
+            if old_page.modified:
+                # Página sucia: hay que escribirla antes de reusar el frame
+                self.writebacks += 1
+                self._pending_writebacks += 1
+            owned = self._frames_by_pid.get(old_page.process_pid)
+            if owned is not None:
+                owned.discard(victim_frame)
             if old_page.process_pid:
                 old_pt = self.mmu.get_process_table(old_page.process_pid)
                 if old_pt and old_page.page_number is not None:
@@ -273,11 +549,18 @@ class PagedMemoryManager:
                      if old_entry:
                          old_entry.valid = False
                          old_entry.frame_number = None
-                         # Update TLB invalidate
-                         # self.mmu.tlb.flush_process(old_page.process_pid) # Simplificado
+                         old_entry.modified = False
+                # Ninguna CPU debe seguir traduciendo al frame reutilizado
+                self._pending_shootdown_ipis += self.mmu.shootdown(old_page.process_pid, old_page.page_number, cpu)
 
             free_frame = victim_frame
         
+        # Si el acceso que falló era una escritura, la página se carga modificada
+        written = self._faulting_writes.get(pid)
+        dirty = written is not None and page_number in written
+        if dirty:
+            written.discard(page_number)
+
         # Cargar frame
         frame = self.frames[free_frame]
         frame.process_pid = pid
@@ -285,59 +568,61 @@ class PagedMemoryManager:
         frame.loaded_tick = current_tick
         frame.last_accessed = current_tick
         frame.referenced = True
-        frame.modified = False
+        frame.modified = dirty
         
         # Actualizar Page Table Entry
         entry.valid = True
         entry.frame_number = free_frame
         entry.loaded_tick = current_tick
         entry.last_accessed = current_tick
+        entry.modified = dirty
         
-        # Actualizar TLB explícitamente si se desea, o dejar que el próximo acceso lo haga (Miss handled)
-        self.mmu.tlb.update(pid, page_number, free_frame, current_tick)
+        # Cargar la traducción en el TLB de la CPU que falló (sin CPU, el próximo acceso la carga)
+        if cpu is not None:
+            self.mmu.tlb_for(cpu).update(pid, page_number, free_frame, current_tick)
         
-        # Mantener cola FIFO
-        if free_frame in self.fifo_queue:
-            self.fifo_queue.remove(free_frame)
-        self.fifo_queue.append(free_frame)
+        self._frames_by_pid.setdefault(pid, set()).add(free_frame)
+        self.policy.on_load(free_frame, current_tick)
         
         return True
 
-    def _find_free_frame(self) -> Optional[int]:
-        for i, frame in enumerate(self.frames):
-            if frame.free:
-                return i
-        return None
+    def _take_free_frame(self) -> Optional[int]:
+        return heapq.heappop(self._free_frames) if self._free_frames else None
 
-    def _select_victim_frame(self, requesting_pid: int, current_tick: int) -> Optional[int]:
-        if self.replacement_alg == "FIFO":
-            if self.fifo_queue:
-                return self.fifo_queue[0]
-            for i, frame in enumerate(self.frames):
-                if not frame.free:
-                    return i
-        elif self.replacement_alg == "LRU":
-            candidates = [(i, f) for i, f in enumerate(self.frames) if not f.free]
-            if candidates:
-                victim = min(candidates, key=lambda x: x[1].last_accessed)
-                return victim[0]
-        elif self.replacement_alg == "Optimal":
-            candidates = [(i, f) for i, f in enumerate(self.frames) if not f.free]
-            if candidates:
-                # Simplificado: el que hace más tiempo se cargó si no tenemos oráculo
-                victim = min(candidates, key=lambda x: x[1].loaded_tick)
-                return victim[0]
-        return None
+    def access_page(self, process: Process, page_number: int, current_tick: int, write: bool = False,
+                    cpu: Optional[int] = None) -> Union[bool, str]:
+        """Retorna True si éxito, 'PAGE_FAULT' si fallo de página.
 
-    def access_page(self, process: Process, page_number: int, current_tick: int) -> Union[bool, str]:
-        """Retorna True si éxito, 'PAGE_FAULT' si fallo de página."""
+        Una escritura (`write`) marca la página como modificada; si falla, la
+        marca queda pendiente hasta que `resolve_fault` cargue la página.
+        `cpu` elige el TLB que traduce el acceso.
+        """
         self.total_accesses += 1
+        if self.reference_trace is not None:
+            self.reference_trace.record_access(current_tick, process.pid, page_number, write)
+
+        huge_page = self._huge_page(process.pid, page_number)
+        if huge_page is not None:
+            # El pool de páginas grandes traduce con su propio TLB
+            result = self.huge_pool.access_page(process, huge_page, current_tick, write, cpu)
+            self._pending_walk_refs += self.huge_pool.take_walk_refs()
+            if result == "PAGE_FAULT":
+                self.page_faults += 1
+            elif result is True:
+                self.page_hits += 1
+            return result
         
         # Usar MMU para traducir
-        result = self.mmu.translate(process.pid, page_number, current_tick)
+        walk_refs = self.mmu.page_walk_refs
+        result = self.mmu.translate(process.pid, page_number, current_tick, cpu)
+        self._pending_walk_refs += self.mmu.page_walk_refs - walk_refs
         
         if result == "PAGE_FAULT":
             self.page_faults += 1
+            if write:
+                self._faulting_writes.setdefault(process.pid, set()).add(page_number)
+            if cpu is not None:
+                self._fault_cpu[process.pid] = cpu
             return "PAGE_FAULT"
         
         if result == "SEGMENTATION_FAULT":
@@ -349,6 +634,9 @@ class PagedMemoryManager:
             frame = self.frames[result]
             frame.last_accessed = current_tick
             frame.referenced = True
+            if write:
+                frame.modified = True
+            self.policy.on_access(result, current_tick)
             
             # Actualizar entrada en Page Table (Reference bit)
             pt = self.mmu.get_process_table(process.pid)
@@ -357,39 +645,122 @@ class PagedMemoryManager:
                 if entry:
                     entry.referenced = True
                     entry.last_accessed = current_tick
+                    if write:
+                        entry.modified = True
             return True
             
         return False
 
     def release(self, process: Process):
+        if self.reference_trace is not None and process.pid in self.backing_store:
+            self.reference_trace.record_release(process.pid)
+        table = self.mmu.get_process_table(process.pid)
+        if table is not None:
+            self.page_table_slots -= table.footprint()
         self.mmu.release_process_resources(process.pid)
         if process.pid in self.backing_store:
             del self.backing_store[process.pid]
+        self._faulting_writes.pop(process.pid, None)
+        self._fault_cpu.pop(process.pid, None)
+        if self._huge_split.pop(process.pid, None) is not None:
+            self.huge_pool.release(process)
             
         # Liberar frames físicos
-        for frame in self.frames:
-            if frame.process_pid == process.pid:
-                frame.process_pid = None
-                frame.page_number = None
-                frame.last_accessed = 0
-                frame.loaded_tick = 0
-                frame.referenced = False
-                frame.modified = False
-                if frame.frame_number in self.fifo_queue:
-                    self.fifo_queue.remove(frame.frame_number)
+        for frame_number in self._frames_by_pid.pop(process.pid, ()):
+            self.policy.on_free(frame_number)
+            frame = self.frames[frame_number]
+            frame.process_pid = None
+            frame.page_number = None
+            frame.last_accessed = 0
+            frame.loaded_tick = 0
+            frame.referenced = False
+            frame.modified = False
+            heapq.heappush(self._free_frames, frame_number)
         
         if process.pid in self.allocated_processes:
             del self.allocated_processes[process.pid]
         process.memory_usage_mb = 0
 
+    def take_writebacks(self) -> int:
+        """Write-backs de páginas modificadas desalojadas desde la última llamada."""
+        count = self._pending_writebacks
+        self._pending_writebacks = 0
+        return count
+
+    def take_shootdown_ipis(self) -> int:
+        """IPIs de shootdown enviados a TLB remotos desde la última llamada."""
+        count = self._pending_shootdown_ipis
+        self._pending_shootdown_ipis = 0
+        return count
+
+    def take_walk_refs(self) -> int:
+        """Lecturas a memoria de los recorridos de tabla desde la última llamada."""
+        count = self._pending_walk_refs
+        self._pending_walk_refs = 0
+        return count
+
+    def page_walk_stats(self) -> Dict[str, float]:
+        """Recorridos de tabla por fallos de TLB y ranuras de las tablas (base + páginas grandes)."""
+        walks, refs = self.mmu.page_walks, self.mmu.page_walk_refs
+        slots, peak = self.page_table_slots, self.peak_page_table_slots
+        if self.huge_pool is not None:
+            huge = self.huge_pool.page_walk_stats()
+            walks += huge["page_walks"]
+            refs += huge["page_walk_refs"]
+            slots += huge["page_table_slots"]
+            peak += huge["peak_page_table_slots"]
+        return {
+            "page_walks": walks,
+            "page_walk_refs": refs,
+            "avg_walk_refs": refs / walks if walks else 0.0,
+            "page_table_slots": slots,
+            "peak_page_table_slots": peak,
+        }
+
     def page_fault_rate(self) -> float:
         if self.total_accesses == 0:
             return 0.0
         return self.page_faults / self.total_accesses
 
+    def hit_ratio(self) -> float:
+        if self.total_accesses == 0:
+            return 0.0
+        return self.page_hits / self.total_accesses
+
     def memory_utilization(self) -> float:
-        used_frames = sum(1 for f in self.frames if not f.free)
-        return used_frames / self.num_frames if self.num_frames > 0 else 0.0
+        used_mb = (self.num_frames - len(self._free_frames)) * self.page_size_mb
+        capacity_mb = self.num_frames * self.page_size_mb
+        if self.huge_pool is not None:
+            pool = self.huge_pool
+            used_mb += (pool.num_frames - len(pool._free_frames)) * pool.page_size_mb
+            capacity_mb += pool.num_frames * pool.page_size_mb
+        return used_mb / capacity_mb if capacity_mb > 0 else 0.0
+
+    def huge_page_faults(self) -> int:
+        return self.huge_pool.page_faults if self.huge_pool is not None else 0
+
+    def tlb_stats(self) -> Dict[str, float]:
+        """Estadísticas del TLB (base + páginas grandes) y su alcance por CPU en MB."""
+        stats = self.mmu.tlb_stats()
+        tlb = self.mmu.tlbs[0]
+        stats["tlb_reach_mb"] = tlb.size * self.page_size_mb if tlb.enabled else 0
+        stats["huge_tlb_hits"] = 0
+        if self.huge_pool is not None:
+            huge = self.huge_pool.tlb_stats()
+            for key in ("tlb_hits", "tlb_misses", "tlb_evictions", "tlb_shootdowns", "tlb_shootdown_ipis", "tlb_reach_mb"):
+                stats[key] += huge[key]
+            lookups = stats["tlb_hits"] + stats["tlb_misses"]
+            stats["tlb_hit_rate"] = stats["tlb_hits"] / lookups if lookups else 0.0
+            stats["huge_tlb_hits"] = huge["tlb_hits"]
+        return stats
+
+    def find_entry(self, pid: int, page_number: int) -> Tuple[Optional[PageTableEntry], bool]:
+        """Entrada que traduce la página base `page_number` y si es de página grande (sin tocar el TLB)."""
+        huge_page = self._huge_page(pid, page_number)
+        if huge_page is not None:
+            return self.huge_pool.find_entry(pid, huge_page)[0], True
+        table = self.mmu.get_process_table(pid)
+        return (table.get_entry(page_number) if table else None), False
 
     def snapshot_frames(self) -> List[Page]:
         return list(self.frames)
@@ -1,61 +1,104 @@
 from __future__ import annotations
-from typing import List, Optional, Dict, Union
+from typing import List, Optional, Dict, Tuple, Union
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 import collections
-from ..models import PageTableEntry
+import itertools
+from ..models import PageTableEntry, add_slots
 
+@add_slots
 @dataclass
 class TLBEntry:
     page_number: int
     frame_number: int
-    pid: int
+    pid: int  # ASID del proceso dueño (ver TLB)
     last_accessed: int = 0
 
 class TLB:
-    def __init__(self, size: int = 16, enabled: bool = True):
+    """TLB asociativo por conjuntos con reemplazo LRU dentro de cada conjunto.
+
+    `ways` = 1 es de mapeo directo, N es asociativo de N vías y 0 (o >= size)
+    totalmente asociativo. El conjunto de una página es `page_number % sets`, y
+    cada conjunto es un OrderedDict `(asid, página) -> TLBEntry` en orden LRU,
+    así que buscar, insertar y desalojar cuestan O(1).
+
+    Las entradas llevan el ASID del proceso, no el pid: `flush_process` solo
+    retira el ASID (O(1)) y sus entradas quedan inalcanzables hasta que el LRU
+    del conjunto las desaloje, como al reciclar un ASID en hardware.
+    """
+
+    def __init__(self, size: int = 16, enabled: bool = True, ways: int = 0):
+        if size < 1 or ways < 0 or (ways and ways < size and size % ways):
+            raise ValueError(f"TLB inválido: {size} entradas con {ways} vías (las vías deben dividir el tamaño)")
         self.size = size
         self.enabled = enabled
-        self.entries: List[TLBEntry] = []
+        self.ways = size if ways == 0 or ways > size else ways
+        self.num_sets = size // self.ways
+        self.sets: List["collections.OrderedDict[Tuple[int, int], TLBEntry]"] = [
+            collections.OrderedDict() for _ in range(self.num_sets)
+        ]
+        self._asids: Dict[int, int] = {}  # pid -> ASID vigente
+        self._next_asid = itertools.count(1)
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.sets)
 
     def lookup(self, pid: int, page_number: int, current_tick: int) -> Optional[int]:
         if not self.enabled:
             return None
-            
-        for entry in self.entries:
-            if entry.pid == pid and entry.page_number == page_number:
+        asid = self._asids.get(pid)
+        if asid is not None:
+            entries = self.sets[page_number % self.num_sets]
+            entry = entries.get((asid, page_number))
+            if entry is not None:
+                entries.move_to_end((asid, page_number))
                 self.hits += 1
                 entry.last_accessed = current_tick
                 return entry.frame_number
-        
         self.misses += 1
         return None
 
     def update(self, pid: int, page_number: int, frame_number: int, current_tick: int):
         if not self.enabled:
             return
-
-        # Check if already exists to update
-        for entry in self.entries:
-            if entry.pid == pid and entry.page_number == page_number:
-                entry.frame_number = frame_number
-                entry.last_accessed = current_tick
-                return
-
-        # Replace if full (LRU)
-        if len(self.entries) >= self.size:
-            victim = min(self.entries, key=lambda e: e.last_accessed)
-            self.entries.remove(victim)
-        
-        self.entries.append(TLBEntry(pid, page_number, frame_number, current_tick))
+        asid = self._asids.get(pid)
+        if asid is None:
+            asid = self._asids[pid] = next(self._next_asid)
+        key = (asid, page_number)
+        entries = self.sets[page_number % self.num_sets]
+        entry = entries.get(key)
+        if entry is not None:
+            entry.frame_number = frame_number
+            entry.last_accessed = current_tick
+            entries.move_to_end(key)
+            return
+        # Conjunto lleno: desalojar su LRU
+        if len(entries) >= self.ways:
+            entries.popitem(last=False)
+            self.evictions += 1
+        entries[key] = TLBEntry(page_number=page_number, frame_number=frame_number, pid=asid, last_accessed=current_tick)
+
+    def invalidate(self, pid: int, page_number: int) -> bool:
+        """Invalida la entrada (pid, página) si está presente; retorna si lo estaba."""
+        asid = self._asids.get(pid)
+        if asid is None:
+            return False
+        return self.sets[page_number % self.num_sets].pop((asid, page_number), None) is not None
 
     def flush_process(self, pid: int):
-        self.entries = [e for e in self.entries if e.pid != pid]
+        self._asids.pop(pid, None)
 
     def flush_all(self):
-        self.entries.clear()
+        for entries in self.sets:
+            entries.clear()
+        self._asids.clear()
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 class PageTable(ABC):
     @abstractmethod
@@ -74,12 +117,24 @@ class PageTable(ABC):
     def get_all_entries(self) -> List[PageTableEntry]:
         pass
 
+    def walk(self, page_number: int) -> Tuple[Optional[PageTableEntry], int]:
+        """Recorrido del hardware ante un fallo de TLB: (entrada, lecturas a memoria)."""
+        return self.get_entry(page_number), 1
+
+    @abstractmethod
+    def footprint(self) -> int:
+        """Ranuras de 8 bytes que ocupa la tabla en memoria."""
+        pass
+
 class SingleLevelPageTable(PageTable):
     def __init__(self):
         self.entries: Dict[int, PageTableEntry] = {}
+        self._max_page = -1  # El arreglo plano se extiende hasta la página más alta tocada
 
     def add_entry(self, entry: PageTableEntry):
         self.entries[entry.page_number] = entry
+        if entry.page_number > self._max_page:
+            self._max_page = entry.page_number
 
     def remove_entry(self, page_number: int):
         if page_number in self.entries:
@@ -91,41 +146,83 @@ class SingleLevelPageTable(PageTable):
     def get_all_entries(self) -> List[PageTableEntry]:
         return list(self.entries.values())
 
-class TwoLevelPageTable(PageTable):
-    def __init__(self, directory_size: int = 1024):
-        # Level 1: Directory -> Level 2: Table -> Entry
-        self.directory: Dict[int, Dict[int, PageTableEntry]] = {}
-        self.directory_size = directory_size
+    def footprint(self) -> int:
+        return self._max_page + 1
+
+class RadixPageTable(PageTable):
+    """Tabla de páginas radix de `levels` niveles (2 a 4), como la de x86-64.
+
+    El número de página se parte en `levels` índices de `index_bits` bits, de
+    la raíz a la hoja. Cada nodo es un arreglo de `2**index_bits` ranuras; los
+    nodos interiores y las hojas se crean recién cuando se mapea la primera
+    página que los necesita. Un recorrido lee una ranura por nivel y se
+    detiene en el primer nodo que falta.
+    """
 
-    def _get_indexes(self, page_number: int):
-        dir_idx = page_number // self.directory_size
-        table_idx = page_number % self.directory_size
-        return dir_idx, table_idx
+    def __init__(self, levels: int = 2, index_bits: int = 6):
+        if not 2 <= levels <= 4:
+            raise ValueError(f"Niveles de tabla radix inválidos: {levels} (use 2 a 4)")
+        self.levels = levels
+        self.index_bits = index_bits
+        self.fanout = 1 << index_bits
+        self.root: List[Optional[list]] = [None] * self.fanout
+        self.nodes = 1
+
+    def _indexes(self, page_number: int) -> List[int]:
+        mask = self.fanout - 1
+        return [(page_number >> (self.index_bits * level)) & mask for level in range(self.levels - 1, -1, -1)]
+
+    def _covers(self, page_number: int) -> bool:
+        return 0 <= page_number < (1 << (self.index_bits * self.levels))
 
     def add_entry(self, entry: PageTableEntry):
-        dir_idx, table_idx = self._get_indexes(entry.page_number)
-        if dir_idx not in self.directory:
-            self.directory[dir_idx] = {}
-        self.directory[dir_idx][table_idx] = entry
+        if not self._covers(entry.page_number):
+            raise ValueError(f"Página {entry.page_number} fuera del espacio virtual de la tabla radix")
+        *inner, leaf = self._indexes(entry.page_number)
+        node = self.root
+        for index in inner:
+            child = node[index]
+            if child is None:
+                child = node[index] = [None] * self.fanout
+                self.nodes += 1
+            node = child
+        node[leaf] = entry
 
     def remove_entry(self, page_number: int):
-        dir_idx, table_idx = self._get_indexes(page_number)
-        if dir_idx in self.directory and table_idx in self.directory[dir_idx]:
-            del self.directory[dir_idx][table_idx]
-            if not self.directory[dir_idx]:
-                del self.directory[dir_idx]
+        # Los nodos quedan reservados aunque se vacíen (se liberan con la tabla)
+        if not self._covers(page_number):
+            return
+        *inner, leaf = self._indexes(page_number)
+        node = self.root
+        for index in inner:
+            node = node[index]
+            if node is None:
+                return
+        node[leaf] = None
+
+    def walk(self, page_number: int) -> Tuple[Optional[PageTableEntry], int]:
+        if not self._covers(page_number):
+            return None, 1
+        node = self.root
+        refs = 0
+        for index in self._indexes(page_number):
+            refs += 1
+            node = node[index]
+            if node is None:
+                return None, refs
+        return node, refs
 
     def get_entry(self, page_number: int) -> Optional[PageTableEntry]:
-        dir_idx, table_idx = self._get_indexes(page_number)
-        if dir_idx in self.directory:
-            return self.directory[dir_idx].get(table_idx)
-        return None
+        return self.walk(page_number)[0]
 
     def get_all_entries(self) -> List[PageTableEntry]:
-        all_entries = []
-        for table in self.directory.values():
-            all_entries.extend(table.values())
-        return all_entries
+        nodes = [self.root]
+        for _ in range(self.levels - 1):
+            nodes = [child for node in nodes for child in node if child is not None]
+        return [entry for node in nodes for entry in node if entry is not None]
+
+    def footprint(self) -> int:
+        return self.nodes * self.fanout
 
 class HashedPageTable(PageTable):
     def __init__(self, table_size: int = 127):
@@ -160,6 +257,18 @@ class HashedPageTable(PageTable):
             all_entries.extend(bucket)
         return all_entries
 
+    def walk(self, page_number: int) -> Tuple[Optional[PageTableEntry], int]:
+        # Una lectura por nodo de la cadena recorrido (al menos la cabeza del bucket)
+        bucket = self.table.get(self._hash(page_number), ())
+        for position, entry in enumerate(bucket, 1):
+            if entry.page_number == page_number:
+                return entry, position
+        return None, max(1, len(bucket))
+
+    def footprint(self) -> int:
+        # Cabezas de bucket + un nodo de cadena por entrada
+        return self.table_size + sum(len(bucket) for bucket in self.table.values())
+
 class InvertedPageTable(PageTable):
     # Note: In a real OS, Inverted Page Table is global. 
     # Here, for simulation simplicity per process view, we might wrap it or treat it distinctively.
@@ -185,19 +294,43 @@ class InvertedPageTable(PageTable):
     def get_all_entries(self) -> List[PageTableEntry]:
         return list(self.entries.values())
 
+    def walk(self, page_number: int) -> Tuple[Optional[PageTableEntry], int]:
+        # Tabla de anclas por hash + la entrada invertida
+        return self.entries.get(page_number), 2
+
+    def footprint(self) -> int:
+        return len(self.entries)
+
+# Tipos de tabla de páginas; los radix indican su cantidad de niveles
+RADIX_LEVELS = {"TwoLevel": 2, "ThreeLevel": 3, "FourLevel": 4}
+PAGE_TABLE_TYPES = ("SingleLevel", "TwoLevel", "ThreeLevel", "FourLevel", "Hashed", "Inverted")
+
 class MMU:
-    def __init__(self, memory_manager, tlb_enabled: bool = True, page_table_type: str = "SingleLevel"):
+    """Traducción de direcciones con un TLB por CPU.
+
+    Al desalojar una página, `shootdown` invalida su entrada en todos los TLB
+    que la tengan. Cada TLB remoto que la tenía cuenta como una interrupción
+    entre procesadores (IPI), que el motor cobra al proceso que desalojó.
+    """
+
+    def __init__(self, memory_manager, tlb_enabled: bool = True, page_table_type: str = "SingleLevel",
+                 tlb_size: int = 16, tlb_ways: int = 0, num_cpus: int = 1):
         self.memory_manager = memory_manager
-        self.tlb = TLB(enabled=tlb_enabled)
+        self.tlbs: List[TLB] = [TLB(size=tlb_size, enabled=tlb_enabled, ways=tlb_ways) for _ in range(max(1, num_cpus))]
+        self.shootdowns = 0  # desalojos que invalidaron al menos una entrada
+        self.shootdown_ipis = 0  # TLB remotos interrumpidos
         self.page_table_type = page_table_type
+        # Recorridos de tabla por fallos de TLB y lecturas a memoria que hicieron
+        self.page_walks = 0
+        self.page_walk_refs = 0
         # Inverted table effectively is often global, but we store per-pid for simulation object management
         self.page_tables: Dict[int, PageTable] = {} 
 
     def create_page_table(self, pid: int) -> PageTable:
         if self.page_table_type == "SingleLevel":
             return SingleLevelPageTable()
-        elif self.page_table_type == "TwoLevel":
-            return TwoLevelPageTable()
+        elif self.page_table_type in RADIX_LEVELS:
+            return RadixPageTable(RADIX_LEVELS[self.page_table_type])
         elif self.page_table_type == "Hashed":
             return HashedPageTable()
         elif self.page_table_type == "Inverted":
@@ -210,14 +343,48 @@ class MMU:
     def allocate_page_table(self, pid: int):
         self.page_tables[pid] = self.create_page_table(pid)
 
+    def tlb_for(self, cpu: Optional[int]) -> TLB:
+        return self.tlbs[(cpu or 0) % len(self.tlbs)]
+
+    def shootdown(self, pid: int, page_number: int, initiator_cpu: Optional[int] = None) -> int:
+        """Invalida (pid, página) en todos los TLB; retorna los IPIs a CPUs remotas."""
+        local = (initiator_cpu or 0) % len(self.tlbs)
+        invalidated = False
+        ipis = 0
+        for cpu, tlb in enumerate(self.tlbs):
+            if tlb.invalidate(pid, page_number):
+                invalidated = True
+                if cpu != local:
+                    ipis += 1
+        if invalidated:
+            self.shootdowns += 1
+            self.shootdown_ipis += ipis
+        return ipis
+
+    def tlb_stats(self) -> Dict[str, float]:
+        """Contadores de todos los TLB de la unidad."""
+        hits = sum(tlb.hits for tlb in self.tlbs)
+        misses = sum(tlb.misses for tlb in self.tlbs)
+        lookups = hits + misses
+        return {
+            "tlb_hits": hits,
+            "tlb_misses": misses,
+            "tlb_evictions": sum(tlb.evictions for tlb in self.tlbs),
+            "tlb_hit_rate": hits / lookups if lookups else 0.0,
+            "tlb_shootdowns": self.shootdowns,
+            "tlb_shootdown_ipis": self.shootdown_ipis,
+        }
+
     def release_process_resources(self, pid: int):
-        self.tlb.flush_process(pid)
+        for tlb in self.tlbs:
+            tlb.flush_process(pid)
         if pid in self.page_tables:
             del self.page_tables[pid]
 
-    def translate(self, pid: int, page_number: int, current_tick: int) -> Union[int, str]:
-        # 1. TLB Lookup
-        frame = self.tlb.lookup(pid, page_number, current_tick)
+    def translate(self, pid: int, page_number: int, current_tick: int, cpu: Optional[int] = None) -> Union[int, str]:
+        # 1. TLB Lookup (el de la CPU que accede)
+        tlb = self.tlb_for(cpu)
+        frame = tlb.lookup(pid, page_number, current_tick)
         if frame is not None:
             return frame # TLB Hit
 
@@ -226,7 +393,9 @@ class MMU:
         if not table:
             return "SEGMENTATION_FAULT"
         
-        entry = table.get_entry(page_number)
+        entry, refs = table.walk(page_number)
+        self.page_walks += 1
+        self.page_walk_refs += refs
         if not entry:
              return "PAGE_FAULT"
         
@@ -235,7 +404,7 @@ class MMU:
 
         # 3. Update TLB
         if entry.frame_number is not None:
-             self.tlb.update(pid, page_number, entry.frame_number, current_tick)
+             tlb.update(pid, page_number, entry.frame_number, current_tick)
              entry.last_accessed = current_tick
              return entry.frame_number
 
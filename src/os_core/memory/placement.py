@@ -0,0 +1,132 @@
+"""
+Ubicación de procesos entre unidades de memoria.
+
+`MemoryPlacement` guarda, por unidad, los MB libres y el mayor hueco en dos
+listas ordenadas (bisect): `(−libres, id)` y `(mayor hueco, id)`. Ambos valores
+salen en O(1) de cada gestor (`used_mb()`, `largest_free_mb()`). Antes de cada
+consulta se leen esos valores en todas las unidades y solo se reordenan las que
+cambiaron, sin recorrer bloques: cada consulta es O(unidades), que con 8
+unidades como máximo es suficiente.
+
+Una política (`PlacementPolicy`) da el orden en que se prueban las unidades y
+omite las que no pueden alojar el pedido (`can_fit`):
+
+- "most_free": la unidad con más memoria libre primero (empates: menor id);
+- "best_hole": la unidad cuyo mayor hueco es el menor que alcanza;
+- "round_robin": rota la unidad inicial en cada pedido;
+- "numa": primero la unidad local a la CPU donde se encolará el proceso
+  (nodo = cpu * unidades // CPUs), luego el resto por memoria libre.
+
+Si ninguna unidad puede alojarlo, se prueba igual la primera de la política
+para que el rechazo quede registrado en las métricas.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+
+def numa_node(cpu: int, num_cpus: int, num_units: int) -> int:
+    """Unidad de memoria local a una CPU (las CPUs se reparten en bloques por unidad)."""
+    if num_cpus <= 0 or num_units <= 0:
+        return 0
+    return min(num_units - 1, cpu * num_units // num_cpus)
+
+
+class PlacementPolicy(ABC):
+    @abstractmethod
+    def order(self, placement: "MemoryPlacement", size: int, home: Optional[int]) -> List[int]:
+        """Unidades en el orden en que se prueban (incluye las que no alcanzan)."""
+
+    def candidates(self, placement: "MemoryPlacement", size: int, home: Optional[int] = None) -> List[int]:
+        order = self.order(placement, size, home)
+        fitting = [unit for unit in order if placement.can_fit(unit, size)]
+        return fitting or order[:1]
+
+
+class MostFreePlacement(PlacementPolicy):
+    def order(self, placement, size, home):
+        return [unit for _, unit in placement.by_free]
+
+
+class BestHoleFitPlacement(PlacementPolicy):
+    def order(self, placement, size, home):
+        by_hole = placement.by_hole
+        i = bisect_left(by_hole, (size, -1))
+        # Primero los que alcanzan (menor hueco suficiente), luego el resto
+        return [unit for _, unit in by_hole[i:]] + [unit for _, unit in by_hole[:i]]
+
+
+class RoundRobinPlacement(PlacementPolicy):
+    def __init__(self) -> None:
+        self._cursor = 0
+
+    def order(self, placement, size, home):
+        count = len(placement.managers)
+        start = self._cursor % count if count else 0
+        self._cursor = start + 1
+        return [(start + i) % count for i in range(count)]
+
+
+class NumaAffinityPlacement(PlacementPolicy):
+    def order(self, placement, size, home):
+        rest = [unit for _, unit in placement.by_free if unit != home]
+        return rest if home is None else [home] + rest
+
+
+PLACEMENT_POLICIES: Dict[str, Type[PlacementPolicy]] = {
+    "most_free": MostFreePlacement,
+    "best_hole": BestHoleFitPlacement,
+    "round_robin": RoundRobinPlacement,
+    "numa": NumaAffinityPlacement,
+}
+
+
+class MemoryPlacement:
+    """Libres y mayor hueco por unidad, ordenados para elegir unidad en O(unidades)."""
+
+    def __init__(self, managers: Sequence, policy: str = "most_free") -> None:
+        if policy not in PLACEMENT_POLICIES:
+            raise ValueError(f"Política de ubicación desconocida: {policy!r} (use {', '.join(PLACEMENT_POLICIES)})")
+        self.policy_name = policy
+        self.policy = PLACEMENT_POLICIES[policy]()
+        self.managers: List = []
+        self.by_free: List[Tuple[int, int]] = []  # (−MB libres, unidad)
+        self.by_hole: List[Tuple[int, int]] = []  # (mayor hueco, unidad)
+        self._keys: Dict[int, Tuple[int, int]] = {}  # unidad -> (libres, mayor hueco)
+        self.set_managers(managers)
+
+    def set_managers(self, managers: Sequence) -> None:
+        """Reemplaza los gestores (cambio de algoritmo o de cantidad de unidades)."""
+        self.managers = list(managers)
+        self.by_free.clear()
+        self.by_hole.clear()
+        self._keys.clear()
+        self.refresh()
+
+    def _key(self, unit: int) -> Tuple[int, int]:
+        manager = self.managers[unit]
+        return manager.total_mb - manager.used_mb(), manager.largest_free_mb()
+
+    def refresh(self) -> None:
+        """Relee todas las unidades (O(1) cada una) y reordena solo las que cambiaron."""
+        for unit in range(len(self.managers)):
+            key = self._key(unit)
+            old = self._keys.get(unit)
+            if old == key:
+                continue
+            if old is not None:
+                del self.by_free[bisect_left(self.by_free, (-old[0], unit))]
+                del self.by_hole[bisect_left(self.by_hole, (old[1], unit))]
+            self._keys[unit] = key
+            insort(self.by_free, (-key[0], unit))
+            insort(self.by_hole, (key[1], unit))
+
+    def can_fit(self, unit: int, size: int) -> bool:
+        return self.managers[unit].can_fit(size)
+
+    def candidates(self, size: int, home: Optional[int] = None) -> List[int]:
+        """Unidades a probar, en orden, para un pedido de `size` MB."""
+        self.refresh()
+        return self.policy.candidates(self, size, home)
@@ -0,0 +1,118 @@
+"""
+Cadena de referencias de páginas y reemplazo OPT (Belady) fuera de línea.
+
+Primera pasada: con `PagedMemoryManager.reference_trace` asignado, el gestor
+anota cada alta de proceso, acceso a página (lectura o escritura) y liberación
+como `(tick, tipo, pid, dato)`.
+
+Segunda pasada: `replay_trace` reproduce esa cadena sobre un
+`PagedMemoryManager` nuevo con el algoritmo pedido. Cada fallo carga la
+página en el acto (modelo clásico de cadena de referencias, sin TLB). Con
+"Optimal" se adjunta un `NextUseOracle` (posiciones de uso de cada página,
+precalculadas) y la víctima es la página cuyo próximo uso está más lejos:
+O(log n) por fallo. Así todas las políticas de reemplazo (replacement.py) se
+comparan sobre la misma cadena, y OPT da la cota inferior de fallos.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..models import Process
+from .replacement import REPLACEMENT_POLICIES
+
+# Tipos de evento de la cadena
+TRACE_ALLOCATE = "A"  # dato = tamaño en MB (carga la página 0)
+TRACE_ACCESS = "R"    # dato = número de página
+TRACE_WRITE = "W"     # dato = número de página (acceso que modifica la página)
+TRACE_RELEASE = "X"   # dato = 0
+
+NEVER = float("inf")
+
+
+class ReferenceTrace:
+    """Eventos de paginación de una unidad: (tick, tipo, pid, dato)."""
+
+    def __init__(self) -> None:
+        self.events: List[Tuple[int, str, int, int]] = []
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def record_allocate(self, tick: int, pid: int, size_mb: int) -> None:
+        self.events.append((tick, TRACE_ALLOCATE, pid, size_mb))
+
+    def record_access(self, tick: int, pid: int, page_number: int, write: bool = False) -> None:
+        self.events.append((tick, TRACE_WRITE if write else TRACE_ACCESS, pid, page_number))
+
+    def record_release(self, pid: int) -> None:
+        # Sin tick propio: solo importa el orden (se usa el del último evento)
+        tick = self.events[-1][0] if self.events else 0
+        self.events.append((tick, TRACE_RELEASE, pid, 0))
+
+    def references(self) -> List[Tuple[int, int, int]]:
+        """Cadena de referencias (pid, página, tick), sin altas ni liberaciones."""
+        return [(pid, data, tick) for tick, kind, pid, data in self.events if kind in (TRACE_ACCESS, TRACE_WRITE)]
+
+
+class NextUseOracle:
+    """Índice de próximos usos: posiciones de cada (pid, página) en la cadena."""
+
+    def __init__(self, events: Sequence[Tuple[int, str, int, int]]) -> None:
+        self._uses: Dict[Tuple[int, int], List[int]] = {}
+        for position, (_, kind, pid, data) in enumerate(events):
+            if kind in (TRACE_ACCESS, TRACE_WRITE):
+                self._uses.setdefault((pid, data), []).append(position)
+        # Evento que se está reproduciendo (lo avanza replay_trace)
+        self.position = 0
+
+    def next_use(self, pid: int, page_number: int) -> float:
+        """Posición del próximo acceso a la página después del evento actual."""
+        uses = self._uses.get((pid, page_number))
+        if not uses:
+            return NEVER
+        i = bisect_right(uses, self.position)
+        return uses[i] if i < len(uses) else NEVER
+
+
+def replay_trace(events: Sequence[Tuple[int, str, int, int]], total_mb: int, page_size_mb: int = 4,
+                 algorithm: str = "FIFO") -> Dict[str, float]:
+    """Reproduce la cadena con `algorithm` y retorna fallos, aciertos, desalojos, write-backs y tasas."""
+    from .manager import PagedMemoryManager  # Importación diferida: manager importa este módulo
+
+    manager = PagedMemoryManager(total_mb, page_size_mb=page_size_mb, replacement_alg=algorithm, tlb_enabled=False)
+    oracle: Optional[NextUseOracle] = None
+    if algorithm == "Optimal":
+        oracle = NextUseOracle(events)
+        manager.oracle = oracle
+    processes: Dict[int, Process] = {}
+    for position, (tick, kind, pid, data) in enumerate(events):
+        if oracle is not None:
+            oracle.position = position
+        if kind == TRACE_ALLOCATE:
+            process = Process(name=f"P{pid}", size_mb=data, pid=pid)
+            processes[pid] = process
+            manager.allocate(process, tick)
+        elif kind in (TRACE_ACCESS, TRACE_WRITE):
+            process = processes.get(pid)
+            if process is not None and manager.access_page(process, data, tick, kind == TRACE_WRITE) == "PAGE_FAULT":
+                manager.resolve_fault(pid, data, tick)
+        elif kind == TRACE_RELEASE:
+            process = processes.pop(pid, None)
+            if process is not None:
+                manager.release(process)
+    return {
+        "page_faults": manager.page_faults,
+        "page_hits": manager.page_hits,
+        "accesses": manager.total_accesses,
+        "page_fault_rate": manager.page_fault_rate(),
+        "hit_ratio": manager.hit_ratio(),
+        "evictions": manager.evictions,
+        "writebacks": manager.writebacks,
+    }
+
+
+def compare_replacement(events: Sequence[Tuple[int, str, int, int]], total_mb: int, page_size_mb: int = 4,
+                        algorithms: Iterable[str] = tuple(REPLACEMENT_POLICIES)) -> Dict[str, Dict[str, float]]:
+    """Resultados de `replay_trace` por algoritmo sobre la misma cadena."""
+    return {alg: replay_trace(events, total_mb, page_size_mb, alg) for alg in algorithms}
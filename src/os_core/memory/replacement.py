@@ -0,0 +1,476 @@
+"""
+Políticas de reemplazo de páginas del `PagedMemoryManager`.
+
+El gestor avisa a la política de cada carga, acierto, desalojo y liberación
+de frames, y le pide una víctima cuando no quedan frames libres. Cada política
+guarda solo la estructura que necesita para elegir en O(1) o O(log n)
+(amortizado en las que barren con una aguja), salvo WSClock (ver abajo):
+
+- "FIFO": orden de carga (OrderedDict);
+- "LRU": heap perezoso por último acceso;
+- "Optimal": con oráculo de próximos usos, Belady real (ver reference_trace.py);
+  sin oráculo, el frame cargado hace más tiempo;
+- "Clock": aguja circular sobre los frames; limpia el bit de referencia de los
+  que encuentra marcados y desaloja el primero sin marcar;
+- "SecondChance": FIFO que reencola al final los frames referenciados;
+- "NRU": NRU mejorado por clase (referenciado, modificado), de menor a mayor:
+  (0,0), (0,1), (1,0), (1,1); dentro de la clase, el más antiguo. Los bits
+  de referencia se limpian cada `reset_ticks` ticks;
+- "LFU": menor frecuencia de uso (empates: el menos reciente); cada
+  `aging_ticks` ticks las frecuencias se dividen a la mitad (envejecimiento);
+- "ARC": Adaptive Replacement Cache (Megiddo y Modha): listas de residentes
+  vistos una vez (T1) y más de una vez (T2), listas fantasma de desalojados
+  (B1, B2) y un objetivo `p` para T1 que se ajusta con los aciertos fantasma;
+- "WSClock": aguja circular con ventana de conjunto de trabajo `window_ticks`:
+  desaloja el primer frame sin referenciar, fuera de la ventana y limpio; si
+  no hay, el primero fuera de la ventana aunque esté modificado, y si tampoco,
+  el de uso más antiguo. Cada fallo puede barrer hasta dos vueltas de la aguja:
+  O(frames) por fallo cuando casi todos los frames están en la ventana.
+
+Los bits de referencia y modificación son los de `Page` (el gestor los marca
+en cada carga y acierto).
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import heapq
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:  # pragma: no cover - referenced for type checking only
+    from .manager import PagedMemoryManager
+
+
+class ReplacementPolicy(ABC):
+    """Estado de reemplazo de un gestor paginado (un frame = un número de frame)."""
+
+    def __init__(self, manager: "PagedMemoryManager") -> None:
+        self.manager = manager
+        self.frames = manager.frames
+
+    def on_load(self, frame_number: int, tick: int) -> None:
+        """Se cargó una página en el frame (libre o recién desalojado)."""
+
+    def on_access(self, frame_number: int, tick: int) -> None:
+        """Acierto sobre una página residente."""
+
+    def on_evict(self, frame_number: int) -> None:
+        """El frame elegido como víctima se desaloja (aún conserva su página)."""
+
+    def on_free(self, frame_number: int) -> None:
+        """El frame se libera porque su proceso terminó (aún conserva su página)."""
+
+    @abstractmethod
+    def select_victim(self, pid: int, page_number: int, tick: int) -> Optional[int]:
+        """Frame a desalojar para cargar (pid, página); todos los frames están ocupados."""
+
+
+class FIFOPolicy(ReplacementPolicy):
+    def __init__(self, manager):
+        super().__init__(manager)
+        # Orden de carga (frame -> None, el primero es el más antiguo)
+        self.queue: "OrderedDict[int, None]" = OrderedDict()
+
+    def on_load(self, frame_number, tick):
+        self.queue[frame_number] = None
+        self.queue.move_to_end(frame_number)
+
+    def on_free(self, frame_number):
+        self.queue.pop(frame_number, None)
+
+    def select_victim(self, pid, page_number, tick):
+        return next(iter(self.queue), None)
+
+
+class _KeyHeapPolicy(ReplacementPolicy):
+    """Heap (clave, frame) con entradas perezosas: una entrada vale si el frame
+    está ocupado y su atributo `key` actual coincide."""
+
+    key = "loaded_tick"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self._heap: List[Tuple[int, int]] = []
+
+    def _push(self, frame_number: int) -> None:
+        heap, key = self._heap, self.key
+        if len(heap) > 2 * len(self.frames) + 64:
+            # Descartar entradas viejas: una por frame ocupado
+            heap[:] = [(getattr(f, key), f.frame_number) for f in self.frames if not f.free]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (getattr(self.frames[frame_number], key), frame_number))
+
+    def on_load(self, frame_number, tick):
+        self._push(frame_number)
+
+    def select_victim(self, pid, page_number, tick):
+        # Menor clave entre frames ocupados (empates: menor número de frame)
+        heap, frames, key = self._heap, self.frames, self.key
+        while heap:
+            value, frame_number = heap[0]
+            frame = frames[frame_number]
+            if not frame.free and getattr(frame, key) == value:
+                return frame_number
+            heapq.heappop(heap)
+        return None
+
+
+class LRUPolicy(_KeyHeapPolicy):
+    key = "last_accessed"
+
+    def on_access(self, frame_number, tick):
+        self._push(frame_number)
+
+
+class OptimalPolicy(_KeyHeapPolicy):
+    """Belady con `manager.oracle`; sin oráculo, el frame cargado hace más tiempo."""
+
+    key = "loaded_tick"
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self._next_use: Dict[int, float] = {}  # frame -> posición de su próximo uso
+        self._next_use_heap: List[Tuple[float, int]] = []  # (−próximo uso, frame)
+
+    def _push_next_use(self, frame_number: int) -> None:
+        frame = self.frames[frame_number]
+        next_use = self.manager.oracle.next_use(frame.process_pid, frame.page_number)
+        self._next_use[frame_number] = next_use
+        heap = self._next_use_heap
+        if len(heap) > 2 * len(self.frames) + 64:
+            # Descartar entradas viejas (incluye la del frame recién cargado)
+            heap[:] = [(-self._next_use[f.frame_number], f.frame_number) for f in self.frames if not f.free]
+            heapq.heapify(heap)
+        else:
+            heapq.heappush(heap, (-next_use, frame_number))
+
+    def on_load(self, frame_number, tick):
+        if self.manager.oracle is not None:
+            self._push_next_use(frame_number)
+        else:
+            self._push(frame_number)
+
+    def on_access(self, frame_number, tick):
+        if self.manager.oracle is not None:
+            self._push_next_use(frame_number)
+
+    def select_victim(self, pid, page_number, tick):
+        if self.manager.oracle is None:
+            return super().select_victim(pid, page_number, tick)
+        # Frame cuyo próximo uso está más lejos (empates: menor número de frame)
+        heap, frames, next_use = self._next_use_heap, self.frames, self._next_use
+        while heap:
+            value, frame_number = heap[0]
+            if not frames[frame_number].free and next_use.get(frame_number) == -value:
+                return frame_number
+            heapq.heappop(heap)
+        return None
+
+
+class ClockPolicy(ReplacementPolicy):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.hand = 0
+
+    def select_victim(self, pid, page_number, tick):
+        frames = self.frames
+        count = len(frames)
+        # A lo sumo dos vueltas: la primera limpia todos los bits de referencia
+        for _ in range(2 * count):
+            frame = frames[self.hand]
+            self.hand = (self.hand + 1) % count
+            if frame.free:
+                continue
+            if frame.referenced:
+                frame.referenced = False
+                continue
+            return frame.frame_number
+        return None
+
+
+class SecondChancePolicy(FIFOPolicy):
+    def select_victim(self, pid, page_number, tick):
+        queue, frames = self.queue, self.frames
+        for _ in range(len(queue) + 1):
+            frame_number = next(iter(queue), None)
+            if frame_number is None:
+                return None
+            frame = frames[frame_number]
+            if not frame.referenced:
+                return frame_number
+            # Segunda oportunidad: limpiar el bit y pasar al final de la cola
+            frame.referenced = False
+            queue.move_to_end(frame_number)
+        return next(iter(queue), None)
+
+
+class NRUPolicy(ReplacementPolicy):
+    reset_ticks = 50
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        # Clase (2·R + M) -> frames en orden de entrada a la clase
+        self.classes: List["OrderedDict[int, None]"] = [OrderedDict() for _ in range(4)]
+        self._class_of: Dict[int, int] = {}
+        self._epoch = 0
+
+    def _reset_epoch(self, tick: int) -> None:
+        # Interrupción de reloj: limpiar los bits de referencia (se aplica al
+        # primer evento del intervalo, así no depende de que se llame cada tick)
+        epoch = tick // self.reset_ticks
+        if epoch == self._epoch:
+            return
+        self._epoch = epoch
+        for referenced_class in (2, 3):
+            for frame_number in list(self.classes[referenced_class]):
+                self.frames[frame_number].referenced = False
+                self._classify(frame_number)
+
+    def _classify(self, frame_number: int) -> None:
+        frame = self.frames[frame_number]
+        new = 2 * frame.referenced + frame.modified
+        old = self._class_of.get(frame_number)
+        if old == new:
+            return
+        if old is not None:
+            del self.classes[old][frame_number]
+        self.classes[new][frame_number] = None
+        self._class_of[frame_number] = new
+
+    def _remove(self, frame_number: int) -> None:
+        old = self._class_of.pop(frame_number, None)
+        if old is not None:
+            del self.classes[old][frame_number]
+
+    def on_load(self, frame_number, tick):
+        self._reset_epoch(tick)
+        self._remove(frame_number)
+        self._classify(frame_number)
+
+    def on_access(self, frame_number, tick):
+        self._reset_epoch(tick)
+        self._classify(frame_number)
+
+    def on_evict(self, frame_number):
+        self._remove(frame_number)
+
+    on_free = on_evict
+
+    def select_victim(self, pid, page_number, tick):
+        self._reset_epoch(tick)
+        for frames in self.classes:
+            if frames:
+                return next(iter(frames))
+        return None
+
+
+class LFUPolicy(ReplacementPolicy):
+    aging_ticks = 100
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        # Frecuencia -> frames en orden de último uso (el primero, el menos reciente)
+        self.buckets: Dict[int, "OrderedDict[int, None]"] = {}
+        self.frequency: Dict[int, int] = {}
+        self._min_frequency = 0
+        self._epoch = 0
+
+    def _insert(self, frame_number: int, frequency: int) -> None:
+        self.frequency[frame_number] = frequency
+        self.buckets.setdefault(frequency, OrderedDict())[frame_number] = None
+        if frequency < self._min_frequency:
+            self._min_frequency = frequency
+
+    def _remove(self, frame_number: int) -> Optional[int]:
+        frequency = self.frequency.pop(frame_number, None)
+        if frequency is not None:
+            bucket = self.buckets[frequency]
+            del bucket[frame_number]
+            if not bucket:
+                del self.buckets[frequency]
+        return frequency
+
+    def _age(self, tick: int) -> None:
+        epoch = tick // self.aging_ticks
+        if epoch == self._epoch:
+            return
+        # Dividir las frecuencias a la mitad una vez por intervalo transcurrido
+        shift = min(epoch - self._epoch, 32)
+        self._epoch = epoch
+        old = sorted(self.buckets.items())
+        self.buckets = {}
+        self.frequency = {}
+        for frequency, frames in old:
+            for frame_number in frames:
+                self._insert(frame_number, frequency >> shift)
+        self._min_frequency = min(self.buckets, default=0)
+
+    def on_load(self, frame_number, tick):
+        self._age(tick)
+        self._remove(frame_number)
+        self._insert(frame_number, 1)
+
+    def on_access(self, frame_number, tick):
+        self._age(tick)
+        frequency = self._remove(frame_number) or 0
+        if frequency == self._min_frequency and frequency not in self.buckets:
+            self._min_frequency = frequency + 1
+        self._insert(frame_number, frequency + 1)
+
+    def on_evict(self, frame_number):
+        self._remove(frame_number)
+
+    on_free = on_evict
+
+    def select_victim(self, pid, page_number, tick):
+        self._age(tick)
+        if not self.buckets:
+            return None
+        if self._min_frequency not in self.buckets:
+            self._min_frequency = min(self.buckets)
+        return next(iter(self.buckets[self._min_frequency]))
+
+
+class ARCPolicy(ReplacementPolicy):
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.capacity = len(self.frames)
+        self.target_t1 = 0.0  # p: tamaño objetivo de T1
+        # Residentes por frame; fantasmas por (pid, página). El primero es el LRU.
+        self.t1: "OrderedDict[int, None]" = OrderedDict()
+        self.t2: "OrderedDict[int, None]" = OrderedDict()
+        self.b1: "OrderedDict[Tuple[int, int], None]" = OrderedDict()
+        self.b2: "OrderedDict[Tuple[int, int], None]" = OrderedDict()
+        # Decisiones de select_victim que se aplican al desalojar y al cargar
+        self._promote: Optional[Tuple[int, int]] = None  # fantasma acertado: entra a T2
+        self._drop_ghost = False  # caso IV con T1 lleno: su LRU sale sin fantasma
+
+    def _key(self, frame_number: int) -> Tuple[int, int]:
+        frame = self.frames[frame_number]
+        return frame.process_pid, frame.page_number
+
+    def _ghost_hit(self, key: Tuple[int, int]) -> bool:
+        """Casos II y III: adapta p según la lista fantasma acertada y retira el fantasma."""
+        if key in self.b1:
+            # Fallo que T1 más grande habría evitado: crecer p
+            self.target_t1 = min(self.capacity, self.target_t1 + max(len(self.b2) / len(self.b1), 1))
+            del self.b1[key]
+            return True
+        if key in self.b2:
+            self.target_t1 = max(0.0, self.target_t1 - max(len(self.b1) / len(self.b2), 1))
+            del self.b2[key]
+            return True
+        return False
+
+    def on_load(self, frame_number, tick):
+        key = self._key(frame_number)
+        promote = key == self._promote
+        self._promote = None
+        # Con frames libres no hubo select_victim: el fantasma se atiende aquí
+        if promote or self._ghost_hit(key):
+            self.t2[frame_number] = None
+        else:
+            self.t1[frame_number] = None
+        # Directorio acotado: |T1| + |B1| <= c y |T1| + |T2| + |B1| + |B2| <= 2c
+        while self.b1 and len(self.t1) + len(self.b1) > self.capacity:
+            self.b1.popitem(last=False)
+        while self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) > 2 * self.capacity:
+            self.b2.popitem(last=False)
+
+    def on_access(self, frame_number, tick):
+        # Segundo uso o posterior: MRU de T2
+        self.t1.pop(frame_number, None)
+        self.t2[frame_number] = None
+        self.t2.move_to_end(frame_number)
+
+    def on_evict(self, frame_number):
+        key = self._key(frame_number)
+        ghost = not self._drop_ghost
+        self._drop_ghost = False
+        if frame_number in self.t1:
+            del self.t1[frame_number]
+            if ghost:
+                self.b1[key] = None
+        elif frame_number in self.t2:
+            del self.t2[frame_number]
+            self.b2[key] = None
+
+    def on_free(self, frame_number):
+        self.t1.pop(frame_number, None)
+        self.t2.pop(frame_number, None)
+
+    def select_victim(self, pid, page_number, tick):
+        # Adaptación y mantenimiento del directorio antes de REPLACE, como en ARC
+        key = (pid, page_number)
+        in_b2 = key in self.b2
+        self._drop_ghost = False
+        if self._ghost_hit(key):
+            self._promote = key
+        else:
+            self._promote = None
+            if len(self.t1) + len(self.b1) >= self.capacity:
+                if len(self.t1) < self.capacity:
+                    if self.b1:
+                        self.b1.popitem(last=False)
+                elif self.t1:
+                    # Caso IV con T1 lleno: se desaloja su LRU sin pasarlo a B1
+                    self._drop_ghost = True
+                    return next(iter(self.t1))
+            elif self.b2 and len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2) >= 2 * self.capacity:
+                self.b2.popitem(last=False)
+        # REPLACE
+        t1_len = len(self.t1)
+        if self.t1 and (t1_len > self.target_t1 or (in_b2 and t1_len == self.target_t1)):
+            return next(iter(self.t1))
+        if self.t2:
+            return next(iter(self.t2))
+        return next(iter(self.t1), None)
+
+
+class WSClockPolicy(ReplacementPolicy):
+    window_ticks = 200
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.hand = 0
+
+    def select_victim(self, pid, page_number, tick):
+        frames = self.frames
+        count = len(frames)
+        dirty_candidate: Optional[int] = None
+        oldest: Optional[int] = None
+        for _ in range(2 * count):
+            frame = frames[self.hand]
+            self.hand = (self.hand + 1) % count
+            if frame.free:
+                continue
+            if frame.referenced:
+                # Usado desde la última pasada: sigue en el conjunto de trabajo
+                frame.referenced = False
+                continue
+            if oldest is None or frame.last_accessed < frames[oldest].last_accessed:
+                oldest = frame.frame_number
+            if tick - frame.last_accessed > self.window_ticks:
+                if not frame.modified:
+                    return frame.frame_number
+                if dirty_candidate is None:
+                    dirty_candidate = frame.frame_number
+        return dirty_candidate if dirty_candidate is not None else oldest
+
+
+REPLACEMENT_POLICIES: Dict[str, Type[ReplacementPolicy]] = {
+    "FIFO": FIFOPolicy,
+    "LRU": LRUPolicy,
+    "Optimal": OptimalPolicy,
+    "Clock": ClockPolicy,
+    "SecondChance": SecondChancePolicy,
+    "NRU": NRUPolicy,
+    "LFU": LFUPolicy,
+    "ARC": ARCPolicy,
+    "WSClock": WSClockPolicy,
+}
+
+
+def create_replacement_policy(name: str, manager: "PagedMemoryManager") -> ReplacementPolicy:
+    """Crea la política `name` para `manager` (desconocido = FIFO)."""
+    return REPLACEMENT_POLICIES.get(name, FIFOPolicy)(manager)
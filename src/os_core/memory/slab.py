@@ -0,0 +1,243 @@
+"""
+Asignador slab / segregated fit para la memoria contigua.
+
+Los procesos miden entre 4 y 64 MB (`SimulationEngine.create_process`). Cada
+solicitud se redondea a la menor clase de tamaño que la contiene (por defecto
+múltiplos de 4 MB) y se atiende así:
+
+- acierto: la caché de su clase tiene un bloque liberado antes; se reutiliza
+  el de menor dirección, sin buscar hueco;
+- fallo: se corta un bloque del tamaño de la clase del espacio libre general
+  (índice de huecos, First Fit). Si no hay hueco pero vaciar las cachés
+  abriría uno suficiente (un tramo de bloques en caché y libres contiguos),
+  se vacían (sus bloques vuelven al espacio libre y se fusionan) y se
+  reintenta; si no, la solicitud falla sin tocar las cachés.
+
+Al liberar, cada bloque del tamaño de una clase vuelve a la caché de su clase
+(hasta `max_cached` bloques por clase); el resto se libera normalmente. En el
+mapa de bloques, los bloques en caché pertenecen a `SLAB_CACHE_PID`: no se
+fusionan con sus vecinos y cuentan como memoria usada por el asignador, igual
+que las cachés slab de un kernel. Compactar (completa o incremental) vacía
+primero las cachés.
+
+Las solicitudes mayores que la clase más grande se asignan con su tamaño exacto.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..models import MemoryBlock, Process
+from .manager import AllocationResult, MemoryManager
+from .strategies import AllocationStrategy, FirstFitStrategy
+
+SLAB_CACHE_PID = -1
+DEFAULT_SIZE_CLASSES: Tuple[int, ...] = tuple(range(4, 65, 4))
+DEFAULT_MAX_CACHED = 8
+
+
+class SlabMemoryManager(MemoryManager):
+    """MemoryManager con clases de tamaño y cachés de bloques libres por clase."""
+
+    def __init__(
+        self,
+        total_mb: int,
+        algorithm_name: str = "slab",
+        strategy: Optional[AllocationStrategy] = None,
+        system_reserved_mb: int = 0,
+        size_classes: Optional[Sequence[int]] = None,
+        max_cached: int = DEFAULT_MAX_CACHED,
+        **kwargs,
+    ):
+        super().__init__(total_mb, algorithm_name, strategy or FirstFitStrategy(), system_reserved_mb=system_reserved_mb, **kwargs)
+        classes = sorted({int(c) for c in (size_classes or DEFAULT_SIZE_CLASSES) if int(c) > 0})
+        if not classes:
+            raise ValueError("El asignador slab necesita al menos una clase de tamaño positiva.")
+        self.size_classes: Tuple[int, ...] = tuple(classes)
+        self.max_cached = max(0, int(max_cached))
+        self._caches: Dict[int, List[int]] = {c: [] for c in self.size_classes}  # clase -> inicios
+        self._cached_mb = 0
+        # pid -> (MB del bloque, MB solicitados) para la fragmentación interna
+        self._allocations: Dict[int, Tuple[int, int]] = {}
+        self._internal_mb = 0
+        self._requested_mb = 0
+        self.hits = 0
+        self.misses = 0
+        self.flushes = 0
+        self.class_stats: Dict[int, Dict[str, int]] = {c: {"hits": 0, "misses": 0} for c in self.size_classes}
+
+    def size_class_for(self, size: int) -> Optional[int]:
+        """Menor clase >= size (None si supera la clase más grande)."""
+        i = bisect_left(self.size_classes, size)
+        return self.size_classes[i] if i < len(self.size_classes) else None
+
+    def can_fit(self, size: int) -> bool:
+        cls = self.size_class_for(size)
+        block_mb = cls if cls is not None else size
+        if cls is not None and self._caches[cls]:
+            return True
+        if self.free_holes.largest() >= block_mb:
+            return True
+        # Vaciar las cachés abre un hueco suficiente solo si hay un tramo contiguo
+        return self._flush_would_fit(block_mb)
+
+    def _flush_would_fit(self, block_mb: int) -> bool:
+        if not self._cached_mb or self.free_holes.free_mb() + self._cached_mb < block_mb:
+            return False
+        return self._flushed_hole_mb() >= block_mb
+
+    def _flushed_hole_mb(self) -> int:
+        """Mayor hueco que dejaría flush_caches(): tramos de bloques en caché y libres contiguos."""
+        block_map = self.block_map
+        reclaimable = (None, SLAB_CACHE_PID)
+        largest = 0
+        seen = set()
+        for cache in self._caches.values():
+            for start in cache:
+                if start in seen:
+                    continue
+                block = block_map.at(start)
+                prev = block_map.prev_of(block)
+                while prev is not None and prev.process_pid in reclaimable:
+                    block, prev = prev, block_map.prev_of(prev)
+                run = 0
+                while block is not None and block.process_pid in reclaimable:
+                    if block.process_pid == SLAB_CACHE_PID:
+                        seen.add(block.start)
+                    run += block.size
+                    block = block_map.next_of(block)
+                largest = max(largest, run)
+        return largest
+
+    # --- Asignación ----------------------------------------------------------
+    def _result(self, success: bool, cache_hit: Optional[bool]) -> AllocationResult:
+        return AllocationResult(
+            success, self.fragmentation_ratio(), self.efficiency(), self.algorithm,
+            internal_fragmentation=self.internal_fragmentation_ratio(),
+            cache_hit=cache_hit,
+        )
+
+    def _carve(self, size: int, pid: int) -> bool:
+        start = self.strategy.find_hole(self.free_holes, size)
+        if start is None:
+            return False
+        self.free_holes.remove(start)
+        _, remainder = self.block_map.split(self.block_map.at(start), size, pid)
+        if remainder is not None:
+            self.free_holes.add(remainder.start, remainder.size)
+        return True
+
+    def allocate(self, process: Process) -> AllocationResult:
+        size = process.size_mb
+        cls = self.size_class_for(size)
+        block_mb = cls if cls is not None else size
+        cache = self._caches.get(cls) if cls is not None else None
+        hit: Optional[bool] = None
+        if cache:
+            start = cache.pop(0)
+            self._cached_mb -= cls
+            self.block_map.reassign(self.block_map.at(start), process.pid)
+            hit = True
+        else:
+            if cls is not None:
+                hit = False
+            if not self._carve(block_mb, process.pid):
+                # Sin hueco: devolver las cachés al espacio libre y reintentar,
+                # solo si eso abre un hueco suficiente
+                if not self._flush_would_fit(block_mb):
+                    return self._result(False, hit)
+                self.flush_caches()
+                self._carve(block_mb, process.pid)
+        if cls is not None:
+            stats = self.class_stats[cls]
+            if hit:
+                self.hits += 1
+                stats["hits"] += 1
+            else:
+                self.misses += 1
+                stats["misses"] += 1
+        self._allocations[process.pid] = (block_mb, size)
+        self._internal_mb += block_mb - size
+        self._requested_mb += size
+        self.allocated_processes[process.pid] = size
+        process.memory_usage_mb = size
+        return self._result(True, hit)
+
+    def release(self, process: Process):
+        for block in self.block_map.owned_by(process.pid):
+            cache = self._caches.get(block.size)
+            # Durante una pasada de compactación no se retienen bloques
+            if cache is not None and len(cache) < self.max_cached and not self._compacting:
+                self.block_map.reassign(block, SLAB_CACHE_PID)
+                insort(cache, block.start)
+                self._cached_mb += block.size
+            else:
+                self._free_block(block)
+        block_mb, requested = self._allocations.pop(process.pid, (0, 0))
+        self._internal_mb -= block_mb - requested
+        self._requested_mb -= requested
+        self.allocated_processes.pop(process.pid, None)
+        process.memory_usage_mb = 0
+        if self.auto_compact:
+            self.check_and_compact()
+
+    def flush_caches(self) -> int:
+        """Devuelve los bloques en caché al espacio libre. Retorna los MB liberados."""
+        freed = self._cached_mb
+        if not freed:
+            return 0
+        for cache in self._caches.values():
+            for start in cache:
+                self._free_block(self.block_map.at(start))
+            cache.clear()
+        self._cached_mb = 0
+        self.flushes += 1
+        return freed
+
+    def _begin_compaction(self) -> None:
+        self.flush_caches()
+
+    def _grow_system_block(self, growth: int) -> bool:
+        if super()._grow_system_block(growth):
+            return True
+        # El bloque que sigue a la reserva puede estar retenido en una caché
+        following = self.block_map.next_of(self.block_map.first())
+        if following is not None and following.process_pid == SLAB_CACHE_PID and self.flush_caches():
+            return super()._grow_system_block(growth)
+        return False
+
+    # --- Fragmentación y eficiencia ------------------------------------------
+    def cached_mb(self) -> int:
+        return self._cached_mb
+
+    def internal_fragmentation(self) -> int:
+        """MB asignados por encima de lo solicitado (redondeo a la clase)."""
+        return self._internal_mb
+
+    def internal_fragmentation_ratio(self) -> float:
+        return self._internal_mb / self.total_mb
+
+    def compaction_pressure(self) -> float:
+        # Compactar no corrige el redondeo interno: solo cuenta la externa
+        return MemoryManager.fragmentation_ratio(self)
+
+    def fragmentation_ratio(self) -> float:
+        return (self._internal_mb + self.fragmented_free_space()) / self.total_mb
+
+    def efficiency(self) -> float:
+        # Solo cuenta lo solicitado: el redondeo y las cachés no son memoria útil
+        return (self._requested_mb / self.total_mb) * (1 - self.fragmentation_ratio())
+
+    def cache_stats(self) -> Dict[str, object]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "flushes": self.flushes,
+            "cached_mb": self._cached_mb,
+            "classes": {c: dict(s) for c, s in self.class_stats.items()},
+        }
+
+    def snapshot_blocks(self) -> List[MemoryBlock]:
+        return self.block_map.snapshot()
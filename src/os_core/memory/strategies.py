@@ -1,12 +1,23 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from ..models import MemoryBlock
+from .free_holes import FreeHoleIndex
 
 class AllocationStrategy(ABC):
     @abstractmethod
     def find_block(self, blocks: List[MemoryBlock], size: int) -> Optional[int]:
         pass
 
+    def find_hole(self, holes: FreeHoleIndex, size: int) -> Optional[int]:
+        """Dirección de inicio del hueco elegido usando el índice de huecos libres.
+
+        Por defecto aplica `find_block` sobre los huecos en orden de dirección;
+        las estrategias con una consulta indexada la sobrescriben.
+        """
+        free_blocks = holes.holes()
+        index = self.find_block(free_blocks, size)
+        return None if index is None else free_blocks[index].start
+
 class FirstFitStrategy(AllocationStrategy):
     def find_block(self, blocks: List[MemoryBlock], size: int) -> Optional[int]:
         for i, b in enumerate(blocks):
@@ -14,6 +25,9 @@ class FirstFitStrategy(AllocationStrategy):
                 return i
         return None
 
+    def find_hole(self, holes: FreeHoleIndex, size: int) -> Optional[int]:
+        return holes.first_fit(size)
+
 class BestFitStrategy(AllocationStrategy):
     def find_block(self, blocks: List[MemoryBlock], size: int) -> Optional[int]:
         free_blocks = [b for b in blocks if b.free and b.size >= size]
@@ -22,6 +36,9 @@ class BestFitStrategy(AllocationStrategy):
         best_block = min(free_blocks, key=lambda b: b.size)
         return blocks.index(best_block)
 
+    def find_hole(self, holes: FreeHoleIndex, size: int) -> Optional[int]:
+        return holes.best_fit(size)
+
 class WorstFitStrategy(AllocationStrategy):
     def find_block(self, blocks: List[MemoryBlock], size: int) -> Optional[int]:
         free_blocks = [b for b in blocks if b.free and b.size >= size]
@@ -29,3 +46,6 @@ class WorstFitStrategy(AllocationStrategy):
             return None
         worst_block = max(free_blocks, key=lambda b: b.size)
         return blocks.index(worst_block)
+
+    def find_hole(self, holes: FreeHoleIndex, size: int) -> Optional[int]:
+        return holes.worst_fit(size)
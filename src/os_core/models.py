@@ -1,10 +1,35 @@
-from dataclasses import dataclass, field
-from typing import Optional
+from dataclasses import dataclass, field, fields
+from typing import Optional, Tuple
 import itertools
 import random
 
 _process_id_counter = itertools.count(1)
 
+REGISTER_NAMES = ("AX", "BX", "CX", "DX")
+
+
+def add_slots(cls=None, *, extra: Tuple[str, ...] = ()):
+    """Recrea un dataclass con `__slots__` (sin `__dict__` por instancia).
+
+    Equivale a `@dataclass(slots=True)` de Python 3.10+, que no está disponible
+    en 3.8. `extra` agrega slots que no son campos del dataclass.
+    """
+    def wrap(cls):
+        names = tuple(f.name for f in fields(cls)) + tuple(extra)
+        namespace = dict(cls.__dict__)
+        for name in names:
+            # Los valores por defecto ya están en __init__; como atributos de
+            # clase chocarían con los slots
+            namespace.pop(name, None)
+        namespace.pop("__dict__", None)
+        namespace.pop("__weakref__", None)
+        namespace["__slots__"] = names
+        return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+    return wrap if cls is None else wrap(cls)
+
+
+@add_slots(extra=("process_table",))
 @dataclass
 class Process:
     name: str
@@ -18,7 +43,7 @@ class Process:
     has_error: bool = False  # Marca si el proceso fallará
     # PCB detallado - Complejidad del proceso
     program_counter: int = 0  # Contador de programa (inicia en 0)
-    registers: dict = field(default_factory=lambda: {"AX": 0, "BX": 0, "CX": 0, "DX": 0})  # Registros de CPU
+    registers: Optional[dict] = None  # Registros de CPU; se crean al primer acceso (ver Process.registers)
     memory_start_address: int = 0  # Dirección física base (hexadecimal simulado)
     cpu_usage: float = 0.0  # porcentaje 0-100
     memory_usage_mb: int = 0  # asignado real
@@ -36,7 +61,7 @@ class Process:
     waiting_ticks: int = 0
     cpu_id: Optional[int] = None  # ID of the CPU running this process
     quantum_used: int = 0 # Ticks used in current quantum (for RR)
-    io_remaining_ticks: int = 0  # Ticks restantes de I/O cuando está en WAITING
+    io_remaining_ticks: int = 0  # Ticks de espera asignados al entrar en WAITING (restante: engine.io_remaining)
     io_total_ticks: int = 0  # Ticks totales de I/O asignados
     interrupt_type: Optional[str] = None  # Tipo de interrupción actual (IO, SEMAPHORE_BLOCK, etc.)
     io_probability: float = 0.15  # Probabilidad de solicitar I/O en un tick
@@ -44,6 +69,8 @@ class Process:
     hardware_interrupt_probability: float = 0.02  # Sensibilidad a interrupciones de hardware
     last_interrupt_tick: Optional[int] = None
     pending_fault_page: Optional[int] = None # Página que causó el fallo pendiente de carga
+    # Slot extra `process_table`: tabla (ProcessTable) que indexa este proceso por
+    # estado. No es un campo (ni de asdict/repr); la asigna la tabla al registrarlo.
     
     def get_total_segment_size(self) -> int:
         """Calcula el tamaño total a partir de la suma de los segmentos."""
@@ -53,11 +80,14 @@ class Process:
         """Valida que size_mb sea igual a la suma de los segmentos."""
         return self.size_mb == self.get_total_segment_size()
     
-    def tick(self):
-        if self.state == "TERMINATED":
+    def tick(self, rng: Optional[random.Random] = None):
+        rng = rng if rng is not None else random
+        # Un proceso bloqueado no ejecuta: su uso de CPU tampoco fluctúa
+        state = self.state
+        if state == "TERMINATED" or state == "WAITING":
             return
-            
-        if self.state == "RUNNING":
+
+        if state == "RUNNING":
             self.remaining_ticks -= 1
             if self.remaining_ticks <= 0:
                 self.remaining_ticks = 0
@@ -65,20 +95,56 @@ class Process:
             else:
                 # Simular actividad del proceso: incrementar program counter
                 # Simula ejecución de instrucciones (4 a 16 bytes por tick)
-                pc_increment = random.randint(4, 16)
+                pc_increment = rng.randint(4, 16)
                 self.program_counter += pc_increment
                 
                 # Modificar aleatoriamente uno de los registros para mostrar actividad
                 if self.registers:
-                    register_name = random.choice(list(self.registers.keys()))
+                    register_name = rng.choice(list(self.registers.keys()))
                     # Modificar el registro con un valor aleatorio (simula operaciones)
-                    self.registers[register_name] = (self.registers[register_name] + random.randint(-100, 100)) & 0xFFFF
+                    self.registers[register_name] = (self.registers[register_name] + rng.randint(-100, 100)) & 0xFFFF
 
         # Simular fluctuación CPU
-        self.cpu_usage = max(0.0, min(100.0, self.cpu_usage + random.uniform(-10, 10)))
+        self.cpu_usage = max(0.0, min(100.0, self.cpu_usage + rng.uniform(-10, 10)))
         # Logic moved to Engine/Scheduler to control execution flow
 
 
+# Descriptores de los slots `state` y `registers`; las properties de abajo los envuelven
+_STATE_SLOT = Process.state
+_REGISTERS_SLOT = Process.registers
+
+
+def _set_process_state(process: Process, value: str) -> None:
+    # Cada transición se avisa a la tabla de procesos (índices por estado)
+    try:
+        old = _STATE_SLOT.__get__(process)
+    except AttributeError:
+        # Primera asignación (desde __init__): todavía no pertenece a una tabla
+        _STATE_SLOT.__set__(process, value)
+        process.process_table = None
+        return
+    _STATE_SLOT.__set__(process, value)
+    table = process.process_table
+    if table is not None and old != value:
+        table.state_changed(process, old, value)
+
+
+def _get_process_registers(process: Process) -> dict:
+    registers = _REGISTERS_SLOT.__get__(process)
+    if registers is None:
+        # La mayoría de los procesos nunca ejecuta ni se inspecciona: los
+        # registros se crean recién cuando alguien los pide
+        registers = dict.fromkeys(REGISTER_NAMES, 0)
+        _REGISTERS_SLOT.__set__(process, registers)
+    return registers
+
+
+# La lectura de `state` es el descriptor del slot (sin llamada Python)
+Process.state = property(_STATE_SLOT.__get__, _set_process_state)
+Process.registers = property(_get_process_registers, _REGISTERS_SLOT.__set__)
+
+
+@add_slots
 @dataclass
 class CPU:
     """Representa una CPU lógica con soporte de hilos internos."""
@@ -101,8 +167,9 @@ class CPU:
         self.process = None
         self.threads_in_use = 0
 
-    def tick(self):
+    def tick(self, rng: Optional[random.Random] = None):
         """Avanza la ejecución del proceso usando los hilos disponibles."""
+        rng = rng if rng is not None else random
         if not self.process:
             return
         p = self.process
@@ -114,9 +181,10 @@ class CPU:
             p.remaining_ticks = 0
             p.state = "TERMINATED"
         # Ajuste de uso de CPU simulado
-        p.cpu_usage = max(0.0, min(100.0, p.cpu_usage + random.uniform(-5, 5)))
+        p.cpu_usage = max(0.0, min(100.0, p.cpu_usage + rng.uniform(-5, 5)))
 
 
+@add_slots
 @dataclass
 class MemoryBlock:
     start: int
@@ -132,6 +200,7 @@ class MemoryBlock:
         return self.process_pid is None
 
 
+@add_slots
 @dataclass
 class Page:
     """Representa una página de memoria física."""
@@ -148,6 +217,7 @@ class Page:
         return self.process_pid is None
 
 
+@add_slots
 @dataclass
 class PageTableEntry:
     """Entrada en la tabla de páginas de un proceso."""
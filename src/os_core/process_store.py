@@ -0,0 +1,270 @@
+"""
+Almacén columnar (struct-of-arrays) de procesos sobre NumPy.
+
+Con `SimulationEngine(process_store="columnar")` los campos numéricos de cada
+proceso (estado, prioridad, ticks restantes, espera, uso de CPU, registros...)
+viven en arreglos NumPy, una fila por proceso. Los objetos `Process` que ven la
+GUI, la consola y los planificadores son vistas livianas (`ColumnarProcess`)
+sobre su fila, de modo que el resto del simulador no cambia.
+
+Las actualizaciones por tick que tocan a muchos procesos (tiempo de espera en
+READY, fluctuación de uso de CPU) se aplican como operaciones vectorizadas sobre
+las columnas en lugar de recorrer objetos.
+
+Al retirar un proceso de la tabla, su vista se "desprende": sus valores se
+copian a los slots de `Process` y el objeto pasa a ser un `DetachedProcess`
+(un `Process` común), así que las referencias que conserve la GUI siguen
+siendo válidas aunque la fila se reutilice.
+"""
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .models import _REGISTERS_SLOT, _STATE_SLOT, REGISTER_NAMES, Process
+from .process_table import PROCESS_STATES
+
+try:  # NumPy es opcional: solo lo requiere el modo columnar
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+STATE_CODES: Dict[str, int] = {state: code for code, state in enumerate(PROCESS_STATES)}
+FREE_ROW = -1  # Código de estado de una fila libre
+NO_CPU = -1  # cpu_id None
+
+# Columnas enteras (int64) y su equivalente en Process
+INT_COLUMNS = (
+    "priority",
+    "arrival_tick",
+    "duration_ticks",
+    "remaining_ticks",
+    "waiting_ticks",
+    "io_remaining_ticks",
+    "program_counter",
+    "memory_usage_mb",
+)
+FLOAT_COLUMNS = ("cpu_usage",)
+
+INITIAL_CAPACITY = 1024
+
+
+class RegisterView(MutableMapping):
+    """Registros AX..DX de un proceso columnar, como diccionario."""
+
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ProcessStore", row: int) -> None:
+        self._store = store
+        self._row = row
+
+    def __getitem__(self, name: str) -> int:
+        return int(self._store.registers[self._row, REGISTER_NAMES.index(name)])
+
+    def __setitem__(self, name: str, value: int) -> None:
+        if name not in REGISTER_NAMES:
+            raise KeyError(f"Registro desconocido: {name!r} (use {', '.join(REGISTER_NAMES)})")
+        self._store.registers[self._row, REGISTER_NAMES.index(name)] = value
+
+    def __delitem__(self, name: str) -> None:
+        raise TypeError("Los registros de un proceso columnar son fijos.")
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(REGISTER_NAMES)
+
+    def __len__(self) -> int:
+        return len(REGISTER_NAMES)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def _int_property(name: str) -> property:
+    def fget(self) -> int:
+        return int(getattr(self._store, name)[self._row])
+
+    def fset(self, value: int) -> None:
+        getattr(self._store, name)[self._row] = value
+
+    return property(fget, fset)
+
+
+def _float_property(name: str) -> property:
+    def fget(self) -> float:
+        return float(getattr(self._store, name)[self._row])
+
+    def fset(self, value: float) -> None:
+        getattr(self._store, name)[self._row] = value
+
+    return property(fget, fset)
+
+
+class ColumnarProcess(Process):
+    """Vista de un proceso cuyos campos numéricos viven en un ProcessStore."""
+
+    __slots__ = ("_store", "_row")
+
+    @property
+    def state(self) -> str:
+        return PROCESS_STATES[self._store.state[self._row]]
+
+    @state.setter
+    def state(self, value: str) -> None:
+        codes = self._store.state
+        row = self._row
+        old_code = int(codes[row])
+        codes[row] = STATE_CODES[value]
+        old = PROCESS_STATES[old_code] if old_code != FREE_ROW else None
+        table = self.process_table
+        if table is not None and old != value:
+            table.state_changed(self, old, value)
+
+    @property
+    def cpu_id(self) -> Optional[int]:
+        value = int(self._store.cpu_id[self._row])
+        return None if value == NO_CPU else value
+
+    @cpu_id.setter
+    def cpu_id(self, value: Optional[int]) -> None:
+        self._store.cpu_id[self._row] = NO_CPU if value is None else value
+
+    @property
+    def registers(self) -> RegisterView:
+        return RegisterView(self._store, self._row)
+
+    @registers.setter
+    def registers(self, values: Optional[Dict[str, int]]) -> None:
+        view = RegisterView(self._store, self._row)
+        for name in REGISTER_NAMES:
+            view[name] = 0
+        for name, value in (values or {}).items():
+            view[name] = value
+
+
+for _name in INT_COLUMNS:
+    setattr(ColumnarProcess, _name, _int_property(_name))
+for _name in FLOAT_COLUMNS:
+    setattr(ColumnarProcess, _name, _float_property(_name))
+del _name
+
+# Columnas por fila (las que se copian al crecer el almacén)
+ROW_COLUMNS = ("pid", "state", "cpu_id", "registers") + INT_COLUMNS + FLOAT_COLUMNS
+
+
+class DetachedProcess(Process):
+    """Proceso retirado de su ProcessStore: sus valores viven en los slots de Process.
+
+    Tiene los mismos slots que ColumnarProcess, así que una vista puede
+    convertirse en él en el lugar (asignando `__class__`).
+    """
+
+    __slots__ = ("_store", "_row")
+
+
+class ProcessStore:
+    """Columnas NumPy de procesos, una fila por proceso vivo."""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        if np is None:
+            raise ImportError("El almacén columnar de procesos requiere NumPy (pip install numpy).")
+        capacity = max(1, int(capacity))
+        self.pid = np.zeros(capacity, dtype=np.int64)
+        self.state = np.full(capacity, FREE_ROW, dtype=np.int8)
+        self.cpu_id = np.full(capacity, NO_CPU, dtype=np.int16)
+        for name in INT_COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.int64))
+        for name in FLOAT_COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.registers = np.zeros((capacity, len(REGISTER_NAMES)), dtype=np.int64)
+        self._free_rows: List[int] = []
+        self._high = 0  # Filas usadas alguna vez (las libres tienen estado FREE_ROW)
+
+    # --- Filas -----------------------------------------------------------
+    @property
+    def capacity(self) -> int:
+        return len(self.pid)
+
+    def __len__(self) -> int:
+        return self._high - len(self._free_rows)
+
+    def _grow(self) -> None:
+        old = self.capacity
+        new = old * 2
+        for name in ROW_COLUMNS:
+            if name == "state":
+                continue
+            column = getattr(self, name)
+            grown = np.zeros((new,) + column.shape[1:], dtype=column.dtype)
+            grown[:old] = column
+            setattr(self, name, grown)
+        state = np.full(new, FREE_ROW, dtype=np.int8)
+        state[:old] = self.state
+        self.state = state
+        self.cpu_id[old:] = NO_CPU
+
+    def _allocate_row(self) -> int:
+        if self._free_rows:
+            return self._free_rows.pop()
+        if self._high >= self.capacity:
+            self._grow()
+        row = self._high
+        self._high += 1
+        return row
+
+    def new_process(self, **fields) -> ColumnarProcess:
+        """Crea un proceso con sus campos numéricos en una fila nueva."""
+        row = self._allocate_row()
+        process = ColumnarProcess.__new__(ColumnarProcess)
+        process._store = self
+        process._row = row
+        process.process_table = None
+        Process.__init__(process, **fields)
+        self.pid[row] = process.pid
+        return process
+
+    def release(self, process: Process) -> None:
+        """Desprende la vista (copia su fila a los slots de Process) y libera la fila."""
+        if not isinstance(process, ColumnarProcess) or process._store is not self:
+            return
+        row = process._row
+        values = {name: getattr(process, name) for name in INT_COLUMNS + FLOAT_COLUMNS}
+        state, cpu_id, registers = process.state, process.cpu_id, dict(process.registers)
+        process.__class__ = DetachedProcess
+        process._store = None
+        for name, value in values.items():
+            setattr(process, name, value)
+        # Directo a los slots: el proceso ya salió de su tabla (sin avisar transiciones)
+        _STATE_SLOT.__set__(process, state)
+        _REGISTERS_SLOT.__set__(process, registers)
+        process.cpu_id = cpu_id
+        self.state[row] = FREE_ROW
+        self.cpu_id[row] = NO_CPU
+        self._free_rows.append(row)
+
+    def clear(self) -> None:
+        self._free_rows.clear()
+        self._high = 0
+        self.state[:] = FREE_ROW
+        self.cpu_id[:] = NO_CPU
+
+    # --- Operaciones vectorizadas ------------------------------------------
+    def mask(self, states: Sequence[str]):
+        """Máscara booleana (sobre las filas usadas) de los procesos en `states`."""
+        codes = self.state[: self._high]
+        if len(states) == 1:
+            return codes == STATE_CODES[states[0]]
+        return np.isin(codes, [STATE_CODES[s] for s in states])
+
+    def increment_waiting_ticks(self, state: str = "READY") -> None:
+        """waiting_ticks += 1 para todos los procesos en `state`."""
+        self.waiting_ticks[: self._high][self.mask((state,))] += 1
+
+    def jitter_cpu_usage(self, randomness, tick: int, salt: str, spread: float, states: Sequence[str]) -> None:
+        """cpu_usage += U(-spread, spread) (sorteo por pid y tick), acotado a [0, 100]."""
+        mask = self.mask(states)
+        if not mask.any():
+            return
+        pids = self.pid[: self._high][mask]
+        draws = randomness.probability_array(pids, tick, salt)
+        usage = self.cpu_usage[: self._high]
+        usage[mask] = np.clip(usage[mask] + (draws * (2 * spread) - spread), 0.0, 100.0)
@@ -0,0 +1,121 @@
+"""
+Tabla de procesos indexada por estado.
+
+`ProcessTable` es un diccionario pid -> Process (compatible con el uso previo de
+`engine.processes`) que además mantiene un índice por estado. Cada proceso
+registrado notifica sus transiciones a la tabla (ver `Process.state`), de modo
+que las fases del tick recorren solo los procesos del estado que les interesa y
+los conteos por estado son O(1).
+
+Los índices son diccionarios pid -> Process. NEW y el conjunto de activos solo
+reciben procesos en su creación, por lo que conservan el orden de pid; el resto
+se ordena bajo demanda (`in_state(..., ordered=True)`) cuando el orden importa.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from .models import Process
+
+PROCESS_STATES = ("NEW", "READY", "RUNNING", "WAITING", "TERMINATED")
+
+
+class ProcessTable(dict):
+    """Diccionario pid -> Process con índices por estado."""
+
+    def __init__(self, store: Optional[object] = None) -> None:
+        super().__init__()
+        # Almacén columnar opcional (ProcessStore); None = procesos como objetos
+        self.store = store
+        self._by_state: Dict[str, Dict[int, Process]] = {state: {} for state in PROCESS_STATES}
+        # Procesos no terminados, en orden de creación (== orden de pid)
+        self._active: Dict[int, Process] = {}
+
+    # --- Registro --------------------------------------------------------
+    def __setitem__(self, pid: int, process: Process) -> None:
+        previous = self.get(pid)
+        if previous is not None and previous is not process:
+            self._unindex(previous)
+            self._release(previous)
+        super().__setitem__(pid, process)
+        process.process_table = self
+        self._index(process, process.state)
+
+    def __delitem__(self, pid: int) -> None:
+        process = self[pid]
+        super().__delitem__(pid)
+        self._unindex(process)
+        self._release(process)
+
+    def pop(self, pid: int, *default):
+        if pid not in self:
+            if default:
+                return default[0]
+            raise KeyError(pid)
+        process = self[pid]
+        del self[pid]
+        return process
+
+    def clear(self) -> None:
+        for process in self.values():
+            process.process_table = None
+            self._release(process)
+        super().clear()
+        if self.store is not None:
+            self.store.clear()
+        for index in self._by_state.values():
+            index.clear()
+        self._active.clear()
+
+    def new_process(self, **fields) -> Process:
+        """Crea un proceso (vista columnar si la tabla tiene almacén). No lo registra."""
+        if self.store is not None:
+            return self.store.new_process(**fields)
+        return Process(**fields)
+
+    def _release(self, process: Process) -> None:
+        if self.store is not None:
+            self.store.release(process)
+
+    def _index(self, process: Process, state: str) -> None:
+        self._by_state.setdefault(state, {})[process.pid] = process
+        if state != "TERMINATED":
+            self._active[process.pid] = process
+
+    def _unindex(self, process: Process) -> None:
+        process.process_table = None
+        self._by_state.get(process.state, {}).pop(process.pid, None)
+        self._active.pop(process.pid, None)
+
+    def state_changed(self, process: Process, old: str, new: str) -> None:
+        """Llamado por `Process` al cambiar de estado."""
+        pid = process.pid
+        self._by_state.get(old, {}).pop(pid, None)
+        self._by_state.setdefault(new, {})[pid] = process
+        if new == "TERMINATED":
+            self._active.pop(pid, None)
+        elif old == "TERMINATED":
+            self._active[pid] = process
+            # Volver de TERMINATED rompe el orden de creación: reordenar
+            self._active = dict(sorted(self._active.items()))
+
+    # --- Consultas -------------------------------------------------------
+    def in_state(self, state: str, ordered: bool = False) -> List[Process]:
+        """Procesos en `state` (copia; segura si el recorrido cambia estados)."""
+        index = self._by_state.get(state, {})
+        if ordered:
+            return [index[pid] for pid in sorted(index)]
+        return list(index.values())
+
+    def count(self, state: str) -> int:
+        return len(self._by_state.get(state, ()))
+
+    def counts(self) -> Dict[str, int]:
+        return {state: len(index) for state, index in self._by_state.items()}
+
+    def active(self) -> List[Process]:
+        """Procesos no terminados en orden de pid."""
+        return list(self._active.values())
+
+    def active_count(self) -> int:
+        return len(self._active)
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Deque, Dict
+from typing import Any, Callable, Iterator, List, Optional, Deque, Dict
 from collections import deque
+import heapq
+import itertools
 from .models import Process
 
 class Dispatcher:
@@ -19,15 +21,133 @@ class Dispatcher:
 
         self.context_switch_count += 1
 
-class Scheduler(ABC):
+
+class ReadyQueue:
+    """Cola READY FIFO: encolar y despachar en O(1)."""
+
     def __init__(self):
-        self.ready_queue: List[Process] = []
+        self._items: Deque[Process] = deque()
+
+    def push(self, process: Process):
+        self._items.append(process)
+
+    # Compatibilidad con el uso como lista
+    append = push
+
+    def pop(self) -> Optional[Process]:
+        return self._items.popleft() if self._items else None
+
+    def peek(self) -> Optional[Process]:
+        return self._items[0] if self._items else None
+
+    def remove(self, process: Process) -> bool:
+        try:
+            self._items.remove(process)
+            return True
+        except ValueError:
+            return False
+
+    def rebuild(self):
+        """Reordena tras cambios de clave (no aplica en FIFO)."""
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[Process]:
+        return iter(list(self._items))
+
+    def __contains__(self, process: object) -> bool:
+        return process in self._items
+
+
+class HeapReadyQueue(ReadyQueue):
+    """
+    Cola de prioridad indexada por PID: heap binario con borrado perezoso.
+    Encolar, despachar y consultar el mínimo cuestan O(log n); los empates se
+    resuelven por orden de llegada a la cola (igual que un sort estable).
+    """
+
+    def __init__(self, key: Callable[[Process], Any]):
+        self.key = key
+        self._heap: List[list] = []  # [clave, secuencia, proceso | None]
+        self._entries: Dict[int, list] = {}
+        self._seq = itertools.count()
+
+    def push(self, process: Process):
+        self.remove(process)
+        entry = [self.key(process), next(self._seq), process]
+        self._entries[process.pid] = entry
+        heapq.heappush(self._heap, entry)
+
+    append = push
+
+    def _prune(self):
+        heap = self._heap
+        while heap and heap[0][2] is None:
+            heapq.heappop(heap)
+
+    def pop(self) -> Optional[Process]:
+        self._prune()
+        if not self._heap:
+            return None
+        entry = heapq.heappop(self._heap)
+        process = entry[2]
+        del self._entries[process.pid]
+        return process
+
+    def peek(self) -> Optional[Process]:
+        self._prune()
+        return self._heap[0][2] if self._heap else None
+
+    def remove(self, process: Process) -> bool:
+        entry = self._entries.pop(process.pid, None)
+        if entry is None:
+            return False
+        entry[2] = None  # Marca de borrado; se descarta al llegar a la cima
+        if len(self._heap) > 2 * len(self._entries) + 32:
+            self._heap = [e for e in self._heap if e[2] is not None]
+            heapq.heapify(self._heap)
+        return True
+
+    def rebuild(self):
+        """Recalcula las claves (p.ej. tras aging) conservando el orden previo en los empates."""
+        ordered = sorted(self._entries.values())
+        self._heap = []
+        self._entries = {}
+        for entry in ordered:
+            process = entry[2]
+            new_entry = [self.key(process), next(self._seq), process]
+            self._entries[process.pid] = new_entry
+            self._heap.append(new_entry)
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Process]:
+        """Procesos en orden de despacho (O(n log n), pensado para la GUI)."""
+        return iter([entry[2] for entry in sorted(self._entries.values())])
+
+    def __contains__(self, process: object) -> bool:
+        return getattr(process, "pid", None) in self._entries
+
+class Scheduler(ABC):
+    # Clave de orden de la cola READY (menor = antes); None = FIFO
+    queue_key: Optional[Callable[[Process], Any]] = None
+
+    def __init__(self, ready_queue: Optional[ReadyQueue] = None):
+        self.ready_queue: ReadyQueue = ready_queue if ready_queue is not None else self._create_ready_queue()
         self.current_process: Optional[Process] = None
         self.dispatcher = Dispatcher()
 
+    def _create_ready_queue(self) -> ReadyQueue:
+        if self.queue_key is None:
+            return ReadyQueue()
+        return HeapReadyQueue(self.queue_key)
+
     def add_process(self, process: Process):
         process.state = "READY"
-        self.ready_queue.append(process)
+        self.ready_queue.push(process)
 
     @abstractmethod
     def next_process(self, current_tick: int) -> Optional[Process]:
@@ -41,51 +161,48 @@ class Scheduler(ABC):
         self.current_process = next_process
 
 class FCFS(Scheduler):
+    queue_key = staticmethod(lambda p: (p.priority, p.arrival_tick))
+
     def next_process(self, current_tick: int) -> Optional[Process]:
         if self.current_process and self.current_process.state == "RUNNING":
             return self.current_process
 
-        if self.ready_queue:
-            self.ready_queue.sort(key=lambda p: (p.priority, p.arrival_tick))
-            next_proc = self.ready_queue.pop(0)
+        next_proc = self.ready_queue.pop()
+        if next_proc is not None:
             self.perform_context_switch(next_proc)
-            return next_proc
-        return None
+        return next_proc
 
 class SJF(Scheduler):
+    queue_key = staticmethod(lambda p: (p.priority, p.duration_ticks))
+
     def next_process(self, current_tick: int) -> Optional[Process]:
         if self.current_process and self.current_process.state == "RUNNING":
             return self.current_process
 
-        if self.ready_queue:
-            shortest = min(self.ready_queue, key=lambda p: (p.priority, p.duration_ticks))
-            self.ready_queue.remove(shortest)
+        shortest = self.ready_queue.pop()
+        if shortest is not None:
             self.perform_context_switch(shortest)
-            return shortest
-        return None
+        return shortest
 
 class SRTF(Scheduler):
+    # remaining_ticks no cambia mientras el proceso espera en READY
+    queue_key = staticmethod(lambda p: (p.priority, p.remaining_ticks))
+
     def next_process(self, current_tick: int) -> Optional[Process]:
         candidate = self.current_process
-        best_candidate = None
-
-        if self.ready_queue:
-            best_candidate = min(self.ready_queue, key=lambda p: (p.priority, p.remaining_ticks))
+        best_candidate = self.ready_queue.peek()
 
         if candidate and candidate.state == "RUNNING":
-            candidate_key = (candidate.priority, candidate.remaining_ticks)
-            if best_candidate:
-                best_key = (best_candidate.priority, best_candidate.remaining_ticks)
-                if best_key < candidate_key:
-                    candidate.state = "READY"
-                    self.ready_queue.append(candidate)
-                    self.ready_queue.remove(best_candidate)
-                    self.perform_context_switch(best_candidate)
-                    return best_candidate
+            if best_candidate and self.queue_key(best_candidate) < self.queue_key(candidate):
+                candidate.state = "READY"
+                self.ready_queue.push(candidate)
+                self.ready_queue.pop()
+                self.perform_context_switch(best_candidate)
+                return best_candidate
             return candidate
 
         if best_candidate:
-            self.ready_queue.remove(best_candidate)
+            self.ready_queue.pop()
             self.perform_context_switch(best_candidate)
             return best_candidate
         return None
@@ -95,18 +212,15 @@ class RoundRobin(Scheduler):
         super().__init__()
         self.quantum = quantum
 
-    def add_process(self, process: Process):
-        process.state = "READY"
-        self.ready_queue.append(process)
-
     def next_process(self, current_tick: int) -> Optional[Process]:
-        if self.ready_queue:
-            next_proc = self.ready_queue.pop(0)
+        next_proc = self.ready_queue.pop()
+        if next_proc is not None:
             self.perform_context_switch(next_proc)
-            return next_proc
-        return None
+        return next_proc
 
 class PriorityScheduler(Scheduler):
+    queue_key = staticmethod(lambda p: p.priority)
+
     def __init__(self, preemptive: bool = True, aging_enabled: bool = True, aging_interval: int = 10):
         super().__init__()
         self.preemptive = preemptive
@@ -114,41 +228,37 @@ class PriorityScheduler(Scheduler):
         self.aging_interval = aging_interval
         self.last_aging_tick = 0
 
-    def add_process(self, process: Process):
-        process.state = "READY"
-        self.ready_queue.append(process)
-        self.ready_queue.sort(key=lambda p: p.priority)
-
     def next_process(self, current_tick: int) -> Optional[Process]:
         if self.aging_enabled and current_tick - self.last_aging_tick >= self.aging_interval:
             self._apply_aging()
             self.last_aging_tick = current_tick
 
-        if not self.ready_queue:
+        highest_priority = self.ready_queue.peek()
+        if highest_priority is None:
             return None
 
         if self.preemptive and self.current_process and self.current_process.state == "RUNNING":
-            self.ready_queue.sort(key=lambda p: p.priority)
-            highest_priority = self.ready_queue[0]
             if highest_priority.priority < self.current_process.priority:
                 self.current_process.state = "READY"
-                self.ready_queue.append(self.current_process)
-                self.ready_queue.sort(key=lambda p: p.priority)
-                self.ready_queue.remove(highest_priority)
+                self.ready_queue.push(self.current_process)
+                self.ready_queue.pop()
                 self.perform_context_switch(highest_priority)
                 return highest_priority
             else:
                 return self.current_process
 
-        self.ready_queue.sort(key=lambda p: p.priority)
-        next_proc = self.ready_queue.pop(0)
+        next_proc = self.ready_queue.pop()
         self.perform_context_switch(next_proc)
         return next_proc
 
     def _apply_aging(self):
+        aged = False
         for process in self.ready_queue:
             if process.waiting_ticks > 20:
                 process.priority = max(0, process.priority - 1)
+                aged = True
+        if aged:
+            self.ready_queue.rebuild()
 
 class PriorityRoundRobin(Scheduler):
     def __init__(self, quantum: int = 4):
@@ -0,0 +1,63 @@
+"""
+Cola de despertares para procesos en WAITING (IO, SYSCALL, PAGE_FAULT).
+
+En lugar de decrementar el contador de espera de cada proceso bloqueado en cada
+tick, cada espera se registra con su tick absoluto de despertar en un heap
+`(tick, pid)`. El costo por tick es proporcional a los procesos que despiertan y
+no a los que esperan.
+
+Registrar de nuevo un pid reemplaza su espera anterior: la entrada vieja queda en
+el heap y se descarta al salir (borrado perezoso), igual que en `HeapReadyQueue`.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class WaitQueue:
+    """Heap de (tick de despertar, pid) indexado por pid."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[int, int]] = []
+        self._wake_at: Dict[int, int] = {}
+
+    def park(self, pid: int, wake_tick: int) -> None:
+        """Programa (o reprograma) el despertar de `pid` en `wake_tick`."""
+        self._wake_at[pid] = wake_tick
+        heapq.heappush(self._heap, (wake_tick, pid))
+
+    def cancel(self, pid: int) -> None:
+        self._wake_at.pop(pid, None)
+
+    def wake_tick(self, pid: int) -> Optional[int]:
+        return self._wake_at.get(pid)
+
+    def pop_due(self, tick: int) -> List[int]:
+        """Extrae los pids cuyo despertar es <= tick, en orden (tick, pid)."""
+        heap = self._heap
+        wake_at = self._wake_at
+        due: List[int] = []
+        while heap and heap[0][0] <= tick:
+            wake, pid = heapq.heappop(heap)
+            if wake_at.get(pid) == wake:
+                del wake_at[pid]
+                due.append(pid)
+        return due
+
+    def next_wake(self) -> Optional[int]:
+        """Tick del próximo despertar vigente (None si no hay esperas)."""
+        heap = self._heap
+        while heap and self._wake_at.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._wake_at.clear()
+
+    def __len__(self) -> int:
+        return len(self._wake_at)
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self._wake_at
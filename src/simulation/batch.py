@@ -0,0 +1,251 @@
+"""
+Ejecución headless (sin Qt) del SimulationEngine.
+
+Construye un motor a partir de un archivo de configuración JSON, ejecuta N ticks
+tan rápido como lo permita la CPU y escribe las métricas finales. Pensado para
+experimentos largos (10^6+ ticks) donde el QTimer de la GUI es un cuello de botella.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from ..os_core.memory.reference_trace import ReferenceTrace, compare_replacement
+from .engine import SimulationEngine
+from .event_engine import EventDrivenEngine
+
+
+# Claves aceptadas en el archivo de configuración -> argumento del SimulationEngine.
+# Se aceptan tanto los nombres de ConfigDialog.get_config() como los del constructor.
+CONFIG_KEYS: Dict[str, str] = {
+    "architecture": "architecture",
+    "scheduling_alg": "scheduling_alg",
+    "quantum": "quantum",
+    "cpu_count": "num_cpus",
+    "num_cpus": "num_cpus",
+    "threads_per_cpu": "threads_per_cpu",
+    "memory_units": "num_memory_units",
+    "num_memory_units": "num_memory_units",
+    "memory_unit_capacity_mb": "memory_unit_capacity_mb",
+    "allocation_algorithm": "allocation_algorithm",
+    "paging_algorithm": "paging_algorithm",
+    "tlb_enabled": "tlb_enabled",
+    "page_table_type": "page_table_type",
+    "storage_type": "storage_type",
+    "seed": "seed",
+    "determinism_mode": "determinism_mode",
+    "process_store": "process_store",
+    "memory_placement": "memory_placement",
+    "slab_size_classes": "slab_size_classes",
+    "compaction": "compaction",
+    "tlb_size": "tlb_size",
+    "tlb_ways": "tlb_ways",
+    "page_size_mb": "page_size_mb",
+    "huge_page_mb": "huge_page_mb",
+    "huge_page_policy": "huge_page_policy",
+}
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """Lee un archivo JSON de configuración."""
+    with open(path, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    if not isinstance(data, dict):
+        raise ValueError(f"La configuración en {path} debe ser un objeto JSON.")
+    return data
+
+
+def engine_kwargs_from_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Traduce una configuración (formato GUI o constructor) a kwargs del motor."""
+    kwargs: Dict[str, Any] = {}
+    for key, value in config.items():
+        target = CONFIG_KEYS.get(key)
+        if target is not None:
+            kwargs[target] = value
+    return kwargs
+
+
+# Modos de ejecución: por ticks (igual que la GUI) o por eventos discretos
+ENGINE_MODES: Dict[str, type] = {
+    "tick": SimulationEngine,
+    "event": EventDrivenEngine,
+}
+
+
+def engine_from_config(config: Dict[str, Any]) -> SimulationEngine:
+    """Crea un SimulationEngine (o EventDrivenEngine si mode == "event") a partir de una configuración."""
+    mode = config.get("mode", "tick")
+    if mode not in ENGINE_MODES:
+        raise ValueError(f"Modo de motor desconocido: {mode!r} (use {', '.join(ENGINE_MODES)})")
+    engine = ENGINE_MODES[mode](**engine_kwargs_from_config(config))
+    if "auto_create_processes" in config:
+        engine.auto_create_processes = bool(config["auto_create_processes"])
+    return engine
+
+
+def advance(engine: SimulationEngine, ticks: int) -> None:
+    """Avanza `ticks` ticks; el motor por eventos salta los tramos ociosos."""
+    if isinstance(engine, EventDrivenEngine):
+        engine.run(ticks)
+        return
+    tick = engine.tick
+    for _ in range(ticks):
+        tick()
+
+
+def run_ticks(engine: SimulationEngine, ticks: int, progress_every: int = 0) -> float:
+    """Ejecuta `ticks` ticks sin pausa. Retorna el tiempo de pared en segundos."""
+    engine.is_running = True
+    chunk = progress_every if progress_every > 0 else max(1, ticks)
+    done = 0
+    start = time.perf_counter()
+    while done < ticks:
+        step = min(chunk, ticks - done)
+        advance(engine, step)
+        done += step
+        if progress_every > 0:
+            elapsed = time.perf_counter() - start
+            print(f"  {done}/{ticks} ticks ({done / elapsed:,.0f} ticks/s)", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    engine.is_running = False
+    return elapsed
+
+
+def collect_results(engine: SimulationEngine) -> Dict[str, Any]:
+    """Resume el estado final del motor en un diccionario serializable a JSON."""
+    return {
+        "config": {
+            "architecture": engine.architecture,
+            "scheduling_alg": engine.scheduling_alg_name,
+            "quantum": engine.quantum,
+            "num_cpus": len(engine.cpus),
+            "threads_per_cpu": engine.cpus[0].thread_capacity if engine.cpus else 0,
+            "num_memory_units": engine.num_memory_units,
+            "memory_unit_capacity_mb": engine.memory_unit_capacity_mb,
+            "allocation_algorithm": engine.memory_units[0].alloc_alg if engine.memory_units else None,
+            "paging_algorithm": engine.memory_units[0].page_alg if engine.memory_units else None,
+            "tlb_enabled": engine.tlb_enabled,
+            "page_table_type": engine.page_table_type,
+            "storage_type": engine.storage_type,
+            "seed": engine.seed,
+            "determinism_mode": engine.randomness.mode,
+            "process_store": engine.process_store,
+            "memory_placement": engine.memory_placement.policy_name,
+            "compaction": engine.compaction,
+            "tlb_size": engine.tlb_size,
+            "tlb_ways": engine.tlb_ways,
+            "page_size_mb": engine.page_size_mb,
+            "huge_page_mb": engine.huge_page_mb,
+            "huge_page_policy": engine.huge_page_policy,
+            "mode": "event" if isinstance(engine, EventDrivenEngine) else "tick",
+        },
+        "metrics": engine.metrics.summary(engine.tick_count, engine.cpus),
+        "storage": engine.storage_overview(),
+        "memory_units": engine.memory_unit_summaries(),
+        "paging": engine.paging_stats(),
+    }
+
+
+def attach_reference_traces(engine: SimulationEngine) -> List[ReferenceTrace]:
+    """Primera pasada de OPT: graba la cadena de referencias de cada unidad."""
+    traces = []
+    for unit in engine.memory_units:
+        trace = ReferenceTrace()
+        unit.paged_manager.reference_trace = trace
+        traces.append(trace)
+    return traces
+
+
+def belady_comparison(engine: SimulationEngine, traces: List[ReferenceTrace], capacity_mb: Optional[int] = None) -> Dict[str, Any]:
+    """Segunda pasada: cada política de reemplazo y OPT real sobre la cadena grabada de cada unidad.
+
+    `capacity_mb` reproduce la cadena con otra memoria física (planificación de
+    capacidad); por defecto la de cada unidad. Los write-backs se cobran con el
+    tiempo de acceso del almacenamiento del motor.
+    """
+    writeback_ticks = engine.default_page_fault_duration()
+    out: Dict[str, Any] = {}
+    for unit, trace in zip(engine.memory_units, traces):
+        pm = unit.paged_manager
+        total_mb = capacity_mb if capacity_mb is not None else pm.total_mb
+        replacement = compare_replacement(trace.events, total_mb, pm.page_size_mb)
+        for result in replacement.values():
+            result["writeback_stall_ticks"] = result["writebacks"] * writeback_ticks
+        out[f"unit_{unit.id}"] = {
+            "references": len(trace.references()),
+            "capacity_mb": total_mb,
+            "replacement": replacement,
+        }
+    return out
+
+
+def write_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2, ensure_ascii=False)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Ejecuta la simulación sin interfaz gráfica y escribe las métricas finales."
+    )
+    parser.add_argument("config", nargs="?", help="Archivo JSON de configuración (mismas claves que la GUI).")
+    parser.add_argument("-n", "--ticks", type=int, default=None, help="Número de ticks a simular (default: 'ticks' del config o 10000).")
+    parser.add_argument("-o", "--output", default=None, help="Archivo JSON donde escribir las métricas finales.")
+    parser.add_argument("--progress", type=int, default=0, help="Imprime progreso cada N ticks (0 = desactivado).")
+    parser.add_argument("--seed", type=int, default=None, help="Semilla del generador aleatorio del motor (reproducible).")
+    parser.add_argument("--mode", choices=sorted(ENGINE_MODES), default=None, help="Motor por ticks (default) o por eventos discretos.")
+    parser.add_argument("--no-auto-create", action="store_true", help="Desactiva la creación automática de procesos.")
+    parser.add_argument("--belady", action="store_true", help="Graba las referencias a páginas y compara todas las políticas de reemplazo y OPT real sobre ellas.")
+    parser.add_argument("--belady-mb", type=int, default=None, help="Memoria física (MB) con la que se reproduce la cadena (default: la de cada unidad).")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    config = load_config(args.config) if args.config else {}
+    ticks = args.ticks if args.ticks is not None else int(config.get("ticks", 10000))
+    if args.seed is not None:
+        config["seed"] = args.seed
+    if args.mode is not None:
+        config["mode"] = args.mode
+    if ticks < 0:
+        print("El número de ticks debe ser >= 0.", file=sys.stderr)
+        return 2
+
+    engine = engine_from_config(config)
+    if args.no_auto_create:
+        engine.auto_create_processes = False
+    traces = attach_reference_traces(engine) if args.belady else None
+
+    elapsed = run_ticks(engine, ticks, progress_every=args.progress)
+    rate = ticks / elapsed if elapsed > 0 else float("inf")
+
+    results = collect_results(engine)
+    results["run"] = {"ticks": ticks, "wall_seconds": elapsed, "ticks_per_second": rate}
+    if traces is not None:
+        results["belady"] = belady_comparison(engine, traces, args.belady_mb)
+    if args.output:
+        write_results(results, args.output)
+
+    m = results["metrics"]
+    print(f"Ticks simulados: {ticks} en {elapsed:.3f} s ({rate:,.0f} ticks/s)")
+    print(
+        f"Procesos: {m['completed_processes']}/{m['total_processes']} completados | "
+        f"Throughput: {m['throughput']:.4f} proc/tick | "
+        f"Retorno prom.: {m['average_turnaround_time']:.2f} | Espera prom.: {m['average_waiting_time']:.2f} | "
+        f"CPU: {m['cpu_utilization'] * 100:.2f}%"
+    )
+    if traces is not None:
+        for name, unit in results["belady"].items():
+            faults = ", ".join(f"{alg}: {r['page_faults']}" for alg, r in unit["replacement"].items())
+            print(f"Fallos de página sobre la cadena de {name} ({unit['references']} referencias) -> {faults}")
+    if args.output:
+        print(f"Métricas escritas en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
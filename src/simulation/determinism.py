@@ -0,0 +1,128 @@
+"""
+Aleatoriedad determinística basada en contador.
+
+Las decisiones de interrupción (syscall, I/O, error) se derivan de una función
+pura de `(pid, tick, salt)`: la misma terna produce siempre el mismo valor, sin
+estado compartido, por lo que la simulación es reproducible y el cálculo puede
+hacerse para todos los procesos de un tick a la vez.
+
+Modos:
+- "splitmix": contador `(pid << 32) | tick` mezclado con la clave del salt (y la
+  semilla del motor) mediante el finalizador de splitmix64. Unas pocas
+  operaciones enteras por valor.
+- "sha256": modo de compatibilidad; reproduce exactamente los sorteos de
+  interrupción anteriores (SHA-256 de "pid-tick-salt"). Las ejecuciones
+  completas de versiones anteriores no se repiten: el modelo cambió desde entonces.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, List, Optional, Sequence
+
+try:  # NumPy es opcional: solo acelera lotes grandes
+    import numpy as np
+except ImportError:  # pragma: no cover - depende del entorno
+    np = None
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+MIX_1 = 0xBF58476D1CE4E5B9
+MIX_2 = 0x94D049BB133111EB
+# 2^-53: convierte los 53 bits altos en un float uniforme en [0, 1)
+INV_2_53 = 1.0 / (1 << 53)
+
+MODES = ("splitmix", "sha256")
+
+# Por debajo de este tamaño la versión Python pura es más rápida que NumPy
+VECTOR_THRESHOLD = 64
+
+
+def splitmix64(x: int) -> int:
+    """Finalizador de splitmix64 (biyectivo sobre 64 bits)."""
+    x = (x ^ (x >> 30)) * MIX_1 & MASK64
+    x = (x ^ (x >> 27)) * MIX_2 & MASK64
+    return x ^ (x >> 31)
+
+
+def salt_key(salt: str, seed: int = 0) -> int:
+    """Clave de 64 bits estable para un salt (FNV-1a) combinada con la semilla."""
+    h = 0xCBF29CE484222325
+    for byte in salt.encode("utf-8"):
+        h = ((h ^ byte) * 0x100000001B3) & MASK64
+    return splitmix64((h + (seed & MASK64) * GOLDEN_GAMMA) & MASK64)
+
+
+class DeterministicRandom:
+    """Generador sin estado indexado por (pid, tick, salt)."""
+
+    def __init__(self, mode: str = "splitmix", seed: Optional[int] = None) -> None:
+        if mode not in MODES:
+            raise ValueError(f"Modo determinístico desconocido: {mode!r} (use {', '.join(MODES)})")
+        self.mode = mode
+        self.seed = 0 if seed is None else int(seed)
+        self._keys: Dict[str, int] = {}
+
+    def _key(self, salt: str) -> int:
+        key = self._keys.get(salt)
+        if key is None:
+            key = salt_key(salt, self.seed)
+            self._keys[salt] = key
+        return key
+
+    def _bits(self, pid: int, tick: int, key: int) -> int:
+        x = (key + (((pid << 32) | (tick & 0xFFFFFFFF)) * GOLDEN_GAMMA)) & MASK64
+        x = (x ^ (x >> 30)) * MIX_1 & MASK64
+        x = (x ^ (x >> 27)) * MIX_2 & MASK64
+        return x ^ (x >> 31)
+
+    def probability(self, pid: int, tick: int, salt: str) -> float:
+        """Valor uniforme en [0, 1) para (pid, tick, salt) ([0, 1] en modo sha256)."""
+        if self.mode == "sha256":
+            return _sha256_probability(pid, tick, salt)
+        return (self._bits(pid, tick, self._key(salt)) >> 11) * INV_2_53
+
+    def probabilities(self, pids: Sequence[int], tick: int, salt: str) -> List[float]:
+        """Versión por lotes de `probability` para todos los procesos de un tick."""
+        if self.mode == "sha256":
+            return [_sha256_probability(pid, tick, salt) for pid in pids]
+        key = self._key(salt)
+        if np is not None and len(pids) >= VECTOR_THRESHOLD:
+            return _splitmix_vector(pids, tick, key).tolist()
+        bits = self._bits
+        return [(bits(pid, tick, key) >> 11) * INV_2_53 for pid in pids]
+
+    def probability_array(self, pids, tick: int, salt: str):
+        """Como `probabilities`, pero recibe y devuelve arreglos NumPy (requiere NumPy)."""
+        if self.mode == "sha256":
+            return np.array([_sha256_probability(int(pid), tick, salt) for pid in pids], dtype=np.float64)
+        return _splitmix_vector(pids, tick, self._key(salt))
+
+    def duration(self, pid: int, salt: str, minimum: int, maximum: int) -> int:
+        """Duración entera en [minimum, maximum] fija para (pid, salt)."""
+        minimum = max(1, minimum)
+        maximum = max(minimum, maximum)
+        span = maximum - minimum + 1
+        if self.mode == "sha256":
+            key = f"{pid}-{salt}"
+            x = int(hashlib.sha256(key.encode()).hexdigest()[:8], 16)
+        else:
+            x = self._bits(pid, 0, self._key("duration:" + salt)) >> 32
+        return minimum + (x % span)
+
+
+def _sha256_probability(pid: int, tick: int, salt: str) -> float:
+    key = f"{pid}-{tick}-{salt}"
+    h = hashlib.sha256(key.encode()).hexdigest()
+    x = int(h[:8], 16)
+    return x / 0xFFFFFFFF
+
+
+def _splitmix_vector(pids: Sequence[int], tick: int, key: int):
+    """splitmix64 sobre un arreglo uint64 (la aritmética envuelve módulo 2^64)."""
+    p = np.asarray(pids, dtype=np.uint64)
+    x = (p << np.uint64(32)) | np.uint64(tick & 0xFFFFFFFF)
+    x = x * np.uint64(GOLDEN_GAMMA) + np.uint64(key)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(MIX_1)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(MIX_2)
+    x = x ^ (x >> np.uint64(31))
+    return (x >> np.uint64(11)).astype(np.float64) * INV_2_53
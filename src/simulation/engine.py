@@ -1,19 +1,27 @@
 import random
-import hashlib
 import datetime
-from typing import Dict, List, Optional
+import itertools
+import math
+from typing import Dict, List, Optional, Tuple
 from types import SimpleNamespace
 
 from ..os_core.architectures import ArchitectureFactory
 from ..os_core.interrupts import Interrupt, InterruptController, InterruptType
 from ..os_core.models import Process, CPU, MemoryBlock
+from ..os_core.process_table import ProcessTable
+from ..os_core.process_store import ProcessStore
+from ..os_core.wait_queue import WaitQueue
 from ..os_core.memory.manager import (
     MemoryManager,
     AllocationResult,
     PagedMemoryManager,
+    COMPACTION_MODES,
+    HUGE_PAGE_POLICIES,
+    create_memory_manager,
 )
-from ..os_core.memory.strategies import FirstFitStrategy, BestFitStrategy, WorstFitStrategy
+from ..os_core.memory.placement import MemoryPlacement, numa_node
 from .metrics import SimulationMetrics
+from .determinism import DeterministicRandom
 from ..os_core.scheduler import (
     Scheduler,
     FCFS,
@@ -24,6 +32,10 @@ from ..os_core.scheduler import (
     PriorityRoundRobin,
 )
 
+PROCESS_STORES = ("objects", "columnar")
+# Estados cuyo uso de CPU fluctúa sin ejecutar (los RUNNING fluctúan en Process.tick)
+IDLE_JITTER_STATES = ("NEW", "READY")
+
 
 class SimulationEngine:
     def __init__(
@@ -39,13 +51,64 @@ class SimulationEngine:
         paging_algorithm: str = "FIFO",
         tlb_enabled: bool = True,
         page_table_type: str = "SingleLevel",
-        storage_type: str = "HDD"
+        storage_type: str = "HDD",
+        seed: Optional[int] = None,
+        determinism_mode: str = "splitmix",
+        process_store: str = "objects",
+        memory_placement: str = "most_free",
+        slab_size_classes: Optional[List[int]] = None,
+        compaction: str = "incremental",
+        tlb_size: int = 16,
+        tlb_ways: int = 0,
+        page_size_mb: int = 4,
+        huge_page_mb: int = 64,
+        huge_page_policy: str = "none",
     ) -> None:
+        # Generador aleatorio propio del motor: dos motores en el mismo proceso no
+        # interfieren y una misma semilla reproduce exactamente la ejecución.
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self._pid_counter = itertools.count(1)
+        # Probabilidades de interrupción por (pid, tick, salt); "sha256" usa el hash anterior
+        self.randomness = DeterministicRandom(determinism_mode, seed)
+        # En modo "sha256" las llegadas, el timer y la fluctuación de CPU de los
+        # procesos que no ejecutan vuelven a sortearse con self.rng en cada tick,
+        # en el orden anterior al modo por eventos.
+        self._legacy_draw_order = self.randomness.mode == "sha256"
+        if process_store not in PROCESS_STORES:
+            raise ValueError(f"Almacén de procesos desconocido: {process_store!r} (use {', '.join(PROCESS_STORES)})")
+        # "columnar": campos numéricos de los procesos en arreglos NumPy (ver process_store.py)
+        self.process_store = process_store
+        # Clases de tamaño (MB) del asignador "slab"; None = múltiplos de 4 hasta 64
+        self.slab_size_classes = list(slab_size_classes) if slab_size_classes else None
+        if compaction not in COMPACTION_MODES:
+            raise ValueError(f"Modo de compactación desconocido: {compaction!r} (use {', '.join(COMPACTION_MODES)})")
+        # "incremental": la compactación avanza unos pocos bloques por tick; "full": todo de una vez
+        self.compaction = compaction
+        if huge_page_policy not in HUGE_PAGE_POLICIES:
+            raise ValueError(f"Política de páginas grandes desconocida: {huge_page_policy!r} (use {', '.join(HUGE_PAGE_POLICIES)})")
+        # Página base de cada unidad; con "large", los procesos grandes usan páginas de huge_page_mb
+        self.page_size_mb = max(1, int(page_size_mb))
+        self.huge_page_mb = int(huge_page_mb)
+        self.huge_page_policy = huge_page_policy
+
         # Limitar unidades de memoria: mínimo 1, máximo 8
         self.num_memory_units = max(1, min(8, int(num_memory_units)))
         self.memory_unit_capacity_mb = max(1, int(memory_unit_capacity_mb))
         
         self.tlb_enabled = tlb_enabled
+        # Entradas del TLB de cada unidad y vías por conjunto (0 = totalmente asociativo, 1 = mapeo directo)
+        self.tlb_size = tlb_size
+        self.tlb_ways = tlb_ways
+        # Un TLB por CPU; invalidar una entrada en otra CPU cuesta una IPI
+        self.num_tlbs = max(1, min(8, int(num_cpus)))
+        self.shootdown_ipi_ticks = 1
+        # Lecturas a memoria de recorridos de tabla (fallos de TLB) que caben en un tick.
+        # Una lectura es mucho más barata que un acceso al almacenamiento (2 a 50
+        # ticks): se acumulan por proceso y cada `page_walk_refs_per_tick` cuestan
+        # un tick de CPU, sin soltar la CPU.
+        self.page_walk_refs_per_tick = 20
+        self._walk_refs: Dict[int, int] = {}  # pid -> lecturas aún sin cobrar
         self.page_table_type = page_table_type
         self.storage_type = storage_type
         
@@ -56,16 +119,11 @@ class SimulationEngine:
             "NVMe": 2,      # Muy rápido
             "Tape": 50      # Extremadamente lento
         }
+        # Fracción de accesos a memoria que son escrituras (marcan la página como modificada)
+        self.write_fraction = 0.3
         
         self.start_time = datetime.datetime.now()
 
-        def strategy_for(name: str):
-            if name == "best":
-                return BestFitStrategy()
-            if name == "worst":
-                return WorstFitStrategy()
-            return FirstFitStrategy()
-
         self.memory_units: List[SimpleNamespace] = []
         for i in range(self.num_memory_units):
             mu = SimpleNamespace(
@@ -81,24 +139,22 @@ class SimulationEngine:
             base_sys_mb = 64  # Núcleo + estructuras base (más realista para un SO completo)
             if i == 0:
                 mu.system_reserved_mb = min(base_sys_mb, mu.total_mb)
-                mu.manager = MemoryManager(mu.total_mb, mu.alloc_alg, strategy_for(mu.alloc_alg), system_reserved_mb=mu.system_reserved_mb)
+                mu.manager = self._create_memory_manager(mu.alloc_alg, mu.total_mb, system_reserved_mb=mu.system_reserved_mb)
             else:
                 mu.system_reserved_mb = 0
-                mu.manager = MemoryManager(mu.total_mb, mu.alloc_alg, strategy_for(mu.alloc_alg), system_reserved_mb=0)
+                mu.manager = self._create_memory_manager(mu.alloc_alg, mu.total_mb, system_reserved_mb=0)
             
-            mu.paged_manager = PagedMemoryManager(
-                total_mb=mu.total_mb, 
-                page_size_mb=4, 
-                replacement_alg=mu.page_alg,
-                tlb_enabled=self.tlb_enabled, 
-                page_table_type=self.page_table_type
-            )
+            mu.paged_manager = self._create_paged_manager(mu.total_mb, mu.page_alg)
             self.memory_units.append(mu)
 
         self.managers: Dict[str, MemoryManager] = {"first": self.memory_units[0].manager}
         self.paged_managers: Dict[str, PagedMemoryManager] = {"FIFO": self.memory_units[0].paged_manager}
+        # Elección de unidad de memoria para cada proceso nuevo (ver placement.py)
+        self.memory_placement = MemoryPlacement([u.manager for u in self.memory_units], memory_placement)
 
-        self.processes: Dict[int, Process] = {}
+        self.processes: ProcessTable = self._create_process_table()
+        self.wait_queue = WaitQueue()
+        self._waiting_phase_tick = 0
         self.metrics = SimulationMetrics()
         self.tick_count = 0
         self.max_process_duration = 50
@@ -120,6 +176,10 @@ class SimulationEngine:
         self.scheduler_names: List[str] = [self.scheduling_alg_name for _ in self.cpus]
 
         self.auto_create_processes = True
+        self.arrival_probability = 0.3  # Probabilidad de llegada de un proceso por tick
+        self.timer_interrupt_probability = 0.02
+        self.idle_cpu_jitter = 10.0  # Amplitud (±) de la fluctuación de CPU de procesos NEW/READY
+        self._reset_ambient_events()
         self.is_running: bool = False
 
         self.dynamic_modules: Dict[str, Dict] = {}
@@ -146,6 +206,85 @@ class SimulationEngine:
             return PriorityRoundRobin(quantum=self.quantum)
         return FCFS()
 
+    def _create_process_table(self) -> ProcessTable:
+        if self.process_store == "columnar":
+            return ProcessTable(ProcessStore())
+        return ProcessTable()
+
+    def _create_memory_manager(self, algorithm: str, total_mb: int, system_reserved_mb: int = 0):
+        return create_memory_manager(
+            algorithm, total_mb, system_reserved_mb=system_reserved_mb,
+            size_classes=self.slab_size_classes, compaction_mode=self.compaction,
+        )
+
+    def _create_paged_manager(self, total_mb: int, page_alg: str) -> PagedMemoryManager:
+        return PagedMemoryManager(
+            total_mb,
+            page_size_mb=self.page_size_mb,
+            replacement_alg=page_alg,
+            tlb_enabled=self.tlb_enabled,
+            page_table_type=self.page_table_type,
+            tlb_size=self.tlb_size,
+            tlb_ways=self.tlb_ways,
+            num_cpus=self.num_tlbs,
+            huge_page_mb=self.huge_page_mb,
+            huge_page_policy=self.huge_page_policy,
+        )
+
+    def _charge_relocations(self) -> None:
+        """Cobra la copia de los bloques compactados a sus procesos.
+
+        Un proceso en ejecución queda en WAITING ("COMPACTION") durante los
+        ticks de copia y libera su CPU, como en un page fault; los que no están
+        en CPU se copian mientras esperan y no se detienen.
+        """
+        for unit in self.memory_units:
+            for pid, ticks in unit.manager.take_relocations():
+                process = self.processes.get(pid)
+                if process is None or process.state != "RUNNING":
+                    continue
+                for cpu in self.cpus:
+                    if cpu.process is process:
+                        cpu.release()
+                        break
+                self._park_waiting(process, "COMPACTION", ticks)
+                self.metrics.relocation_stall_ticks += ticks
+                self.log_interrupt(f"Process {process.name} detenido {ticks} ticks por compactación.")
+
+    def _charge_eviction_costs(self, unit: SimpleNamespace) -> Tuple[int, int]:
+        """Cobra los desalojos de la unidad desde la última llamada.
+
+        Cada write-back de una página modificada cuesta un acceso al
+        almacenamiento (`storage_access_times`) y cada IPI de shootdown a un TLB
+        remoto `shootdown_ipi_ticks`; los desalojos limpios y sin copias remotas
+        en TLB no cuestan nada. Retorna (ticks de write-back, ticks de shootdown).
+        """
+        pm = unit.paged_manager
+        writeback = pm.take_writebacks() * self.default_page_fault_duration()
+        shootdown = pm.take_shootdown_ipis() * self.shootdown_ipi_ticks
+        pm.writeback_stall_ticks += writeback
+        pm.shootdown_stall_ticks += shootdown
+        self.metrics.writeback_stall_ticks += writeback
+        self.metrics.shootdown_stall_ticks += shootdown
+        return writeback, shootdown
+
+    def _charge_page_walk(self, unit: SimpleNamespace, process: Process) -> None:
+        """Acumula las lecturas del recorrido de tabla del último acceso y cobra los ticks completos.
+
+        Cada tick cobrado alarga el trabajo restante del proceso: la CPU queda
+        ocupada sin avanzar, como un core detenido esperando a la memoria.
+        """
+        pm = unit.paged_manager
+        refs = pm.take_walk_refs()
+        if not refs:
+            return
+        stall, pending = divmod(self._walk_refs.get(process.pid, 0) + refs, self.page_walk_refs_per_tick)
+        self._walk_refs[process.pid] = pending
+        if stall:
+            process.remaining_ticks += stall
+            pm.page_walk_stall_ticks += stall
+            self.metrics.page_walk_stall_ticks += stall
+
     def log_interrupt(self, message: str) -> None:
         ts = f"[Tick {self.tick_count}]"
         self.interrupt_log.append(f"{ts} {message}")
@@ -156,10 +295,24 @@ class SimulationEngine:
         return self.processes.get(pid)
 
     def set_process_waiting(self, process: Process, reason: str, duration: int) -> None:
+        self._park_waiting(process, reason, max(1, int(duration)))
+        self.log_interrupt(f"Process {process.name} -> WAITING ({reason}) por {duration} ticks.")
+
+    def _park_waiting(self, process: Process, reason: str, duration: int) -> None:
+        """Bloquea el proceso y programa su despertar en la cola de esperas."""
         process.state = "WAITING"
         process.interrupt_type = reason
-        process.io_remaining_ticks = max(1, int(duration))
-        self.log_interrupt(f"Process {process.name} -> WAITING ({reason}) por {duration} ticks.")
+        process.io_remaining_ticks = duration
+        # La espera se descuenta desde la próxima fase de espera (este tick si aún no corrió)
+        first = self.tick_count if self._waiting_phase_tick < self.tick_count else self.tick_count + 1
+        self.wait_queue.park(process.pid, first + max(1, duration) - 1)
+
+    def io_remaining(self, process: Process) -> int:
+        """Ticks de espera que le quedan a un proceso en WAITING."""
+        wake = self.wait_queue.wake_tick(process.pid)
+        if wake is None:
+            return 0
+        return max(0, wake - self._waiting_phase_tick)
 
     def handle_global_interrupt(self, interrupt: Interrupt) -> None:
         reason = interrupt.payload.get("reason", interrupt.interrupt_type.value)
@@ -213,9 +366,10 @@ class SimulationEngine:
         
         calculated_size = code_mb + data_mb + extra_mb
         
-        has_error = random.random() < 0.005
+        has_error = self.rng.random() < 0.005
         
-        process = Process(
+        process = self.processes.new_process(
+            pid=next(self._pid_counter),
             name=f"P{len(self.processes) + 1}",
             size_mb=calculated_size,
             code_size_mb=code_mb,
@@ -223,7 +377,7 @@ class SimulationEngine:
             extra_memory_mb=extra_mb,
             has_error=has_error,
             exit_code=0,
-            cpu_usage=random.uniform(5, 40),
+            cpu_usage=self.rng.uniform(5, 40),
             duration_ticks=duration,
             remaining_ticks=duration,
         )
@@ -248,19 +402,28 @@ class SimulationEngine:
         return self._create_process_internal(size_mb, duration, priority)
 
     def create_process(self) -> Process:
-        size = random.randint(4, 64)
-        duration = random.randint(20, self.max_process_duration)
+        size = self.rng.randint(4, 64)
+        duration = self.rng.randint(20, self.max_process_duration)
         return self._create_process_internal(size, duration)
 
     def _try_allocate_in_any_unit(self, process: Process) -> None:
         allocated = False
-        for idx in self._memory_units_by_free_desc():
+        home = None
+        if self.memory_placement.policy_name == "numa" and self.cpus:
+            # CPU a la que irá el proceso al pasar a READY (la menos cargada)
+            home = numa_node(self._least_loaded_scheduler_index(), len(self.cpus), len(self.memory_units))
+        for idx in self.memory_placement.candidates(process.size_mb, home):
             unit = self.memory_units[idx]
             result: AllocationResult = unit.manager.allocate(process)
             self.metrics.update(result)
             if result.success:
                 process.memory_unit_id = unit.id
                 unit.paged_manager.allocate(process, self.tick_count)
+                # Si cargar la página 0 desalojó páginas, las escrituras (contadas en
+                # `writebacks`) y las IPIs de shootdown (en `tlb_shootdown_ipis`) no
+                # las espera nadie: el proceso aún no corre, no suman ticks de espera
+                unit.paged_manager.take_writebacks()
+                unit.paged_manager.take_shootdown_ipis()
                 allocated = True
                 break
         if allocated:
@@ -280,6 +443,7 @@ class SimulationEngine:
         for unit in self.memory_units:
             unit.manager.release(process)
             unit.paged_manager.release(process)
+        self._walk_refs.pop(process.pid, None)
         process.state = "TERMINATED"
         process.finish_tick = self.tick_count
         if not process.has_error and process.exit_code == 0:
@@ -292,8 +456,12 @@ class SimulationEngine:
         self._cleanup_terminated_processes()
         self._move_new_processes_to_ready()
         self._update_system_reserved_memory()
-        for process in self.active_processes():
-            process.tick()
+        if self._legacy_draw_order:
+            self._tick_processes_legacy()
+        else:
+            for process in self.processes.in_state("RUNNING", ordered=True):
+                process.tick(self.rng)
+            self._jitter_idle_cpu_usage()
         self._update_waiting_processes()
         self._run_cpus()
         self.arch.process_pending_interrupts(self, self.tick_count)
@@ -304,26 +472,32 @@ class SimulationEngine:
         self.tick_count += 1
         self.arch.before_tick(self, self.tick_count)
 
-        if self.auto_create_processes and random.random() < 0.3:
+        if self.auto_create_processes and self._arrival_due(self.tick_count):
             self.create_process()
 
         for unit in self.memory_units:
             unit.manager.tick()
+        self._charge_relocations()
         for unit in self.memory_units:
             unit.paged_manager.tick(self.tick_count)
 
         self._maybe_raise_global_interrupts()
         self.update_processes()
+        # Compactaciones disparadas al liberar memoria o al crecer la reserva
+        self._charge_relocations()
 
         for cpu in self.cpus:
             process = cpu.process
-            if process and process.state == "RUNNING" and random.random() < 0.2: # Aumentado prob de acceso memoria
-                max_page = max(0, (process.size_mb // 4) - 1)
-                page_number = random.randint(0, max_page) if max_page > 0 else 0
+            if process and process.state == "RUNNING" and self.rng.random() < 0.2: # Aumentado prob de acceso memoria
+                max_page = max(0, (process.size_mb // self.page_size_mb) - 1)
+                page_number = self.rng.randint(0, max_page) if max_page > 0 else 0
                 if process.memory_unit_id is not None and 0 <= process.memory_unit_id < len(self.memory_units):
                     unit = self.memory_units[process.memory_unit_id]
+                    # Lectura o escritura: sorteo determinístico, no consume self.rng
+                    write = self.randomness.probability(process.pid, self.tick_count, "write") < self.write_fraction
                     # Access Page returns True, False (Segment Fault) or "PAGE_FAULT"
-                    result = unit.paged_manager.access_page(process, page_number, self.tick_count)
+                    result = unit.paged_manager.access_page(process, page_number, self.tick_count, write, cpu.id)
+                    self._charge_page_walk(unit, process)
                     
                     if result == "PAGE_FAULT":
                         # SIMULAR PAGE FAULT COMO INTERRUPCION DE SOFTWARE
@@ -331,63 +505,81 @@ class SimulationEngine:
                         self.interrupt_controller.raise_interrupt(
                             Interrupt(InterruptType.PAGE_FAULT, source="mmu", pid=process.pid, payload={"page_fault_duration": duration})
                         )
-                        process.state = "WAITING"
-                        process.interrupt_type = "PAGE_FAULT"
-                        process.io_remaining_ticks = duration
+                        self._park_waiting(process, "PAGE_FAULT", duration)
                         process.pending_fault_page = page_number
                         cpu.release()
                         self.log_interrupt(f"PAGE FAULT (Software Interrupt) - Process {process.name}, Page {page_number}")
-                    if self.architecture == "Modular" and random.random() < 0.05: # Solo 5% para no saturar
+                    if self.architecture == "Modular" and self.rng.random() < 0.05: # Solo 5% para no saturar
                         self.log_layer_flow("Paginación", "Memoria Core", f"access:{process.pid}")
 
         self.arch.after_tick(self, self.tick_count)
 
     def _cleanup_terminated_processes(self) -> None:
-        for process in list(self.processes.values()):
-            if process.state == "TERMINATED":
-                if process.finish_tick is None or (self.tick_count - process.finish_tick) > self.terminated_cleanup_delay:
-                    del self.processes[process.pid]
+        for process in self.processes.in_state("TERMINATED"):
+            if process.finish_tick is None or (self.tick_count - process.finish_tick) > self.terminated_cleanup_delay:
+                del self.processes[process.pid]
 
     def _move_new_processes_to_ready(self) -> None:
-        for process in self.processes.values():
-            if process.state == "NEW":
-                if process.arrival_tick is not None and (self.tick_count - process.arrival_tick) >= self.new_state_delay:
-                    process.state = "READY"
-                    idx = self._least_loaded_scheduler_index()
-                    self.schedulers[idx].add_process(process)
-                    self.log_interrupt(f"Process {process.name} (PID {process.pid}) movido de NEW a READY.")
-                    if self.architecture == "Modular":
-                        self.log_layer_flow("Planificador", "Proceso Core", f"ready:{process.pid}")
-                        self.log_layer_flow("Proceso Core", "Núcleo Base", f"sched:{process.pid}")
-
-    def _update_waiting_processes(self) -> None:
-        for process in self.active_processes():
-            if process.state != "WAITING":
-                continue
-            if process.io_remaining_ticks > 0:
-                process.io_remaining_ticks -= 1
-            if process.io_remaining_ticks <= 0:
-                # Si terminamos de esperar por un Page Fault, tenemos que resolverlo (cargar página)
-                if process.interrupt_type == "PAGE_FAULT" and process.pending_fault_page is not None:
-                     if process.memory_unit_id is not None and 0 <= process.memory_unit_id < len(self.memory_units):
-                         unit = self.memory_units[process.memory_unit_id]
-                         success = unit.paged_manager.resolve_fault(process.pid, process.pending_fault_page, self.tick_count)
-                         if success:
-                             self.log_interrupt(f"Page Fault Resolved: Process {process.name} Page {process.pending_fault_page} Loaded.")
-                         else:
-                             self.log_interrupt(f"Page Fault Failed: No memory for Process {process.name}.")
-                             # Podríamos terminar el proceso si falla, pero reintentaremos luego
-                             
-                     process.pending_fault_page = None
-
+        # NEW está en orden de llegada: los más antiguos primero
+        for process in self.processes.in_state("NEW"):
+            if process.arrival_tick is not None and (self.tick_count - process.arrival_tick) >= self.new_state_delay:
                 process.state = "READY"
-                process.io_remaining_ticks = 0
-                process.interrupt_type = None
                 idx = self._least_loaded_scheduler_index()
                 self.schedulers[idx].add_process(process)
-                self.log_interrupt(f"Process {process.name} finalizó espera y vuelve a READY.")
+                self.log_interrupt(f"Process {process.name} (PID {process.pid}) movido de NEW a READY.")
+                if self.architecture == "Modular":
+                    self.log_layer_flow("Planificador", "Proceso Core", f"ready:{process.pid}")
+                    self.log_layer_flow("Proceso Core", "Núcleo Base", f"sched:{process.pid}")
+            else:
+                break
+
+    def _update_waiting_processes(self) -> None:
+        # Solo los procesos cuyo despertar vence en este tick, en orden de pid
+        self._waiting_phase_tick = self.tick_count
+        for pid in self.wait_queue.pop_due(self.tick_count):
+            process = self.processes.get(pid)
+            if process is None or process.state != "WAITING":
+                continue
+            # Si terminamos de esperar por un Page Fault, tenemos que resolverlo (cargar página)
+            if process.interrupt_type == "PAGE_FAULT" and process.pending_fault_page is not None:
+                 if process.memory_unit_id is not None and 0 <= process.memory_unit_id < len(self.memory_units):
+                     unit = self.memory_units[process.memory_unit_id]
+                     success = unit.paged_manager.resolve_fault(process.pid, process.pending_fault_page, self.tick_count)
+                     if success:
+                         self.log_interrupt(f"Page Fault Resolved: Process {process.name} Page {process.pending_fault_page} Loaded.")
+                     else:
+                         self.log_interrupt(f"Page Fault Failed: No memory for Process {process.name}.")
+                         # Podríamos terminar el proceso si falla, pero reintentaremos luego
+                     # Víctima modificada o en TLB remotos: el proceso espera además
+                     # su escritura y la confirmación de los shootdowns
+                     writeback, shootdown = self._charge_eviction_costs(unit)
+                     if writeback or shootdown:
+                         process.pending_fault_page = None
+                         self._park_waiting(process, "WRITEBACK" if writeback else "SHOOTDOWN", writeback + shootdown)
+                         self.log_interrupt(f"Process {process.name} espera {writeback} ticks de write-back y {shootdown} de shootdown.")
+                         continue
+                         
+                 process.pending_fault_page = None
+
+            process.state = "READY"
+            process.io_remaining_ticks = 0
+            process.interrupt_type = None
+            idx = self._least_loaded_scheduler_index()
+            self.schedulers[idx].add_process(process)
+            self.log_interrupt(f"Process {process.name} finalizó espera y vuelve a READY.")
 
     def _run_cpus(self) -> None:
+        # Sorteos determinísticos del tick para todos los procesos en CPU, en lote
+        running = [cpu.process.pid for cpu in self.cpus if cpu.process is not None and cpu.process.state == "RUNNING"]
+        if running:
+            rnd = self.randomness
+            draws = dict(zip(running, zip(
+                rnd.probabilities(running, self.tick_count, "syscall"),
+                rnd.probabilities(running, self.tick_count, "io"),
+            )))
+        else:
+            draws = {}
+
         for cpu in self.cpus:
             process = cpu.process
             if process is None:
@@ -399,7 +591,7 @@ class SimulationEngine:
                 continue
 
             if process.has_error and process.state == "RUNNING":
-                error_prob = self._deterministic_probability(process.pid, self.tick_count, "error")
+                error_prob = self.randomness.probability(process.pid, self.tick_count, "error")
                 progress = 1.0 - (process.remaining_ticks / max(1, process.duration_ticks))
                 if progress >= 0.1 and error_prob < 0.10:
                     process.exit_code = -1
@@ -410,10 +602,10 @@ class SimulationEngine:
                     cpu.release()
                     continue
 
-            if self._evaluate_process_interrupts(process):
+            if self._evaluate_process_interrupts(process, draws.get(process.pid)):
                 continue
 
-            cpu.tick()
+            cpu.tick(self.rng)
             self.metrics.cpu_busy_ticks += max(1, cpu.threads_in_use)
             self.metrics.effective_cpu_ticks += max(1, cpu.threads_in_use)
 
@@ -430,10 +622,11 @@ class SimulationEngine:
 
             if self.scheduling_alg_name == "Priority":
                 sched = self.schedulers[cpu.id % len(self.schedulers)]
-                ready_queue = getattr(sched, "ready_queue", [])
-                if ready_queue:
-                    ready_queue.sort(key=lambda proc: proc.priority)
-                    highest = ready_queue[0]
+                if isinstance(sched, PriorityScheduler):
+                    highest = sched.ready_queue.peek()
+                else:
+                    highest = min(sched.ready_queue, key=lambda proc: proc.priority, default=None)
+                if highest is not None:
                     if highest.priority < process.priority:
                         self.preempt_process(process, "HIGHER_PRIORITY")
 
@@ -455,38 +648,67 @@ class SimulationEngine:
                 self.log_layer_flow("Proceso Core", "Núcleo Base", f"ctx_switch:{next_process.pid}")
 
     def _update_waiting_times(self) -> None:
-        for process in self.active_processes():
-            if process.state == "READY":
-                process.waiting_ticks += 1
+        store = self.processes.store
+        if store is not None:
+            store.increment_waiting_ticks("READY")
+            return
+        for process in self.processes.in_state("READY"):
+            process.waiting_ticks += 1
+
+    def _jitter_idle_cpu_usage(self) -> None:
+        # Fluctuación del uso de CPU de los procesos que no ejecutan. El sorteo es
+        # por (pid, tick), así que el almacén columnar lo aplica vectorizado y da
+        # el mismo resultado que el recorrido por objetos.
+        spread = self.idle_cpu_jitter
+        store = self.processes.store
+        if store is not None:
+            store.jitter_cpu_usage(self.randomness, self.tick_count, "cpu_jitter", spread, IDLE_JITTER_STATES)
+            return
+        idle = [p for state in IDLE_JITTER_STATES for p in self.processes.in_state(state)]
+        if not idle:
+            return
+        draws = self.randomness.probabilities([p.pid for p in idle], self.tick_count, "cpu_jitter")
+        for process, u in zip(idle, draws):
+            process.cpu_usage = max(0.0, min(100.0, process.cpu_usage + (u * (2 * spread) - spread)))
+
+    def _tick_processes_legacy(self) -> None:
+        # Orden de sorteos del modo "sha256": cada proceso activo, por pid, consume
+        # self.rng (los WAITING también fluctúan, como antes del modo por eventos)
+        rng = self.rng
+        for process in self.processes.active():
+            if process.state == "WAITING":
+                process.cpu_usage = max(0.0, min(100.0, process.cpu_usage + rng.uniform(-10, 10)))
+            else:
+                process.tick(rng)
 
-    def _evaluate_process_interrupts(self, process: Process) -> bool:
+    def _evaluate_process_interrupts(self, process: Process, draws: Optional[Tuple[float, float]] = None) -> bool:
         pid = process.pid
         if process.state != "RUNNING":
             return False
-        sys_prob = self._deterministic_probability(pid, self.tick_count, "syscall")
+        if draws is None:
+            draws = (
+                self.randomness.probability(pid, self.tick_count, "syscall"),
+                self.randomness.probability(pid, self.tick_count, "io"),
+            )
+        sys_prob, io_prob = draws
         if sys_prob < process.syscall_probability:
-            duration = self._deterministic_duration(pid, "syscall", 1, self.default_syscall_duration())
+            duration = self.randomness.duration(pid, "syscall", 1, self.default_syscall_duration())
             self.interrupt_controller.raise_interrupt(
                 Interrupt(InterruptType.SYSCALL, source="process", pid=pid, payload={"syscall_duration": duration})
             )
-            process.state = "WAITING"
-            process.interrupt_type = "SYSCALL"
-            process.io_remaining_ticks = duration
+            self._park_waiting(process, "SYSCALL", duration)
             if process.cpu_id is not None and 0 <= process.cpu_id < len(self.cpus):
                 self.cpus[process.cpu_id].release()
             self.log_interrupt(f"Process {process.name} ejecuta SYSCALL por {duration} ticks.")
             if self.architecture == "Modular":
                 self.log_layer_flow("Proceso Core", "Núcleo Base", f"syscall:{pid}")
             return True
-        io_prob = self._deterministic_probability(pid, self.tick_count, "io")
         if io_prob < process.io_probability:
-            duration = self._deterministic_duration(pid, "io", 2, self.default_io_duration() + 3)
+            duration = self.randomness.duration(pid, "io", 2, self.default_io_duration() + 3)
             self.interrupt_controller.raise_interrupt(
                 Interrupt(InterruptType.IO, source="process", pid=pid, payload={"io_duration": duration})
             )
-            process.state = "WAITING"
-            process.interrupt_type = "IO"
-            process.io_remaining_ticks = duration
+            self._park_waiting(process, "IO", duration)
             if process.cpu_id is not None and 0 <= process.cpu_id < len(self.cpus):
                 self.cpus[process.cpu_id].release()
             self.log_interrupt(f"Process {process.name} entra a I/O por {duration} ticks.")
@@ -496,8 +718,69 @@ class SimulationEngine:
         # Eliminado handling random de PAGE_FAULT aquí, ahora es "real" en tick loop por acceso a memoria
         return False
 
+    # Los eventos "ambientales" (llegadas, timer) se programan con saltos
+    # geométricos sacados del flujo determinístico (equivale a una prueba de
+    # Bernoulli por tick). No consumen self.rng, de modo que un tick ocioso no
+    # altera la ejecución y el modo por eventos conoce el próximo en O(1).
+    # En modo "sha256" son una prueba con self.rng por tick, como antes.
+    def _ambient_gap(self, salt: str, index: int, probability: float) -> Optional[int]:
+        if probability >= 1.0:
+            return 1
+        if probability <= 0.0:
+            return None
+        u = min(self.randomness.probability(0, index, salt), 1.0 - 1e-12)
+        return 1 + int(math.log1p(-u) / math.log1p(-probability))
+
+    def next_arrival_tick(self) -> Optional[int]:
+        """Tick de la próxima llegada automática (None si la probabilidad es 0)."""
+        if self._next_arrival_tick is None:
+            gap = self._ambient_gap("arrival", self._arrival_index, self.arrival_probability)
+            if gap is None:
+                return None
+            self._next_arrival_tick = self._last_arrival_tick + gap
+        return self._next_arrival_tick
+
+    def next_timer_tick(self) -> Optional[int]:
+        """Tick de la próxima interrupción de timer global."""
+        if self._next_timer_tick is None:
+            gap = self._ambient_gap("timer", self._timer_index, self.timer_interrupt_probability)
+            if gap is None:
+                return None
+            self._next_timer_tick = self._last_timer_tick + gap
+        return self._next_timer_tick
+
+    def _arrival_due(self, tick: int) -> bool:
+        if self._legacy_draw_order:
+            return self.rng.random() < self.arrival_probability
+        due = self.next_arrival_tick()
+        if due is None or tick < due:
+            return False
+        self._arrival_index += 1
+        self._last_arrival_tick = tick
+        self._next_arrival_tick = None
+        return True
+
+    def _timer_due(self, tick: int) -> bool:
+        if self._legacy_draw_order:
+            return self.rng.random() < self.timer_interrupt_probability
+        due = self.next_timer_tick()
+        if due is None or tick < due:
+            return False
+        self._timer_index += 1
+        self._last_timer_tick = tick
+        self._next_timer_tick = None
+        return True
+
+    def _reset_ambient_events(self) -> None:
+        self._arrival_index = 0
+        self._last_arrival_tick = 0
+        self._next_arrival_tick: Optional[int] = None
+        self._timer_index = 0
+        self._last_timer_tick = 0
+        self._next_timer_tick: Optional[int] = None
+
     def _maybe_raise_global_interrupts(self) -> None:
-        if random.random() < 0.02:
+        if self._timer_due(self.tick_count):
             self.interrupt_controller.raise_interrupt(
                 Interrupt(InterruptType.TIMER, source="timer", pid=None, payload={"reason": "timer"})
             )
@@ -509,7 +792,7 @@ class SimulationEngine:
         cpu_score = 1.0 - (process.cpu_usage / 100.0)
         priority_score = (size_score * 0.3) + (duration_score * 0.4) + (cpu_score * 0.3)
         priority = int(priority_score * 9)
-        priority += random.randint(-1, 1)
+        priority += self.rng.randint(-1, 1)
         return max(0, min(9, priority))
 
     def set_cpu_scheduler(self, index: int, name: str) -> None:
@@ -534,43 +817,25 @@ class SimulationEngine:
             self.cpus[index].thread_capacity = max(1, int(threads))
             self.log_interrupt(f"CPU {index}: hilos -> {self.cpus[index].thread_capacity}.")
 
-    def _memory_units_by_free_desc(self) -> List[int]:
-        freemap = []
-        for unit in self.memory_units:
-            used = sum(b.size for b in unit.manager.blocks if not b.free)
-            free = unit.manager.total_mb - used
-            freemap.append((unit.id, free))
-        freemap.sort(key=lambda t: t[1], reverse=True)
-        return [idx for idx, _ in freemap]
-
     def set_memory_unit_alloc_alg(self, index: int, name: str) -> None:
         if 0 <= index < len(self.memory_units):
             unit = self.memory_units[index]
             unit.alloc_alg = name
-            unit.manager = MemoryManager(
-                unit.total_mb,
-                unit.alloc_alg,
-                FirstFitStrategy() if name == "first" else BestFitStrategy() if name == "best" else WorstFitStrategy(),
-            )
+            unit.manager = self._create_memory_manager(unit.alloc_alg, unit.total_mb)
+            self.memory_placement.set_managers([u.manager for u in self.memory_units])
             self.log_interrupt(f"Unidad de memoria {index}: algoritmo de asignación -> {name}.")
 
     def set_memory_unit_page_alg(self, index: int, name: str) -> None:
         if 0 <= index < len(self.memory_units):
             unit = self.memory_units[index]
             unit.page_alg = name
-            unit.paged_manager = PagedMemoryManager(
-                unit.total_mb, 
-                page_size_mb=4, 
-                replacement_alg=unit.page_alg,
-                tlb_enabled=self.tlb_enabled, 
-                page_table_type=self.page_table_type
-            )
+            unit.paged_manager = self._create_paged_manager(unit.total_mb, unit.page_alg)
             self.log_interrupt(f"Unidad de memoria {index}: algoritmo de paginación -> {name}.")
 
     def memory_unit_summaries(self) -> List[Dict[str, object]]:
         out: List[Dict[str, object]] = []
         for unit in self.memory_units:
-            used = sum(b.size for b in unit.manager.blocks if not b.free)
+            used = unit.manager.used_mb()
             out.append(
                 {
                     "id": unit.id,
@@ -579,24 +844,41 @@ class SimulationEngine:
                     "system_reserved_mb": unit.manager.system_reserved_mb,
                     "fragmentation": unit.manager.fragmentation_ratio(),
                     "efficiency": unit.manager.efficiency(),
+                    "compactions": unit.manager.compactions,
+                    "compacted_mb": unit.manager.compacted_mb,
+                    "compaction_ticks": unit.manager.compaction_ticks,
                     "alloc_alg": unit.manager.algorithm,
                     "page_alg": unit.paged_manager.replacement_alg,
                     "page_faults": unit.paged_manager.page_faults,
                     "page_hits": unit.paged_manager.page_hits,
                     "fault_rate": unit.paged_manager.page_fault_rate(),
+                    "hit_ratio": unit.paged_manager.hit_ratio(),
+                    "evictions": unit.paged_manager.evictions,
+                    "writebacks": unit.paged_manager.writebacks,
+                    "writeback_stall_ticks": unit.paged_manager.writeback_stall_ticks,
+                    "shootdown_stall_ticks": unit.paged_manager.shootdown_stall_ticks,
+                    "page_walk_stall_ticks": unit.paged_manager.page_walk_stall_ticks,
                     "mem_util": unit.paged_manager.memory_utilization(),
                 }
             )
+            summary = out[-1]
+            summary["huge_page_faults"] = unit.paged_manager.huge_page_faults()
+            summary.update(unit.paged_manager.tlb_stats())
+            summary.update(unit.paged_manager.page_walk_stats())
+            evictions = unit.paged_manager.evictions
+            # Fracción de desalojos que obligaron a invalidar entradas de TLB
+            summary["tlb_shootdown_rate"] = summary["tlb_shootdowns"] / evictions if evictions else 0.0
         return out
 
     def storage_overview(self) -> Dict[str, float]:
         total_mb = sum(u.manager.total_mb for u in self.memory_units)
-        used_mb = sum(sum(b.size for b in u.manager.blocks if not b.free) for u in self.memory_units)
+        used_mb = sum(u.manager.used_mb() for u in self.memory_units)
         system_reserved = sum(u.manager.system_reserved_mb for u in self.memory_units)
         total_faults = sum(u.paged_manager.page_faults for u in self.memory_units)
         total_hits = sum(u.paged_manager.page_hits for u in self.memory_units)
         total_accesses = total_faults + total_hits
         fault_rate = (total_faults / total_accesses) if total_accesses > 0 else 0.0
+        hit_ratio = (total_hits / total_accesses) if total_accesses > 0 else 0.0
         avg_mem_util = 0.0
         if self.memory_units:
             avg_mem_util = sum(u.paged_manager.memory_utilization() for u in self.memory_units) / len(self.memory_units)
@@ -609,11 +891,15 @@ class SimulationEngine:
             "total_page_faults": total_faults,
             "total_hits": total_hits,
             "fault_rate": fault_rate,
+            "hit_ratio": hit_ratio,
             "avg_mem_util": avg_mem_util,
         }
 
     def active_processes(self) -> List[Process]:
-        return [p for p in self.processes.values() if p.state != "TERMINATED"]
+        return self.processes.active()
+
+    def active_process_count(self) -> int:
+        return self.processes.active_count()
 
     def manager_snapshots(self) -> Dict[str, List[MemoryBlock]]:
         data: Dict[str, List[MemoryBlock]] = {}
@@ -625,7 +911,7 @@ class SimulationEngine:
         stats: Dict[str, Dict[str, float]] = {}
         for unit in self.memory_units:
             stats[f"unit_{unit.id}"] = {
-                "success_rate": self.metrics.success_rate("first"),
+                "success_rate": self.metrics.success_rate(unit.manager.algorithm),
                 "fragmentation": unit.manager.fragmentation_ratio(),
                 "efficiency": unit.manager.efficiency(),
             }
@@ -639,12 +925,25 @@ class SimulationEngine:
                 "total_page_faults": pm.page_faults,
                 "total_hits": pm.page_hits,
                 "page_fault_rate": pm.page_fault_rate(),
+                "hit_ratio": pm.hit_ratio(),
+                "evictions": pm.evictions,
+                "writebacks": pm.writebacks,
+                "writeback_stall_ticks": pm.writeback_stall_ticks,
+                "huge_page_faults": pm.huge_page_faults(),
+                "page_walk_stall_ticks": pm.page_walk_stall_ticks,
+                "peak_page_table_slots": pm.page_walk_stats()["peak_page_table_slots"],
                 "memory_utilization": pm.memory_utilization(),
             }
         return stats
 
     def reset(self) -> None:
         self.processes.clear()
+        self.wait_queue.clear()
+        self._walk_refs.clear()
+        self._waiting_phase_tick = 0
+        self.rng = random.Random(self.seed)
+        self._pid_counter = itertools.count(1)
+        self._reset_ambient_events()
         self._layer_flow.clear()
         self.metrics = SimulationMetrics()
         self.tick_count = 0
@@ -666,19 +965,8 @@ class SimulationEngine:
                 system_reserved = min(base_sys_mb, self.memory_unit_capacity_mb)
             else:
                 system_reserved = 0
-            mgr = MemoryManager(
-                self.memory_unit_capacity_mb,
-                alloc_alg,
-                FirstFitStrategy() if alloc_alg == "first" else BestFitStrategy() if alloc_alg == "best" else WorstFitStrategy(),
-                system_reserved_mb=system_reserved
-            )
-            pm = PagedMemoryManager(
-                self.memory_unit_capacity_mb, 
-                page_size_mb=4, 
-                replacement_alg=page_alg,
-                tlb_enabled=self.tlb_enabled, 
-                page_table_type=self.page_table_type
-            )
+            mgr = self._create_memory_manager(alloc_alg, self.memory_unit_capacity_mb, system_reserved_mb=system_reserved)
+            pm = self._create_paged_manager(self.memory_unit_capacity_mb, page_alg)
             mu = SimpleNamespace(
                 id=i,
                 total_mb=self.memory_unit_capacity_mb,
@@ -690,6 +978,7 @@ class SimulationEngine:
             )
             new_units.append(mu)
         self.memory_units = new_units
+        self.memory_placement.set_managers([u.manager for u in self.memory_units])
         self.managers = {"first": self.memory_units[0].manager}
         self.paged_managers = {"FIFO": self.memory_units[0].paged_manager}
 
@@ -723,33 +1012,32 @@ class SimulationEngine:
             return None
         if offset_mb < 0:
             return None
-        page_size = 4 
-        page_number = offset_mb // page_size
+        page_number = offset_mb // self.page_size_mb
         
         for unit in self.memory_units:
-            # Use MMU translate to check result (non-intrusive, so usage stats don't increment?) 
-            # Translate modifies TLB, so it's intrusive.
-            # We want visual translation.
-            # Let's inspect Page Table directly via MMU.
+            # Se inspecciona la tabla de páginas directamente: traducir con la MMU
+            # tocaría el TLB y los contadores de la simulación.
             pm = unit.paged_manager
-            table = pm.mmu.get_process_table(pid)
-            if not table:
+            if not pm.mmu.get_process_table(pid):
                 continue
             
-            entry = table.get_entry(page_number)
+            entry, huge = pm.find_entry(pid, page_number)
             if not entry:
                 return "SWAPPED"
             
             if entry.valid and entry.frame_number is not None:
-                return f"FRAME_{entry.frame_number}"
+                return f"HUGE_FRAME_{entry.frame_number}" if huge else f"FRAME_{entry.frame_number}"
             return "SWAPPED"
         return "NO_TABLE"
 
-    def _update_system_reserved_memory(self):
-        active_count = len([p for p in self.processes.values() if p.state != "TERMINATED"])
+    def _required_system_reserved_mb(self) -> int:
+        active_count = self.processes.active_count()
         base_sys_mb = 64 
         per_proc_mb = 2
-        required = base_sys_mb + active_count * per_proc_mb
+        return base_sys_mb + active_count * per_proc_mb
+
+    def _update_system_reserved_memory(self):
+        required = self._required_system_reserved_mb()
         if self.memory_units:
             unit = self.memory_units[0]
             if unit.manager.expand_system_reserved(required):
@@ -771,20 +1059,3 @@ class SimulationEngine:
         del self.dynamic_modules[module_id]
         self.log_layer_flow("UI", "Núcleo Base", f"unload:{module_id}")
         return True
-
-    @staticmethod
-    def _deterministic_probability(pid: int, tick: int, salt: str) -> float:
-        key = f"{pid}-{tick}-{salt}"
-        h = hashlib.sha256(key.encode()).hexdigest()
-        x = int(h[:8], 16)
-        return x / 0xFFFFFFFF
-
-    @staticmethod
-    def _deterministic_duration(pid: int, salt: str, minimum: int, maximum: int) -> int:
-        minimum = max(1, minimum)
-        maximum = max(minimum, maximum)
-        key = f"{pid}-{salt}"
-        h = hashlib.sha256(key.encode()).hexdigest()
-        x = int(h[:8], 16)
-        span = maximum - minimum + 1
-        return minimum + (x % span)
@@ -0,0 +1,126 @@
+"""
+Modo de simulación por eventos discretos.
+
+EventDrivenEngine ejecuta exactamente los mismos ticks que SimulationEngine
+mientras haya trabajo (CPUs ocupadas, colas READY, procesos NEW, interrupciones
+pendientes). Cuando el sistema queda ocioso (solo procesos en WAITING y
+TERMINATED pendientes de limpieza) construye la lista de eventos futuros
+(fin de I/O/syscall, resolución de page faults, limpieza de terminados,
+compactación por intervalo, llegadas de procesos) y salta el reloj directamente
+al siguiente evento, aplicando en bloque el efecto de los ticks ociosos.
+
+Los ticks ociosos no consumen el generador aleatorio del motor (las llegadas y
+el timer dependen solo del tick), por lo que con la misma semilla el resultado
+es idéntico al del motor por ticks. Con determinism_mode="sha256" cada tick sí
+consume el generador, así que no se salta ninguno.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import List, Tuple
+
+from .engine import SimulationEngine
+
+# Tipos de evento de la lista de eventos futuros
+EVENT_WAKEUP = "WAKEUP"          # Fin de IO / SYSCALL / PAGE_FAULT
+EVENT_CLEANUP = "CLEANUP"        # Retiro de un proceso TERMINATED
+EVENT_COMPACTION = "COMPACTION"  # Compactación por intervalo
+EVENT_ARRIVAL = "ARRIVAL"        # Llegada de un proceso nuevo
+
+
+class EventDrivenEngine(SimulationEngine):
+    """SimulationEngine que salta los tramos ociosos hasta el siguiente evento."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.stepped_ticks = 0
+        self.skipped_ticks = 0
+
+    def run(self, ticks: int) -> None:
+        """Avanza `ticks` ticks simulados."""
+        self.run_until(self.tick_count + max(0, int(ticks)))
+
+    def run_until(self, target_tick: int) -> None:
+        while self.tick_count < target_tick:
+            if self._is_quiescent():
+                events = self._future_events()
+                next_tick = events[0][0] if events else target_tick + 1
+                if self._skip_idle(min(next_tick - 1, target_tick)) > 0:
+                    continue
+            self.tick()
+            self.stepped_ticks += 1
+
+    def _is_quiescent(self) -> bool:
+        """True si el próximo tick solo afectaría a contadores de espera."""
+        if self._legacy_draw_order:
+            # Modo "sha256": cada tick sortea llegada, timer y fluctuación con self.rng
+            return False
+        for cpu in self.cpus:
+            if cpu.process is not None:
+                return False
+        if self.interrupt_controller.has_pending():
+            return False
+        for sched in self.schedulers:
+            if self._scheduler_queue_length(sched):
+                return False
+        table = self.processes
+        if table.count("NEW") or table.count("READY") or table.count("RUNNING"):
+            return False
+        if self.memory_units:
+            required = min(self._required_system_reserved_mb(), self.memory_units[0].manager.total_mb)
+            if required > self.memory_units[0].manager.system_reserved_mb:
+                return False
+        for unit in self.memory_units:
+            mgr = unit.manager
+            if mgr.compaction_in_progress():
+                return False
+            if mgr.auto_compact and mgr.compaction_pressure() >= mgr.compact_threshold:
+                return False
+        return True
+
+    def _future_events(self) -> List[Tuple[int, int, str, int]]:
+        """Lista de eventos futuros (tick absoluto, desempate, tipo, pid/unidad) como heap."""
+        now = self.tick_count
+        events: List[Tuple[int, int, str, int]] = []
+        wake = self.wait_queue.next_wake()
+        if wake is not None:
+            events.append((max(now + 1, wake), 0, EVENT_WAKEUP, 0))
+        for process in self.processes.in_state("TERMINATED"):
+            if process.finish_tick is None:
+                due = now + 1
+            else:
+                due = max(now + 1, process.finish_tick + self.terminated_cleanup_delay + 1)
+            events.append((due, process.pid, EVENT_CLEANUP, process.pid))
+        for unit in self.memory_units:
+            mgr = unit.manager
+            if mgr.auto_compact and mgr.compaction_pressure() > 0.1:
+                due = now + max(1, mgr.compact_interval - mgr.ticks_since_compact)
+                events.append((due, -1, EVENT_COMPACTION, unit.id))
+        if self.auto_create_processes:
+            arrival = self.next_arrival_tick()
+            if arrival is not None:
+                events.append((max(now + 1, arrival), 0, EVENT_ARRIVAL, 0))
+        heapq.heapify(events)
+        return events
+
+    def _skip_idle(self, end: int) -> int:
+        """Aplica en bloque los ticks ociosos (tick_count, end]. Retorna cuántos se saltaron."""
+        span = end - self.tick_count
+        if span <= 0:
+            return 0
+        for unit in self.memory_units:
+            if unit.manager.auto_compact:
+                unit.manager.ticks_since_compact += span
+        # Las interrupciones de timer solo registran eventos; se reproducen en su tick
+        timer = self.next_timer_tick()
+        while timer is not None and timer <= end:
+            self.tick_count = max(timer, self.tick_count)
+            self._maybe_raise_global_interrupts()
+            self.arch.process_pending_interrupts(self, self.tick_count)
+            timer = self.next_timer_tick()
+
+        # Los despertares están en ticks absolutos (wait_queue): no hay contadores que descontar
+        self._waiting_phase_tick = end
+        self.tick_count = end
+        self.skipped_ticks += span
+        return span
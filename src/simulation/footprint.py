@@ -0,0 +1,92 @@
+"""
+Medición de memoria de los modelos del simulador.
+
+Crea N instancias de cada modelo "caliente" (Process, CPU, MemoryBlock, Page,
+PageTableEntry, TLBEntry, Interrupt) y reporta los bytes por instancia según
+`tracemalloc`, incluidos los objetos que cada instancia crea (diccionario de
+atributos, registros, payload...). Sirve para comparar el costo por proceso y
+por entrada de tabla de páginas entre versiones de los modelos.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from ..os_core.interrupts import Interrupt, InterruptType
+from ..os_core.memory.mmu import TLBEntry
+from ..os_core.models import CPU, MemoryBlock, Page, PageTableEntry, Process
+
+
+def _new_running_process(i: int) -> Process:
+    # Un proceso que ya ejecutó tiene sus registros materializados
+    process = Process(name=f"P{i}", size_mb=32, pid=i)
+    process.registers["AX"] = i & 0xFFFF
+    return process
+
+
+# Nombre -> fábrica de una instancia (recibe el índice de la instancia)
+FACTORIES: Dict[str, Callable[[int], object]] = {
+    "Process": lambda i: Process(name=f"P{i}", size_mb=32, pid=i),
+    "Process (con registros)": _new_running_process,
+    "CPU": lambda i: CPU(id=i),
+    "MemoryBlock": lambda i: MemoryBlock(i, i + 4, i),
+    "Page": lambda i: Page(frame_number=i),
+    "PageTableEntry": lambda i: PageTableEntry(page_number=i, frame_number=i, valid=True),
+    "TLBEntry": lambda i: TLBEntry(page_number=i, frame_number=i, pid=1),
+    "Interrupt": lambda i: Interrupt(InterruptType.IO, "CPU", pid=i),
+}
+
+
+def bytes_per_instance(factory: Callable[[int], object], count: int) -> float:
+    """Bytes asignados por instancia al crear `count` instancias."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        # La lista de resultados se crea antes de medir para no contarla
+        objects: List[object] = [None] * count
+        before = tracemalloc.get_traced_memory()[0]
+        for i in range(count):
+            objects[i] = factory(i)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del objects
+    return (after - before) / max(1, count)
+
+
+def measure(count: int = 10000) -> Dict[str, float]:
+    """Bytes por instancia de cada modelo."""
+    return {name: bytes_per_instance(factory, count) for name, factory in FACTORIES.items()}
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Mide los bytes por instancia de los modelos del simulador (tracemalloc).",
+    )
+    parser.add_argument("-n", "--count", type=int, default=10000, help="Instancias por modelo (default: 10000).")
+    parser.add_argument("-o", "--output", default=None, help="Archivo JSON donde escribir los resultados.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    if args.count <= 0:
+        print("El número de instancias debe ser > 0.", file=sys.stderr)
+        return 2
+    results = measure(args.count)
+    width = max(len(name) for name in results)
+    for name, size in results.items():
+        print(f"{name:<{width}}  {size:8.1f} bytes/instancia")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump({"count": args.count, "bytes_per_instance": results}, fh, indent=2)
+        print(f"Resultados escritos en {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
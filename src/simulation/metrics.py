@@ -1,13 +1,18 @@
-from typing import Dict
-from ..os_core.memory.manager import AllocationResult
+from typing import Dict, Sequence
+from ..os_core.memory.manager import ALLOCATION_ALGORITHMS, AllocationResult
 from ..os_core.models import Process
 
 class SimulationMetrics:
     def __init__(self):
-        self.alloc_attempts: Dict[str, int] = {"first":0, "best":0, "worst":0}
-        self.alloc_success: Dict[str, int] = {"first":0, "best":0, "worst":0}
-        self.fragmentation: Dict[str, float] = {"first":0.0, "best":0.0, "worst":0.0}
-        self.efficiency: Dict[str, float] = {"first":0.0, "best":0.0, "worst":0.0}
+        self.alloc_attempts: Dict[str, int] = {alg: 0 for alg in ALLOCATION_ALGORITHMS}
+        self.alloc_success: Dict[str, int] = {alg: 0 for alg in ALLOCATION_ALGORITHMS}
+        self.fragmentation: Dict[str, float] = {alg: 0.0 for alg in ALLOCATION_ALGORITHMS}
+        self.efficiency: Dict[str, float] = {alg: 0.0 for alg in ALLOCATION_ALGORITHMS}
+        # Fragmentación interna (redondeo de bloques); 0 salvo en buddy y slab
+        self.internal_fragmentation: Dict[str, float] = {alg: 0.0 for alg in ALLOCATION_ALGORITHMS}
+        # Aciertos / fallos de las cachés por clase (solo slab)
+        self.cache_hits: Dict[str, int] = {alg: 0 for alg in ALLOCATION_ALGORITHMS}
+        self.cache_misses: Dict[str, int] = {alg: 0 for alg in ALLOCATION_ALGORITHMS}
         
         # Process metrics
         self.total_processes = 0
@@ -17,6 +22,14 @@ class SimulationMetrics:
         self.cpu_busy_ticks = 0
         # Effective ticks considering multithreading acceleration
         self.effective_cpu_ticks = 0
+        # Ticks que procesos en ejecución estuvieron detenidos copiando su bloque (compactación)
+        self.relocation_stall_ticks = 0
+        # Ticks de escritura al almacenamiento de páginas modificadas desalojadas
+        self.writeback_stall_ticks = 0
+        # Ticks de espera por IPIs de shootdown de TLB al desalojar páginas
+        self.shootdown_stall_ticks = 0
+        # Ticks de recorridos de tabla de páginas por fallos de TLB
+        self.page_walk_stall_ticks = 0
 
     def update(self, result: AllocationResult):
         alg = result.algorithm
@@ -26,6 +39,12 @@ class SimulationMetrics:
         # moving average simple
         self.fragmentation[alg] = (self.fragmentation[alg]*0.9) + (result.fragmentation*0.1)
         self.efficiency[alg] = (self.efficiency[alg]*0.9) + (result.efficiency*0.1)
+        self.internal_fragmentation[alg] = (self.internal_fragmentation[alg]*0.9) + (result.internal_fragmentation*0.1)
+        if result.cache_hit is not None and result.success:
+            if result.cache_hit:
+                self.cache_hits[alg] += 1
+            else:
+                self.cache_misses[alg] += 1
         
     def record_process_completion(self, p: Process, current_tick: int):
         self.completed_processes += 1
@@ -50,3 +69,36 @@ class SimulationMetrics:
     def average_waiting_time(self) -> float:
         if self.completed_processes == 0: return 0.0
         return self.total_waiting_time / self.completed_processes
+
+    def cpu_utilization(self, total_ticks: int, cpus: Sequence) -> float:
+        """Fracción de capacidad de CPU (ticks x CPUs x hilos) efectivamente usada."""
+        if total_ticks == 0 or not cpus:
+            return 0.0
+        capacity = total_ticks * len(cpus) * cpus[0].thread_capacity
+        return self.cpu_busy_ticks / capacity if capacity > 0 else 0.0
+
+    def summary(self, total_ticks: int, cpus: Sequence = ()) -> Dict[str, object]:
+        """Vista plana de las métricas, apta para JSON/CSV."""
+        return {
+            "total_ticks": total_ticks,
+            "total_processes": self.total_processes,
+            "completed_processes": self.completed_processes,
+            "throughput": self.throughput(total_ticks),
+            "average_turnaround_time": self.average_turnaround_time(),
+            "average_waiting_time": self.average_waiting_time(),
+            "cpu_busy_ticks": self.cpu_busy_ticks,
+            "effective_cpu_ticks": self.effective_cpu_ticks,
+            "cpu_utilization": self.cpu_utilization(total_ticks, cpus),
+            "relocation_stall_ticks": self.relocation_stall_ticks,
+            "writeback_stall_ticks": self.writeback_stall_ticks,
+            "shootdown_stall_ticks": self.shootdown_stall_ticks,
+            "page_walk_stall_ticks": self.page_walk_stall_ticks,
+            "alloc_attempts": dict(self.alloc_attempts),
+            "alloc_success": dict(self.alloc_success),
+            "alloc_success_rate": {alg: self.success_rate(alg) for alg in self.alloc_attempts},
+            "fragmentation": dict(self.fragmentation),
+            "efficiency": dict(self.efficiency),
+            "internal_fragmentation": dict(self.internal_fragmentation),
+            "cache_hits": dict(self.cache_hits),
+            "cache_misses": dict(self.cache_misses),
+        }
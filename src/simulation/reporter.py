@@ -116,7 +116,7 @@ class SimulationReporter:
         self.elements.append(Paragraph("<b>Memoria:</b>", self.styles['Heading3']))
         mem_data = [["Unidad", "Usado (MB)", "Libre (MB)", "Fragmentación", "Page Faults", "Page Hits"]]
         for unit in self.engine.memory_units:
-            used = sum(b.size for b in unit.manager.blocks if not b.free)
+            used = unit.manager.used_mb()
             free = unit.total_mb - used
             frag = unit.manager.fragmentation_ratio() * 100
             faults = unit.paged_manager.page_faults
@@ -0,0 +1,214 @@
+"""
+Barrido de parámetros (planificador x asignación x paginación x almacenamiento).
+
+Reparte instancias independientes de SimulationEngine en un pool de
+`multiprocessing` y fusiona las filas resultantes en un único archivo
+columnar (JSON por columnas o CSV). Todas las configuraciones corren la misma
+carga: la repetición r usa la semilla `--seed + r` en cada configuración, así
+las diferencias entre filas se deben a la configuración y no al azar.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .batch import engine_from_config, run_ticks
+
+
+SCHEDULERS: List[str] = ["FCFS", "SJF", "SRTF", "RR", "Priority", "PriorityRR"]
+ALLOCATORS: List[str] = ["first", "best", "worst", "buddy", "slab"]
+PAGERS: List[str] = ["FIFO", "LRU", "Optimal", "Clock", "SecondChance", "NRU", "LFU", "ARC", "WSClock"]
+STORAGES: List[str] = ["HDD", "SSD", "NVMe", "Tape"]
+
+
+@dataclass
+class SweepPoint:
+    """Una configuración del barrido con su semilla."""
+    index: int
+    seed: int
+    repeat: int = 0
+    config: Dict[str, Any] = field(default_factory=dict)
+
+
+def build_grid(
+    schedulers: Sequence[str] = SCHEDULERS,
+    allocators: Sequence[str] = ALLOCATORS,
+    pagers: Sequence[str] = PAGERS,
+    storages: Sequence[str] = STORAGES,
+    base_config: Optional[Dict[str, Any]] = None,
+    base_seed: int = 0,
+    repeats: int = 1,
+) -> List[SweepPoint]:
+    """Producto cartesiano de las opciones x `repeats` repeticiones.
+
+    La repetición r usa la semilla base_seed + r en todas las configuraciones.
+    """
+    base = dict(base_config or {})
+    points: List[SweepPoint] = []
+    combos = itertools.product(schedulers, allocators, pagers, storages, range(max(1, repeats)))
+    for index, (sched, alloc, pager, storage, repeat) in enumerate(combos):
+        config = dict(base)
+        config.update(
+            scheduling_alg=sched,
+            allocation_algorithm=alloc,
+            paging_algorithm=pager,
+            storage_type=storage,
+        )
+        points.append(SweepPoint(index=index, seed=base_seed + repeat, repeat=repeat, config=config))
+    return points
+
+
+def run_point(point: SweepPoint, ticks: int) -> Dict[str, Any]:
+    """Ejecuta una configuración y devuelve una fila plana de resultados."""
+    config = dict(point.config)
+    config["seed"] = point.seed
+    engine = engine_from_config(config)
+    elapsed = run_ticks(engine, ticks)
+
+    alg = engine.memory_units[0].alloc_alg if engine.memory_units else "first"
+    summary = engine.metrics.summary(engine.tick_count, engine.cpus)
+    storage = engine.storage_overview()
+    units = engine.memory_unit_summaries()
+    n_units = max(1, len(units))
+
+    row: Dict[str, Any] = {
+        "index": point.index,
+        "seed": point.seed,
+        "repeat": point.repeat,
+        "scheduling_alg": engine.scheduling_alg_name,
+        "allocation_algorithm": alg,
+        "paging_algorithm": engine.memory_units[0].page_alg if engine.memory_units else None,
+        "storage_type": engine.storage_type,
+        "num_cpus": len(engine.cpus),
+        "num_memory_units": engine.num_memory_units,
+        "ticks": ticks,
+        "wall_seconds": elapsed,
+        "ticks_per_second": ticks / elapsed if elapsed > 0 else 0.0,
+    }
+    for key, value in summary.items():
+        if not isinstance(value, dict):
+            row[key] = value
+    row["alloc_attempts"] = summary["alloc_attempts"].get(alg, 0)
+    row["alloc_success_rate"] = summary["alloc_success_rate"].get(alg, 0.0)
+    row["alloc_fragmentation_avg"] = summary["fragmentation"].get(alg, 0.0)
+    row["alloc_efficiency_avg"] = summary["efficiency"].get(alg, 0.0)
+    row["alloc_internal_fragmentation_avg"] = summary["internal_fragmentation"].get(alg, 0.0)
+    row["mem_used_mb"] = storage["used_mb"]
+    row["mem_total_mb"] = storage["total_mb"]
+    row["mem_fragmentation"] = sum(u["fragmentation"] for u in units) / n_units
+    row["mem_efficiency"] = sum(u["efficiency"] for u in units) / n_units
+    row["compactions"] = sum(u["compactions"] for u in units)
+    row["compacted_mb"] = sum(u["compacted_mb"] for u in units)
+    row["compaction_ticks"] = sum(u["compaction_ticks"] for u in units)
+    row["relocation_stall_ticks"] = summary["relocation_stall_ticks"]
+    row["page_faults"] = storage["total_page_faults"]
+    row["page_hits"] = storage["total_hits"]
+    row["page_fault_rate"] = storage["fault_rate"]
+    row["page_hit_ratio"] = storage["hit_ratio"]
+    row["page_evictions"] = sum(u["evictions"] for u in units)
+    row["page_writebacks"] = sum(u["writebacks"] for u in units)
+    tlb_lookups = sum(u["tlb_hits"] + u["tlb_misses"] for u in units)
+    row["tlb_hit_rate"] = sum(u["tlb_hits"] for u in units) / tlb_lookups if tlb_lookups else 0.0
+    row["tlb_shootdowns"] = sum(u["tlb_shootdowns"] for u in units)
+    row["huge_page_faults"] = sum(u["huge_page_faults"] for u in units)
+    row["peak_page_table_slots"] = sum(u["peak_page_table_slots"] for u in units)
+    row["page_mem_util"] = storage["avg_mem_util"]
+    return row
+
+
+def _run_point_star(args) -> Dict[str, Any]:
+    return run_point(*args)
+
+
+def run_sweep(
+    points: Iterable[SweepPoint],
+    ticks: int,
+    workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[Dict[str, Any]]:
+    """Ejecuta todos los puntos en un pool de procesos. Filas ordenadas por índice."""
+    tasks = [(p, ticks) for p in points]
+    if not tasks:
+        return []
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(tasks)))
+    if workers == 1:
+        rows = [_run_point_star(t) for t in tasks]
+    else:
+        with multiprocessing.Pool(processes=workers) as pool:
+            rows = list(pool.imap_unordered(_run_point_star, tasks, chunksize=chunksize))
+    rows.sort(key=lambda r: r["index"])
+    return rows
+
+
+def to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Convierte filas en un diccionario columna -> lista de valores."""
+    columns: List[str] = []
+    for row in rows:
+        for key in row:
+            if key not in columns:
+                columns.append(key)
+    return {col: [row.get(col) for row in rows] for col in columns}
+
+
+def write_results(rows: List[Dict[str, Any]], path: str) -> None:
+    """Escribe los resultados en formato columnar: CSV si la extensión es .csv, si no JSON."""
+    data = to_columns(rows)
+    if path.lower().endswith(".csv"):
+        with open(path, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(list(data.keys()))
+            writer.writerows(zip(*data.values()))
+    else:
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"rows": len(rows), "columns": data}, fh, ensure_ascii=False)
+
+
+def _csv_list(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Barrido de configuraciones del simulador en paralelo.")
+    parser.add_argument("-n", "--ticks", type=int, default=10000, help="Ticks por configuración.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Procesos del pool (default: núcleos disponibles).")
+    parser.add_argument("-o", "--output", default="sweep_results.json", help="Archivo de resultados (.json columnar o .csv).")
+    parser.add_argument("--base-config", default=None, help="JSON con parámetros comunes (CPUs, memoria, etc.).")
+    parser.add_argument("--seed", type=int, default=0, help="Semilla base; la repetición r usa seed + r en todas las configuraciones.")
+    parser.add_argument("--repeats", type=int, default=1, help="Repeticiones por configuración, con semillas compartidas entre configuraciones.")
+    parser.add_argument("--schedulers", type=_csv_list, default=SCHEDULERS)
+    parser.add_argument("--allocators", type=_csv_list, default=ALLOCATORS)
+    parser.add_argument("--pagers", type=_csv_list, default=PAGERS)
+    parser.add_argument("--storages", type=_csv_list, default=STORAGES)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_arg_parser().parse_args(argv)
+    base_config: Dict[str, Any] = {}
+    if args.base_config:
+        with open(args.base_config, "r", encoding="utf-8") as fh:
+            base_config = json.load(fh)
+
+    points = build_grid(args.schedulers, args.allocators, args.pagers, args.storages, base_config, args.seed, args.repeats)
+    print(f"Barrido: {len(points)} configuraciones x {args.ticks} ticks", file=sys.stderr)
+    start = time.perf_counter()
+    rows = run_sweep(points, args.ticks, workers=args.workers)
+    elapsed = time.perf_counter() - start
+    write_results(rows, args.output)
+    total_ticks = args.ticks * len(rows)
+    rate = total_ticks / elapsed if elapsed > 0 else 0.0
+    print(f"{len(rows)} configuraciones en {elapsed:.2f} s ({rate:,.0f} ticks/s agregados) -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())